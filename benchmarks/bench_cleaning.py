@@ -0,0 +1,84 @@
+"""
+Benchmark: fused cleaning kernel vs. chained pandas calls.
+
+Compares `transform_api` / `transform_bot` (built on `clean_frame`) against the
+previous implementations that chained `drop_duplicates()`, `dropna()` and
+`fillna()` on a wide, object-heavy frame.
+
+Usage:
+    python -m benchmarks.bench_cleaning --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.api.transform.api_transform import transform_api
+from src.bot.transform.bot_transform import transform_bot
+
+
+def legacy_transform_api(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous API cleaning: drop_duplicates followed by dropna."""
+    return df.drop_duplicates().dropna(subset=["API", "Description"])
+
+
+def legacy_transform_bot(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous bot cleaning: drop_duplicates followed by a full-frame fillna."""
+    return df.drop_duplicates().fillna("N/A")
+
+
+def make_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Build a frame with ~20% duplicated rows and ~5% nulls in the text columns."""
+    rng = np.random.default_rng(seed)
+    unique_rows = int(rows * 0.8)
+    base = pd.DataFrame(
+        {
+            "API": [f"api_{i}" for i in range(unique_rows)],
+            "Description": [f"description {i % 5000}" for i in range(unique_rows)],
+            "Category": rng.choice(["Animals", "Finance", "Games", "Weather"], unique_rows),
+            "Auth": rng.choice(["apiKey", "OAuth", ""], unique_rows),
+            "HTTPS": rng.random(unique_rows) > 0.1,
+            "Score": rng.random(unique_rows),
+        }
+    )
+    df = pd.concat([base, base.sample(rows - unique_rows, random_state=seed)], ignore_index=True)
+    for col in ("Description", "Auth", "Score"):
+        df.loc[rng.random(rows) < 0.05, col] = None
+    return df
+
+
+def best_of(func, df: pd.DataFrame, repeat: int) -> float:
+    """Return the best wall time of `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    df = make_frame(args.rows)
+    print(f"rows={args.rows:,}")
+
+    for label, legacy, fused in (
+        ("transform_api", legacy_transform_api, transform_api),
+        ("transform_bot", legacy_transform_bot, transform_bot),
+    ):
+        assert len(legacy(df)) == len(fused(df))
+        legacy_s = best_of(legacy, df, args.repeat)
+        fused_s = best_of(fused, df, args.repeat)
+        print(f"{label:<14} legacy={legacy_s:.3f}s fused={fused_s:.3f}s speedup={legacy_s / fused_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
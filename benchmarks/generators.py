@@ -0,0 +1,118 @@
+"""
+Synthetic data generators for the benchmarks.
+
+Frames are shaped like the real sources:
+    - API frames follow the public APIs payload (API, Description, Auth, HTTPS, Cors, Link, Category).
+    - Bot frames follow a typical RPA export (ids, timestamps, statuses, amounts, free text).
+
+A fraction of rows is duplicated and a fraction of cells is nulled, both
+configurable, so the cleaning steps have realistic work to do. Generation is
+vectorized and seeded, so repeated runs produce identical data.
+"""
+
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = ["Animals", "Finance", "Games", "Weather", "Health", "Music", "Sports", "Transport"]
+AUTH_TYPES = ["apiKey", "OAuth", "X-Mashape-Key", ""]
+STATUSES = ["done", "failed", "pending", "retried"]
+
+
+def _with_duplicates_and_nulls(
+    base: pd.DataFrame, rows: int, duplicate_ratio: float, null_ratio: float, nullable: list, seed: int
+) -> pd.DataFrame:
+    """Append duplicated rows to reach `rows`, then null a share of the cells of the nullable columns."""
+    rng = np.random.default_rng(seed + 1)
+    duplicates = rows - len(base)
+    if duplicates > 0:
+        base = pd.concat([base, base.sample(duplicates, replace=duplicates > len(base), random_state=seed)])
+    df = base.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+    for col in nullable:
+        df.loc[rng.random(rows) < null_ratio, col] = None
+    return df
+
+
+def make_api_frame(
+    rows: int, duplicate_ratio: float = 0.2, null_ratio: float = 0.05, seed: int = 42
+) -> pd.DataFrame:
+    """
+    Build an API-shaped frame.
+
+    Args:
+        rows (int): Number of rows.
+        duplicate_ratio (float): Share of rows that duplicate another row. Defaults to 0.2.
+        null_ratio (float): Share of nulls in the nullable columns. Defaults to 0.05.
+        seed (int): Random seed. Defaults to 42.
+
+    Returns:
+        pd.DataFrame: The generated frame.
+    """
+    rng = np.random.default_rng(seed)
+    unique_rows = max(1, int(rows * (1 - duplicate_ratio)))
+    ids = np.arange(unique_rows)
+    base = pd.DataFrame(
+        {
+            "API": pd.Series(ids).map("api_{}".format),
+            "Description": pd.Series(ids % 5000).map("Description of service {}".format),
+            "Auth": rng.choice(AUTH_TYPES, unique_rows),
+            "HTTPS": rng.random(unique_rows) > 0.1,
+            "Cors": rng.choice(["yes", "no", "unknown"], unique_rows),
+            "Link": pd.Series(ids).map("https://example.com/api/{}".format),
+            "Category": rng.choice(CATEGORIES, unique_rows),
+        }
+    )
+    return _with_duplicates_and_nulls(base, rows, duplicate_ratio, null_ratio, ["Description", "Auth", "Cors"], seed)
+
+
+def make_bot_frame(
+    rows: int, duplicate_ratio: float = 0.2, null_ratio: float = 0.05, seed: int = 42
+) -> pd.DataFrame:
+    """
+    Build a bot-shaped frame.
+
+    Args:
+        rows (int): Number of rows.
+        duplicate_ratio (float): Share of rows that duplicate another row. Defaults to 0.2.
+        null_ratio (float): Share of nulls in the nullable columns. Defaults to 0.05.
+        seed (int): Random seed. Defaults to 42.
+
+    Returns:
+        pd.DataFrame: The generated frame.
+    """
+    rng = np.random.default_rng(seed)
+    unique_rows = max(1, int(rows * (1 - duplicate_ratio)))
+    ids = np.arange(unique_rows)
+    base = pd.DataFrame(
+        {
+            "id": ids,
+            "processed_at": pd.Timestamp("2025-01-01") + pd.to_timedelta(ids * 37, unit="s"),
+            "status": rng.choice(STATUSES, unique_rows),
+            "amount": np.round(rng.gamma(2.0, 150.0, unique_rows), 2),
+            "customer": pd.Series(rng.integers(0, 20000, unique_rows)).map("customer_{:05d}".format),
+            "notes": pd.Series(ids % 997).map("Processed by robot, batch {}".format),
+        }
+    )
+    return _with_duplicates_and_nulls(base, rows, duplicate_ratio, null_ratio, ["status", "customer", "notes"], seed)
+
+
+def write_bot_file(df: pd.DataFrame, path: Union[str, Path]) -> Path:
+    """
+    Write a bot frame as .xlsx or .csv, depending on the file suffix.
+
+    Args:
+        df (pd.DataFrame): Frame to write.
+        path (Union[str, Path]): Target path ending in .xlsx or .csv.
+
+    Returns:
+        Path: The written path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False)
+    return path
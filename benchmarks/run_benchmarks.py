@@ -0,0 +1,190 @@
+"""
+Benchmark suite: throughput of every ETL stage on synthetic data.
+
+Cases:
+    transform_api, transform_bot      cleaning of generated API / bot frames
+    extract_bot_csv, extract_bot_xlsx bot extraction from generated files (xlsx without the parse cache)
+    extract_bot_xlsx_cached           bot extraction served from the Parquet parse cache
+    save_api, save_bot                savers loading into an embedded backend (--backend sqlite|duckdb)
+
+Results are written as JSON (one file per commit by default) so that runs can
+be compared between commits with --compare.
+
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 10000 100000 1000000
+    python -m benchmarks.run_benchmarks --cases transform_api save_api --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+from loguru import logger
+
+from benchmarks.generators import make_api_frame, make_bot_frame, write_bot_file
+from src.api.saver.api_saver import save_api
+from src.api.transform.api_transform import transform_api
+from src.bot.extract.bot_extract import extract_bot
+from src.bot.extract.excel_cache import ExcelCache
+from src.bot.saver.bot_saver import save_bot
+from src.bot.transform.bot_transform import transform_bot
+from src.db.backends import CONNECTORS
+
+CASES = (
+    "transform_api",
+    "transform_bot",
+    "extract_bot_csv",
+    "extract_bot_xlsx",
+    "extract_bot_xlsx_cached",
+    "save_api",
+    "save_bot",
+)
+RESULTS_DIR = Path(__file__).parent / "results"
+REGRESSION_THRESHOLD = 0.10
+
+
+def git_commit() -> str:
+    """Return the short hash of HEAD, or "unknown" outside a git checkout."""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def time_case(func: Callable[[], object], repeat: int) -> List[float]:
+    """Return the wall times of `repeat` runs of `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def build_case(
+    case: str, rows: int, work_dir: Path, duplicate_ratio: float, null_ratio: float, backend: str = "sqlite"
+) -> Callable[[], object]:
+    """Generate the input data of a case and return the callable to time."""
+    if case == "transform_api":
+        df = make_api_frame(rows, duplicate_ratio, null_ratio)
+        return lambda: transform_api(df)
+    if case == "transform_bot":
+        df = make_bot_frame(rows, duplicate_ratio, null_ratio)
+        return lambda: transform_bot(df)
+    if case.startswith("extract_bot"):
+        suffix = ".csv" if case == "extract_bot_csv" else ".xlsx"
+        path = write_bot_file(
+            make_bot_frame(rows, duplicate_ratio, null_ratio), work_dir / f"{case}_{rows}" / f"bot{suffix}"
+        )
+        if case == "extract_bot_csv":
+            # CSVs are only read through the directory / glob path of extract_bot
+            return lambda: extract_bot(str(path.parent / "*.csv"), max_workers=1)
+        if case == "extract_bot_xlsx":
+            return lambda: extract_bot(str(path), use_cache=False)
+        cache = ExcelCache(cache_dir=str(work_dir / "excel_cache"))
+        extract_bot(str(path), cache=cache)  # warm the cache
+        return lambda: extract_bot(str(path), cache=cache)
+    if case in ("save_api", "save_bot"):
+        make_frame, save = (make_api_frame, save_api) if case == "save_api" else (make_bot_frame, save_bot)
+        df = make_frame(rows, duplicate_ratio, null_ratio)
+        connector = CONNECTORS[backend](":memory:")
+        connector.connect()
+        return lambda: save(df, connector, table_name=f"bench_{case}")
+    raise ValueError(f"Unknown case '{case}'. Expected one of {CASES}.")
+
+
+def compare(results: List[Dict], baseline_path: Path) -> bool:
+    """
+    Print the change of every case against a baseline result file.
+
+    Returns:
+        bool: True if any case is slower than the baseline by more than the regression threshold.
+    """
+    baseline = {
+        (entry["case"], entry["rows"]): entry for entry in json.loads(baseline_path.read_text())["results"]
+    }
+    regressed = False
+    print(f"\nComparison with {baseline_path}:")
+    for entry in results:
+        base = baseline.get((entry["case"], entry["rows"]))
+        if not base:
+            continue
+        change = entry["best_s"] / base["best_s"] - 1
+        flag = "REGRESSION" if change > REGRESSION_THRESHOLD else ""
+        regressed = regressed or bool(flag)
+        print(f"  {entry['case']:<24} {entry['rows']:>9,} rows  {base['best_s']:.3f}s -> {entry['best_s']:.3f}s  {change:+.1%} {flag}")
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--null-ratio", type=float, default=0.05)
+    parser.add_argument("--backend", choices=sorted(CONNECTORS), default="sqlite", help="database of the save cases")
+    parser.add_argument("--max-excel-rows", type=int, default=100_000, help="skip xlsx cases above this size (writing xlsx is slow)")
+    parser.add_argument("--output", type=Path, help="result file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="baseline result file to compare against")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="etl-bench-") as tmp:
+        for case in args.cases:
+            for rows in args.sizes:
+                if "xlsx" in case and rows > args.max_excel_rows:
+                    print(f"{case:<24} {rows:>9,} rows  skipped (--max-excel-rows {args.max_excel_rows:,})")
+                    continue
+                func = build_case(case, rows, Path(tmp), args.duplicate_ratio, args.null_ratio, args.backend)
+                timings = time_case(func, args.repeat)
+                best = min(timings)
+                results.append(
+                    {
+                        "case": case,
+                        "rows": rows,
+                        "repeat": args.repeat,
+                        "best_s": best,
+                        "median_s": statistics.median(timings),
+                        "rows_per_sec": rows / best if best > 0 else None,
+                    }
+                )
+                print(f"{case:<24} {rows:>9,} rows  best={best:.3f}s  {rows / best:>12,.0f} rows/s")
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "meta": {
+            "commit": commit,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "duplicate_ratio": args.duplicate_ratio,
+            "null_ratio": args.null_ratio,
+            "backend": args.backend,
+        },
+        "results": results,
+    }
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare and compare(results, args.compare) and args.fail_on_regression:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
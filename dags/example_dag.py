@@ -4,21 +4,43 @@ ETL Demo DAG
 
 This DAG executes the ETL pipeline using Airflow. It supports
 both API and Bot (RPA) sources, leveraging the modular ETL template.
+
+Each source gets its own extract -> transform -> prepare -> load chain, built
+by `build_source_tasks`, so sources run in parallel and a failure only
+retries the failed source. Tasks exchange pickled artefacts on disk and only
+pass file paths through XCom; pickle keeps raw frames with mixed-type columns,
+which Parquet rejects, and the tasks always run the same code version. Sources larger than `partition_rows` are split
+into partitions, and the transform and load tasks are dynamically mapped over
+them so several Airflow workers share the work:
+
+    extract_<source> -> transform_<source>[n] -> prepare_<source> -> load_<source>[n] -> cleanup_<source>
+
+Deduplication in `transform` applies within a partition; keep `partition_rows`
+above the source size when duplicates can span partitions.
+
+The scheduler re-parses this file constantly, so the module only imports
+Airflow and the standard library: sources reference their functions as
+"module:function" strings, and pandas, dotenv and the `src` stacks are imported
+inside the task callables, on the workers that run them.
 """
 
+import importlib
+import os
+import shutil
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
 from airflow import DAG
-from airflow.operators.python import PythonOperator
-from src.core.base_etl import run_api_etl, run_bot_etl
-from src.db.db_connector import SQLDatabaseConnector
-import os
-from dotenv import load_dotenv
+from airflow.decorators import task
+from airflow.operators.python import get_current_context
 from loguru import logger
 
-# Load environment variables from .env
-load_dotenv()
+if TYPE_CHECKING:
+    from src.db.db_connector import SQLDatabaseConnector
 
-# Default DAG arguments
+# Default DAG arguments (read from the scheduler environment: .env is only loaded by the tasks)
 default_args = {
     "owner": "Leonardo Souza",
     "depends_on_past": False,
@@ -29,51 +51,202 @@ default_args = {
     "start_date": datetime(2025, 8, 27),
 }
 
+# Shared directory, visible to every worker, holding the artefacts exchanged between tasks
+ARTEFACT_ROOT = os.getenv("ETL_ARTEFACT_DIR", "output/airflow")
+
+# Artefacts are pickled: raw and clean partitions may hold mixed-type object columns
+ARTEFACT_SUFFIX = ".pkl"
+
+# Pooled connector shared by every task run in this worker process
+_db_connector: Optional["SQLDatabaseConnector"] = None
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """
+    Declaration of one source pipeline.
+
+    Attributes:
+        name (str): Source name, used in task IDs and artefact paths.
+        extract (str): Extraction function, as "module:function".
+        transform (str): Transformation function, as "module:function".
+        save (str): Saver, as "module:function"; called with the DataFrame, a connector and saver keyword arguments.
+        table_name (str): Target table.
+        partition_rows (int): Maximum rows per partition; larger sources fan out over several tasks.
+        extract_kwargs (Callable[[], Dict[str, Any]]): Keyword arguments of the extraction function,
+            evaluated when the extract task runs.
+    """
+
+    name: str
+    extract: str
+    transform: str
+    save: str
+    table_name: str
+    partition_rows: int = 500_000
+    extract_kwargs: Callable[[], Dict[str, Any]] = field(default=dict)
+
+
+SOURCES = [
+    SourceSpec(
+        "api",
+        "src.api.extract.api_extract:extract_api",
+        "src.api.transform.api_transform:transform_api",
+        "src.api.saver.api_saver:save_api",
+        "api_demo",
+    ),
+    SourceSpec(
+        "bot",
+        "src.bot.extract.bot_extract:extract_bot",
+        "src.bot.transform.bot_transform:transform_bot",
+        "src.bot.saver.bot_saver:save_bot",
+        "bot_demo",
+        extract_kwargs=lambda: {"file_path": os.getenv("BOT_DATA_GLOB", "data/bot_data.xlsx")},
+    ),
+]
+
+
+def load_callable(reference: str) -> Callable[..., Any]:
+    """
+    Import the function referenced by a "module:function" string.
+
+    Args:
+        reference (str): Module path and function name separated by a colon.
+
+    Returns:
+        Callable[..., Any]: The referenced function.
+    """
+    module_name, _, function_name = reference.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
 # Function to initialize DB connector
-def get_db_connector() -> SQLDatabaseConnector:
+def get_db_connector() -> "SQLDatabaseConnector":
     """
-    Initialize the SQLDatabaseConnector using environment variables.
+    Return the pooled SQLDatabaseConnector of this worker process, creating it on first use.
+
+    Reusing the pool avoids a new SQL Server login handshake for every task run
+    executed by the same worker process. The environment variables of .env are
+    loaded at the same time.
+
     Returns:
-        SQLDatabaseConnector: Connected database instance
+        SQLDatabaseConnector: Connector with an initialized connection pool
     """
-    connector = SQLDatabaseConnector(
-        server=os.getenv("SQL_SERVER"),
-        database=os.getenv("SQL_DATABASE"),
-        use_windows_auth=False,
-        username=os.getenv("SQL_USERNAME"),
-        password=os.getenv("SQL_PASSWORD"),
-    )
-    connector.connect()
-    return connector
-
-# Python callable to run the full ETL
-def run_full_etl():
+    global _db_connector
+    if _db_connector is None:
+        from dotenv import load_dotenv
+
+        from src.db.backends import get_connector, load_database_config
+
+        load_dotenv()
+        connector = get_connector(load_database_config())
+        connector.create_pool(min_size=1, max_size=4)
+        _db_connector = connector
+    return _db_connector
+
+
+def artefact_dir(source: str) -> Path:
     """
-    Execute the ETL pipeline for both API and Bot sources.
+    Return the artefact directory of a source for the current DAG run.
+
+    Args:
+        source (str): Source name.
+
+    Returns:
+        Path: Directory of the run's artefacts for the source.
+    """
+    run_id = get_current_context()["run_id"]
+    safe_run_id = "".join(char if char.isalnum() or char in "-_." else "_" for char in run_id)
+    return Path(ARTEFACT_ROOT) / safe_run_id / source
+
+
+def build_source_tasks(source: SourceSpec) -> None:
+    """
+    Create the extract -> transform -> prepare -> load -> cleanup chain of a source in the current DAG.
+
+    Args:
+        source (SourceSpec): The source to build tasks for.
     """
-    sql_connector = get_db_connector()
-    try:
-        logger.info("==== Starting ETL pipeline ====")
-        # Run API ETL
-        run_api_etl(sql_connector)
-        # Run Bot ETL
-        run_bot_etl(sql_connector)
-        logger.info("==== ETL pipeline completed successfully ====")
-    finally:
-        sql_connector.disconnect()
+
+    @task(task_id=f"extract_{source.name}")
+    def extract() -> List[str]:
+        """Extract the source and write it as one artefact per partition."""
+        from dotenv import load_dotenv
+
+        from src.utils.frame_io import write_frame
+
+        load_dotenv()
+        df = load_callable(source.extract)(**source.extract_kwargs())
+        out_dir = artefact_dir(source.name) / "raw"
+        partitions = max(1, -(-len(df) // source.partition_rows))
+        bounds = [len(df) * i // partitions for i in range(partitions + 1)]
+        paths = [
+            str(write_frame(df.iloc[bounds[i] : bounds[i + 1]], out_dir / f"part-{i:05d}{ARTEFACT_SUFFIX}"))
+            for i in range(partitions)
+        ]
+        logger.info(f"[{source.name}] Extracted {len(df)} rows into {partitions} partitions.")
+        return paths
+
+    @task(task_id=f"transform_{source.name}")
+    def transform(raw_path: str) -> Dict[str, Any]:
+        """Transform one partition and report its inferred column types."""
+        from src.db.schema import infer_schema
+        from src.utils.frame_io import read_frame, write_frame
+
+        df = load_callable(source.transform)(read_frame(raw_path))
+        path = write_frame(df, artefact_dir(source.name) / "clean" / Path(raw_path).name)
+        return {"path": str(path), "columns": {col: column.sql for col, column in infer_schema(df).items()}}
+
+    @task(task_id=f"prepare_{source.name}")
+    def prepare(partitions: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Merge the partition schemas and (re)create the target table once."""
+        import pandas as pd
+
+        from src.db.schema import parse_sql_type, widen_column_type
+
+        merged = {}
+        for partition in partitions:
+            for col, sql in partition["columns"].items():
+                column = parse_sql_type(sql)
+                merged[col] = widen_column_type(merged[col], column) if col in merged else column
+        with get_db_connector().checkout() as sql_connector:
+            sql_connector.create_table(
+                source.table_name, pd.DataFrame(columns=list(merged)), if_exists="replace", schema=merged
+            )
+        return {col: column.sql for col, column in merged.items()}
+
+    @task(task_id=f"load_{source.name}")
+    def load(partition: Dict[str, Any], column_types: Dict[str, str]) -> int:
+        """Append one transformed partition to the prepared table."""
+        from src.utils.frame_io import read_frame
+
+        df = read_frame(partition["path"])
+        with get_db_connector().checkout() as sql_connector:
+            load_callable(source.save)(
+                df, sql_connector, table_name=source.table_name, mode="append", column_types=column_types
+            )
+        return len(df)
+
+    @task(task_id=f"cleanup_{source.name}")
+    def cleanup(loaded_rows: List[int]) -> None:
+        """Remove the run's artefacts once every partition is loaded."""
+        shutil.rmtree(artefact_dir(source.name), ignore_errors=True)
+        logger.info(f"[{source.name}] Loaded {sum(loaded_rows)} rows into {source.table_name}.")
+
+    transformed = transform.expand(raw_path=extract())
+    column_types = prepare(transformed)
+    loaded = load.partial(column_types=column_types).expand(partition=transformed)
+    cleanup(loaded)
+
 
 # Define the DAG
 with DAG(
     dag_id="etl_demo_pipeline",
     default_args=default_args,
-    schedule_interval="@daily",
+    schedule="@daily",
     catchup=False,
     description="DAG to run the professional ETL template for API and Bot sources",
     tags=["etl", "template", "portfolio"],
 ) as dag:
 
-    run_etl_task = PythonOperator(
-        task_id="run_full_etl",
-        python_callable=run_full_etl,
-        dag=dag,
-    )
+    for source_spec in SOURCES:
+        build_source_tasks(source_spec)
@@ -4,7 +4,24 @@ Entry point for executing ETL pipelines for API and Bot data sources.
 
 This script loads environment variables, initializes the SQL database connection,
 and orchestrates the execution of multiple ETL processes (API ETL and Bot ETL)
-using structured logging and error handling.
+using structured logging and error handling. Independent pipelines run
+concurrently through `PipelineRunner`, each on its own pooled connection.
+The database backend (SQL Server, SQLite or DuckDB) is picked from the
+`database` configuration section or the DB_BACKEND environment variable.
+
+Incremental runs are configured with the `state` section (watermark store) and
+the `incremental.column` of each source: only records newer than the last
+loaded watermark are extracted and appended. Without a column, every run is a
+full load that replaces the table.
+
+With the `checkpoints` configuration section enabled, the outputs of extract and
+transform are persisted per run. A failed run is resumed by rerunning it with the
+same run ID in ETL_RUN_ID (logged at startup); without it every run starts fresh.
+
+The source stacks (HTTP clients, Excel readers, YAML) and the database drivers
+are imported inside the pipeline methods, so starting the CLI only pays for the
+pipelines that actually run. `tests/unit/test_startup.py` keeps the import time
+of this module within a fixed budget.
 
 Dependencies:
     - python-dotenv: For loading environment variables from a .env file.
@@ -12,20 +29,130 @@ Dependencies:
     - pandas: For data handling in ETL pipelines.
 """
 
-import os
 from dotenv import load_dotenv
 from loguru import logger
+import os
 import sys
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from src.core.base_etl import BaseETL
+from src.core.checkpoint import CheckpointStore, default_run_id
+from src.core.state_store import StateStore, get_state_store
+from src.core.runner import PipelineRunner
+from src.db.db_connector import SQLDatabaseConnector
+from src.utils.metrics import DEFAULT_TELEMETRY_PATH, configure_telemetry, shutdown_telemetry
+
+BOT_DATA_PATH = os.getenv("BOT_DATA_PATH", "data/bot_data.xlsx")
+CONFIG_PATH = "config/config.yaml"
+
+
+def load_config(config_path: str = CONFIG_PATH) -> Dict[str, Any]:
+    """
+    Read the YAML configuration file.
+
+    Args:
+        config_path (str): Path to the configuration file. Defaults to "config/config.yaml".
+
+    Returns:
+        Dict[str, Any]: The configuration, or an empty dict if the file is missing.
+    """
+    if not os.path.exists(config_path):
+        return {}
+    import yaml
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def watermark_column(config: Dict[str, Any], source: str) -> Optional[str]:
+    """
+    Return the watermark column of a source, declared as `<source>.incremental.column`.
+
+    Args:
+        config (Dict[str, Any]): The configuration.
+        source (str): Source section name, e.g. "api".
+
+    Returns:
+        Optional[str]: The column, or None for full loads.
+    """
+    return ((config.get(source) or {}).get("incremental") or {}).get("column")
+
+
+class ApiETL(BaseETL):
+    """
+    API pipeline loading into `api_demo`, on a connection checked out from the connector's pool.
+    """
+
+    def __init__(
+        self,
+        sql_connector: SQLDatabaseConnector,
+        state_store: Optional[StateStore] = None,
+        watermark_column: Optional[str] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            "api", state_store=state_store, watermark_column=watermark_column, checkpoints=checkpoints, run_id=run_id
+        )
+        self.sql_connector = sql_connector
+
+    def extract(self) -> pd.DataFrame:
+        from src.api.extract.api_extract import extract_api
+
+        return extract_api(since=self.watermark)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        from src.api.transform.api_transform import transform_api
 
-from src.api.extract.api_extract import extract_api
-from src.api.transform.api_transform import transform_api
-from src.api.saver.api_saver import save_api
+        return transform_api(df)
 
-from src.bot.extract.bot_extract import extract_bot
-from src.bot.transform.bot_transform import transform_bot
-from src.bot.saver.bot_saver import save_bot
+    def load(self, df: pd.DataFrame) -> None:
+        from src.api.saver.api_saver import save_api
 
-from db.db_connector import SQLDatabaseConnector
+        with self.sql_connector.checkout() as session:
+            save_api(df, session, mode="append" if self.incremental else "replace")
+
+
+class BotETL(BaseETL):
+    """
+    Bot/RPA pipeline loading into `bot_demo`, on a connection checked out from the connector's pool.
+    """
+
+    def __init__(
+        self,
+        sql_connector: SQLDatabaseConnector,
+        file_path: str = BOT_DATA_PATH,
+        state_store: Optional[StateStore] = None,
+        watermark_column: Optional[str] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            "bot", state_store=state_store, watermark_column=watermark_column, checkpoints=checkpoints, run_id=run_id
+        )
+        self.sql_connector = sql_connector
+        self.file_path = file_path
+
+    def checkpoint_inputs(self) -> Dict[str, Any]:
+        return {**super().checkpoint_inputs(), "file": self.file_path, "mtime": os.path.getmtime(self.file_path)}
+
+    def extract(self) -> pd.DataFrame:
+        from src.bot.extract.bot_extract import extract_bot
+
+        return extract_bot(self.file_path, since=self.watermark, watermark_column=self.watermark_column)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        from src.bot.transform.bot_transform import transform_bot
+
+        return transform_bot(df)
+
+    def load(self, df: pd.DataFrame) -> None:
+        from src.bot.saver.bot_saver import save_bot
+
+        with self.sql_connector.checkout() as session:
+            save_bot(df, session, mode="append" if self.incremental else "replace")
 
 
 def run_api_etl(sql_connector: SQLDatabaseConnector) -> None:
@@ -35,13 +162,15 @@ def run_api_etl(sql_connector: SQLDatabaseConnector) -> None:
     Args:
         sql_connector (SQLDatabaseConnector): Connected SQLDatabaseConnector instance.
     """
+    from src.api.extract.api_extract import extract_api
+    from src.api.saver.api_saver import save_api
+    from src.api.transform.api_transform import transform_api
+
     logger.info("==== Starting API ETL ====")
     try:
         df_api = extract_api()
         df_api_clean = transform_api(df_api)
-
-        for _, row in df_api_clean.iterrows():
-            sql_connector.execute_query_from_file("db/queries/insert.sql", params=list(row))
+        save_api(df_api_clean, sql_connector)
 
         logger.success("==== API ETL completed successfully ====")
     except Exception as e:
@@ -61,8 +190,7 @@ def run_bot_etl(sql_connector: SQLDatabaseConnector) -> None:
         # Uncomment and implement when Bot ETL is ready
         # df_bot = extract_bot()
         # df_bot_clean = transform_bot(df_bot)
-        # for _, row in df_bot_clean.iterrows():
-        #     sql_connector.execute_query_from_file("db/queries/insert.sql", params=list(row))
+        # save_bot(df_bot_clean, sql_connector)
 
         logger.success("==== Bot ETL completed successfully ====")
     except Exception as e:
@@ -75,35 +203,63 @@ def main() -> None:
     Main function to initialize the SQL connector and run ETL pipelines.
 
     Steps:
-        1. Load environment variables from .env.
-        2. Initialize SQLDatabaseConnector with credentials.
-        3. Connect to the database.
-        4. Run API ETL and Bot ETL pipelines.
-        5. Disconnect from the database.
+        1. Load environment variables from .env and the configuration file.
+        2. Initialize the connector of the configured database backend.
+        3. Create the connection pool.
+        4. Run the API and Bot pipelines concurrently, each on its own pooled connection.
+        5. Close the pool and disconnect from the database.
     """
+    from src.db.backends import get_connector
+
     load_dotenv()
+    configure_telemetry(os.getenv("ETL_TELEMETRY_PATH", DEFAULT_TELEMETRY_PATH))
+    config = load_config()
+    state_store = get_state_store(config.get("state"))
+    checkpoints = CheckpointStore.from_config(config.get("checkpoints"))
+    run_id = os.getenv("ETL_RUN_ID")
+    if checkpoints is not None:
+        run_id = run_id or default_run_id()
+        logger.info(f"Checkpointing run {run_id}; rerun with ETL_RUN_ID={run_id} to resume it.")
 
     try:
-        sql_connector = SQLDatabaseConnector(
-            server=os.getenv("SQL_SERVER"),
-            database=os.getenv("SQL_DATABASE"),
-            use_windows_auth=False,
-            username=os.getenv("SQL_USERNAME"),
-            password=os.getenv("SQL_PASSWORD"),
-        )
-        sql_connector.connect()
+        sql_connector = get_connector(config.get("database") or {})
+        sql_connector.create_pool(min_size=1, max_size=4)
     except Exception as e:
         logger.critical(f"Failed to initialize database connection: {e}")
         sys.exit(1)
 
     try:
-        run_api_etl(sql_connector)
-        run_bot_etl(sql_connector)
+        runner = PipelineRunner(max_workers=4, fail_fast=False)
+        runner.add(
+            ApiETL(
+                sql_connector,
+                state_store=state_store,
+                watermark_column=watermark_column(config, "api"),
+                checkpoints=checkpoints,
+                run_id=run_id,
+            )
+        )
+        if os.path.exists(BOT_DATA_PATH):
+            runner.add(
+                BotETL(
+                    sql_connector,
+                    state_store=state_store,
+                    watermark_column=watermark_column(config, "bot"),
+                    checkpoints=checkpoints,
+                    run_id=run_id,
+                )
+            )
+        else:
+            logger.info(f"Bot ETL skipped: no data at {BOT_DATA_PATH}.")
+        summary = runner.run()
+        if not summary.success:
+            logger.error(f"ETL execution finished with failed pipelines: {summary.failed}")
     except Exception as e:
         logger.error(f"ETL execution halted due to error: {e}")
     finally:
         sql_connector.disconnect()
         logger.info("Database connection closed.")
+        shutdown_telemetry()
 
 
 if __name__ == "__main__":
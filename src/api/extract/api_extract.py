@@ -5,27 +5,180 @@ Provides functions to extract data from an external API.
 This module reads configuration from a YAML file, executes HTTP requests to the API,
 and returns the extracted data as a pandas DataFrame.
 
+When `api.endpoints` is declared in the configuration, the paginated endpoints are
+fetched concurrently (see `src.api.extract.api_paginator`); otherwise a single
+conditional request is sent to `api.endpoint`, backed by the response cache in
+`src.api.extract.http_cache`.
+
+Every request is retried with exponential backoff (honoring Retry-After),
+guarded by a circuit breaker and optionally hedged, as configured under
+`api.retry`, `api.circuit_breaker` and `api.hedging` (see
+`src.api.extract.resilience`).
+
 Dependencies:
     - requests: For HTTP requests to the API.
+    - httpx: For concurrent paginated requests.
     - pandas: For data handling and conversion.
     - pyyaml: For reading configuration files.
+    - tenacity: For retries with backoff (through `src.api.extract.resilience`).
 """
 
+import asyncio
+from datetime import datetime
+import httpx
 import requests
 import pandas as pd
 import yaml
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
+from src.api.extract.api_paginator import aiter_pages, fetch_all_records
+from src.api.extract.http_cache import ResponseCache
+from src.api.extract.resilience import CircuitOpenError, ResilientHTTP
 from src.utils.logger import logger
 
 
-def extract_api(config_path: str = "config/config.yaml") -> pd.DataFrame:
+def _load_api_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load the `api` section of the YAML configuration file.
+
+    Args:
+        config_path (str): Path to the YAML configuration file.
+
+    Returns:
+        Dict[str, Any]: The API configuration.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist.
+        KeyError: If the `api` section is missing.
+    """
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        return config["api"]
+    except FileNotFoundError as e:
+        logger.exception(f"Configuration file not found: {config_path}")
+        raise e
+    except KeyError as e:
+        logger.exception(f"Missing configuration key: {e}")
+        raise e
+
+
+def _incremental_params(api_config: Dict[str, Any], since: Any) -> Dict[str, Any]:
+    """
+    Build the query parameters that request only records newer than the watermark.
+
+    Args:
+        api_config (Dict[str, Any]): The API configuration, optionally with `incremental.param`.
+        since (Any): The watermark of the last successful load, or None for a full extraction.
+
+    Returns:
+        Dict[str, Any]: The incremental query parameters, empty for a full extraction.
+    """
+    if since is None:
+        return {}
+    param = api_config.get("incremental", {}).get("param")
+    if not param:
+        logger.warning("A watermark was given but 'api.incremental.param' is not configured. Running a full extraction.")
+        return {}
+    value = since.isoformat() if isinstance(since, (pd.Timestamp, datetime)) else since
+    logger.info(f"Incremental extraction: {param}={value}")
+    return {param: value}
+
+
+def _with_endpoint_params(api_config: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the API configuration with `params` added to every endpoint."""
+    if not params:
+        return api_config
+    endpoints = [{**endpoint, "params": {**endpoint.get("params", {}), **params}} for endpoint in api_config["endpoints"]]
+    return {**api_config, "endpoints": endpoints}
+
+
+def _extract_paginated(api_config: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Fetch all configured paginated endpoints concurrently and build one DataFrame.
+
+    Args:
+        api_config (Dict[str, Any]): The API configuration with an `endpoints` list.
+
+    Returns:
+        pd.DataFrame: Records of every endpoint, in configuration and page order.
+
+    Raises:
+        httpx.HTTPError: If any page request fails once the retries are exhausted.
+        CircuitOpenError: If the circuit breaker opened after repeated failures.
+    """
+    try:
+        logger.info(f"Starting paginated extraction from {len(api_config['endpoints'])} endpoint(s).")
+        records = asyncio.run(fetch_all_records(api_config))
+        if not records:
+            logger.warning("No entries found in API responses.")
+
+        df = pd.DataFrame(records)
+        logger.info(f"Extraction completed successfully: {len(df)} records retrieved.")
+        return df
+
+    except (httpx.HTTPError, CircuitOpenError) as e:
+        logger.exception(f"Paginated HTTP request to API failed: {e}")
+        raise e
+
+
+def iter_api_chunks(config_path: str = "config/config.yaml", since: Any = None) -> Iterator[pd.DataFrame]:
+    """
+    Extract the configured paginated endpoints and yield one DataFrame per page.
+
+    Pages are fetched concurrently in windows but yielded in order, so only a
+    window of pages is held in memory. Suitable as a streaming `BaseETL.extract`.
+
+    Args:
+        config_path (str): Path to the YAML configuration file. Defaults to "config/config.yaml".
+        since (Any): Watermark of the last successful load. Only newer records are requested. Defaults to None.
+
+    Yields:
+        pd.DataFrame: Records of the next page.
+
+    Raises:
+        KeyError: If no `api.endpoints` are configured.
+        httpx.HTTPError: If any page request fails once the retries are exhausted.
+        CircuitOpenError: If the circuit breaker opened after repeated failures.
+    """
+    api_config = _load_api_config(config_path)
+    if not api_config.get("endpoints"):
+        raise KeyError("Chunked extraction requires 'api.endpoints' in the configuration file.")
+    api_config = _with_endpoint_params(api_config, _incremental_params(api_config, since))
+
+    loop = asyncio.new_event_loop()
+    pages = aiter_pages(api_config)
+    try:
+        while True:
+            try:
+                records = loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                break
+            yield pd.DataFrame(records)
+    except (httpx.HTTPError, CircuitOpenError) as e:
+        logger.exception(f"Paginated HTTP request to API failed: {e}")
+        raise e
+    finally:
+        loop.run_until_complete(pages.aclose())
+        loop.close()
+
+
+def extract_api(
+    config_path: str = "config/config.yaml", refresh: bool = False, since: Any = None
+) -> pd.DataFrame:
     """
     Extract data from an external API and return it as a pandas DataFrame.
 
-    Reads the API endpoint and timeout configuration from a YAML file.
+    Reads the API endpoint and timeout configuration from a YAML file. If paginated
+    `endpoints` are configured, they are fetched concurrently instead.
+
+    When `api.cache` is enabled, the request is sent with If-None-Match / If-Modified-Since
+    validators and a 304 response is served from the on-disk cache.
 
     Args:
         config_path (str): Path to the YAML configuration file. Defaults to "config/config.yaml".
+        refresh (bool): Ignore the response cache and download the full payload. Defaults to False.
+        since (Any): Watermark of the last successful load. When `api.incremental.param` is configured,
+            only records newer than it are requested. Defaults to None (full extraction).
 
     Returns:
         pd.DataFrame: Extracted data as a DataFrame. Returns an empty DataFrame if no entries are found.
@@ -33,26 +186,47 @@ def extract_api(config_path: str = "config/config.yaml") -> pd.DataFrame:
     Raises:
         FileNotFoundError: If the configuration file does not exist.
         KeyError: If required keys are missing in the configuration file.
-        requests.RequestException: If the HTTP request fails.
+        requests.RequestException: If the HTTP request fails once the retries are exhausted.
+        httpx.HTTPError: If a paginated request fails once the retries are exhausted.
+        CircuitOpenError: If the circuit breaker opened after repeated failures.
         ValueError: If the response JSON is invalid or missing expected data.
     """
-    try:
-        # Load API configuration
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        endpoint = config["api"]["endpoint"]
-        timeout = config["api"].get("timeout", 30)
+    # Load API configuration
+    api_config = _load_api_config(config_path)
+    params = _incremental_params(api_config, since)
+    if api_config.get("endpoints"):
+        return _extract_paginated(_with_endpoint_params(api_config, params))
 
-    except FileNotFoundError as e:
-        logger.exception(f"Configuration file not found: {config_path}")
-        raise e
+    try:
+        endpoint = api_config["endpoint"]
+        timeout = (api_config.get("connect_timeout", 5), api_config.get("timeout", 30))
     except KeyError as e:
         logger.exception(f"Missing configuration key: {e}")
         raise e
 
+    cache = ResponseCache.from_config(api_config.get("cache"))
+    cached_entry = None
+    if cache is not None and not refresh:
+        cached_entry = cache.lookup(endpoint, params)
+
+    http = ResilientHTTP.from_config(api_config)
     try:
         logger.info(f"Starting data extraction from API: {endpoint}")
-        response = requests.get(endpoint, timeout=timeout)
+        response = http.get(
+            lambda: requests.get(
+                endpoint,
+                params=params or None,
+                timeout=timeout,
+                headers=ResponseCache.conditional_headers(cached_entry),
+            ),
+            url=endpoint,
+        )
+        http.log_summary()
+        if response.status_code == 304 and cached_entry is not None:
+            df = cache.load(cached_entry)
+            logger.info(f"API data not modified; served {len(df)} records from cache.")
+            return df
+
         response.raise_for_status()  # Raise exception for HTTP errors
         data = response.json()
 
@@ -61,12 +235,19 @@ def extract_api(config_path: str = "config/config.yaml") -> pd.DataFrame:
             logger.warning("No entries found in API response.")
         
         df = pd.DataFrame(entries)
+        if cache is not None:
+            try:
+                cache.store(endpoint, params, response.headers, df)
+            except Exception as e:
+                logger.warning(f"Could not cache API response from {endpoint}; continuing without it: {e}")
         logger.info(f"Extraction completed successfully: {len(df)} records retrieved.")
         return df
 
-    except requests.RequestException as e:
+    except (requests.RequestException, CircuitOpenError) as e:
         logger.exception(f"HTTP request to API failed: {e}")
         raise e
     except ValueError as e:
         logger.exception(f"Invalid JSON response from API: {e}")
         raise e
+    finally:
+        http.close()
@@ -0,0 +1,287 @@
+"""
+Module: api_paginator
+Provides concurrent, paginated extraction from HTTP APIs using asyncio and httpx.
+
+Each endpoint declared under `api.endpoints` in the configuration file is
+paginated with one of three styles:
+    - page:   ?page=1&per_page=100, ?page=2&per_page=100, ...
+    - offset: ?offset=0&limit=100, ?offset=100&limit=100, ...
+    - cursor: ?cursor=<value returned by the previous page>
+
+Page and offset pagination fetch windows of `api.concurrency` pages at once
+and stop at the first short or empty page. Cursor pagination is sequential
+per endpoint, but different endpoints are fetched concurrently. A global
+semaphore caps in-flight requests and a per-host limiter enforces
+`api.rate_limit.per_host` requests per second. Each page request is retried,
+guarded by a circuit breaker and optionally hedged by
+`src.api.extract.resilience.ResilientHTTP`; backoff waits do not hold a
+concurrency slot.
+
+Dependencies:
+    - httpx: For asynchronous HTTP requests.
+    - loguru: For structured logging.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from src.api.extract.resilience import ResilientHTTP
+from src.utils.logger import logger
+
+PAGINATION_STYLES = ("page", "offset", "cursor")
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_PAGES = 10000
+
+
+class HostRateLimiter:
+    """
+    Spaces out requests to the same host so that at most `rate` requests per second are started.
+
+    Args:
+        rate (Optional[float]): Maximum requests per second per host. None or 0 disables the limit.
+    """
+
+    def __init__(self, rate: Optional[float] = None) -> None:
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot: Dict[str, float] = defaultdict(float)
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def wait(self, host: str) -> None:
+        """
+        Wait until a request to `host` is allowed.
+
+        Args:
+            host (str): Host name of the request.
+        """
+        if not self.interval:
+            return
+        async with self._locks[host]:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            delay = self._next_slot[host] - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot[host] = max(now, self._next_slot[host]) + self.interval
+
+
+def get_path(payload: Any, path: Optional[str]) -> Any:
+    """
+    Read a dotted path (e.g. "meta.next_cursor") from a JSON payload.
+
+    Args:
+        payload (Any): Parsed JSON payload.
+        path (Optional[str]): Dotted path. An empty path returns the payload itself.
+
+    Returns:
+        Any: The value at the path, or None if any key is missing.
+    """
+    if not path:
+        return payload
+    value = payload
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _validate_endpoint(endpoint: Dict[str, Any]) -> None:
+    """
+    Validate an endpoint declaration from the configuration file.
+
+    Raises:
+        KeyError: If the endpoint has no url.
+        ValueError: If the pagination style is unknown.
+    """
+    if "url" not in endpoint:
+        raise KeyError(f"Endpoint {endpoint.get('name', '<unnamed>')} is missing 'url'.")
+    style = endpoint.get("pagination", {}).get("style", "page")
+    if style not in PAGINATION_STYLES:
+        raise ValueError(f"Unknown pagination style '{style}'. Expected one of {PAGINATION_STYLES}.")
+
+
+def _page_params(pagination: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """
+    Build the query parameters of the page with zero-based position `index` for page/offset pagination.
+    """
+    page_size = pagination.get("page_size", DEFAULT_PAGE_SIZE)
+    if pagination.get("style", "page") == "offset":
+        return {
+            pagination.get("offset_param", "offset"): index * page_size,
+            pagination.get("limit_param", "limit"): page_size,
+        }
+    return {
+        pagination.get("page_param", "page"): pagination.get("start", 1) + index,
+        pagination.get("size_param", "per_page"): page_size,
+    }
+
+
+async def _fetch_json(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    limiter: HostRateLimiter,
+    http: Optional[ResilientHTTP] = None,
+) -> Any:
+    """
+    Fetch and parse one page, honoring the concurrency cap and the host rate limit on every attempt.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status once the retries are exhausted.
+        CircuitOpenError: If the circuit breaker refuses the request.
+    """
+
+    async def send() -> httpx.Response:
+        async with semaphore:
+            await limiter.wait(httpx.URL(url).host)
+            logger.debug("GET {} params={}", url, params)
+            return await client.get(url, params=params)
+
+    response = await http.aget(send, url=url) if http is not None else await send()
+    response.raise_for_status()
+    return response.json()
+
+
+async def aiter_endpoint_pages(
+    client: httpx.AsyncClient,
+    endpoint: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    limiter: HostRateLimiter,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    http: Optional[ResilientHTTP] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield the records of every page of one endpoint, in page order.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client.
+        endpoint (Dict[str, Any]): Endpoint declaration (url, data_key, params, pagination).
+        semaphore (asyncio.Semaphore): Global cap on in-flight requests.
+        limiter (HostRateLimiter): Per-host rate limiter.
+        concurrency (int): Number of pages requested at once for page/offset pagination.
+        http (Optional[ResilientHTTP]): Retry/circuit-breaker/hedging wrapper. None sends single attempts.
+
+    Yields:
+        List[Dict[str, Any]]: Records of the next non-empty page.
+    """
+    _validate_endpoint(endpoint)
+    url = endpoint["url"]
+    data_key = endpoint.get("data_key", "entries")
+    base_params = endpoint.get("params", {})
+    pagination = endpoint.get("pagination", {})
+    style = pagination.get("style", "page")
+    page_size = pagination.get("page_size", DEFAULT_PAGE_SIZE)
+    max_pages = pagination.get("max_pages", DEFAULT_MAX_PAGES)
+
+    if style == "cursor":
+        cursor = pagination.get("start")
+        for _ in range(max_pages):
+            params = {**base_params, pagination.get("size_param", "limit"): page_size}
+            if cursor is not None:
+                params[pagination.get("cursor_param", "cursor")] = cursor
+            payload = await _fetch_json(client, url, params, semaphore, limiter, http)
+            records = get_path(payload, data_key) or []
+            if records:
+                yield records
+            cursor = get_path(payload, pagination.get("cursor_path", "next_cursor"))
+            if not records or cursor in (None, ""):
+                return
+        return
+
+    index = 0
+    while index < max_pages:
+        window = range(index, min(index + concurrency, max_pages))
+        payloads = await asyncio.gather(
+            *(
+                _fetch_json(client, url, {**base_params, **_page_params(pagination, i)}, semaphore, limiter, http)
+                for i in window
+            )
+        )
+        for payload in payloads:
+            records = get_path(payload, data_key) or []
+            if records:
+                yield records
+            if len(records) < page_size:
+                return
+        index += len(window)
+
+
+def _client_args(api_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the shared AsyncClient arguments from the API configuration."""
+    concurrency = api_config.get("concurrency", DEFAULT_CONCURRENCY)
+    return {
+        "timeout": httpx.Timeout(api_config.get("timeout", 30), connect=api_config.get("connect_timeout", 5)),
+        "limits": httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        "headers": api_config.get("headers"),
+    }
+
+
+async def aiter_pages(
+    api_config: Dict[str, Any],
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    http: Optional[ResilientHTTP] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield page records of every configured endpoint, one endpoint after another.
+
+    Args:
+        api_config (Dict[str, Any]): The `api` section of the configuration file.
+        transport (Optional[httpx.AsyncBaseTransport]): Custom transport, mainly for testing.
+        http (Optional[ResilientHTTP]): Retry wrapper. Defaults to one built from `api_config`.
+
+    Yields:
+        List[Dict[str, Any]]: Records of the next non-empty page.
+    """
+    concurrency = api_config.get("concurrency", DEFAULT_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = HostRateLimiter(api_config.get("rate_limit", {}).get("per_host"))
+    http = http or ResilientHTTP.from_config(api_config)
+
+    async with httpx.AsyncClient(transport=transport, **_client_args(api_config)) as client:
+        for endpoint in api_config["endpoints"]:
+            logger.info(f"Extracting paginated endpoint: {endpoint.get('name', endpoint.get('url'))}")
+            async for records in aiter_endpoint_pages(client, endpoint, semaphore, limiter, concurrency, http):
+                yield records
+    http.log_summary()
+
+
+async def fetch_all_records(
+    api_config: Dict[str, Any],
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    http: Optional[ResilientHTTP] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every page of every configured endpoint concurrently.
+
+    Records are returned in configuration order, then page order, regardless of completion order.
+
+    Args:
+        api_config (Dict[str, Any]): The `api` section of the configuration file.
+        transport (Optional[httpx.AsyncBaseTransport]): Custom transport, mainly for testing.
+        http (Optional[ResilientHTTP]): Retry wrapper. Defaults to one built from `api_config`.
+
+    Returns:
+        List[Dict[str, Any]]: All records of all endpoints.
+    """
+    concurrency = api_config.get("concurrency", DEFAULT_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = HostRateLimiter(api_config.get("rate_limit", {}).get("per_host"))
+    http = http or ResilientHTTP.from_config(api_config)
+
+    async with httpx.AsyncClient(transport=transport, **_client_args(api_config)) as client:
+
+        async def collect(endpoint: Dict[str, Any]) -> List[Dict[str, Any]]:
+            records: List[Dict[str, Any]] = []
+            async for page in aiter_endpoint_pages(client, endpoint, semaphore, limiter, concurrency, http):
+                records.extend(page)
+            logger.info(f"Endpoint {endpoint.get('name', endpoint['url'])}: {len(records)} records retrieved.")
+            return records
+
+        results = await asyncio.gather(*(collect(endpoint) for endpoint in api_config["endpoints"]))
+
+    http.log_summary()
+    return [record for records in results for record in records]
@@ -0,0 +1,255 @@
+"""
+Module: http_cache
+Provides an on-disk cache of API responses based on HTTP conditional requests.
+
+Each entry is keyed by URL and query parameters and stores the response
+validators (ETag / Last-Modified) next to the parsed records, saved as a
+Parquet file (pickle if no Parquet engine is installed). When the server
+answers a conditional request with 304 Not Modified, the cached DataFrame is
+served without downloading or parsing the JSON payload again.
+
+Entries older than `ttl_seconds` are dropped, and the least recently used
+entries are evicted once the cache grows beyond `max_bytes`.
+
+Dependencies:
+    - pandas: For storing parsed records.
+    - loguru: For structured logging.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from src.utils.frame_io import FRAME_SUFFIX, read_frame, write_frame
+from src.utils.logger import logger
+
+DEFAULT_CACHE_DIR = "output/.cache/http"
+DEFAULT_TTL_SECONDS = 86400
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response.
+
+    Attributes:
+        key (str): Cache key derived from URL and parameters.
+        meta (Dict[str, Any]): Stored metadata (url, validators, timestamps, size).
+        data_path (Path): Path of the stored DataFrame.
+    """
+
+    key: str
+    meta: Dict[str, Any]
+    data_path: Path
+
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache using ETag / Last-Modified revalidation.
+
+    Args:
+        cache_dir (str): Directory holding the cache files. Defaults to "output/.cache/http".
+        ttl_seconds (float): Maximum age of an entry since it was last stored or revalidated. Defaults to one day.
+        max_bytes (int): Maximum total size of the cached data files. Defaults to 512 MB.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_config(cls, cache_config: Optional[Dict[str, Any]]) -> Optional["ResponseCache"]:
+        """
+        Build a cache from the `api.cache` configuration section.
+
+        Args:
+            cache_config (Optional[Dict[str, Any]]): Section with enabled, dir, ttl_seconds and max_size_mb.
+
+        Returns:
+            Optional[ResponseCache]: The cache, or None if it is missing or disabled.
+        """
+        if not cache_config or not cache_config.get("enabled", True):
+            return None
+        return cls(
+            cache_dir=cache_config.get("dir", DEFAULT_CACHE_DIR),
+            ttl_seconds=cache_config.get("ttl_seconds", DEFAULT_TTL_SECONDS),
+            max_bytes=int(cache_config.get("max_size_mb", DEFAULT_MAX_BYTES / 1024 / 1024) * 1024 * 1024),
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Compute the cache key of a request.
+
+        Args:
+            url (str): Request URL.
+            params (Optional[Dict[str, Any]]): Query parameters.
+
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        raw = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _remove(self, key: str) -> None:
+        for path in self.cache_dir.glob(f"{key}.*"):
+            path.unlink(missing_ok=True)
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+        """
+        Return the cache entry of a request if it exists and has not expired.
+
+        Args:
+            url (str): Request URL.
+            params (Optional[Dict[str, Any]]): Query parameters.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None on a miss.
+        """
+        key = self.make_key(url, params)
+        meta_path = self._meta_path(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        data_path = self.cache_dir / meta.get("data_file", "")
+        if time.time() - meta.get("validated_at", 0) > self.ttl_seconds or not data_path.is_file():
+            logger.debug(f"Cache entry expired for {url}.")
+            self._remove(key)
+            return None
+        return CacheEntry(key=key, meta=meta, data_path=data_path)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a cache entry.
+
+        Args:
+            entry (Optional[CacheEntry]): The cached entry, if any.
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers, empty without an entry.
+        """
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.meta.get("etag"):
+            headers["If-None-Match"] = entry.meta["etag"]
+        if entry.meta.get("last_modified"):
+            headers["If-Modified-Since"] = entry.meta["last_modified"]
+        return headers
+
+    def load(self, entry: CacheEntry) -> pd.DataFrame:
+        """
+        Read the cached DataFrame of an entry and mark it as revalidated.
+
+        Args:
+            entry (CacheEntry): The entry confirmed by a 304 response.
+
+        Returns:
+            pd.DataFrame: The cached records.
+        """
+        df = read_frame(entry.data_path)
+        entry.meta["validated_at"] = time.time()
+        self._meta_path(entry.key).write_text(json.dumps(entry.meta), encoding="utf-8")
+        return df
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        df: pd.DataFrame,
+    ) -> bool:
+        """
+        Store the parsed records of a response that carries validators.
+
+        Responses without ETag or Last-Modified are not stored, since they cannot be revalidated.
+
+        Args:
+            url (str): Request URL.
+            params (Optional[Dict[str, Any]]): Query parameters.
+            headers (Dict[str, str]): Response headers.
+            df (pd.DataFrame): Parsed records.
+
+        Returns:
+            bool: True if the entry was stored.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        key = self.make_key(url, params)
+        data_path = write_frame(df, self.cache_dir / f"{key}{FRAME_SUFFIX}")
+        now = time.time()
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "data_file": data_path.name,
+            "size": data_path.stat().st_size,
+            "stored_at": now,
+            "validated_at": now,
+        }
+        self._meta_path(key).write_text(json.dumps(meta), encoding="utf-8")
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently validated entries until the size limit is met.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+
+        entries = []
+        removed = 0
+        now = time.time()
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except ValueError:
+                meta = {}
+            if now - meta.get("validated_at", 0) > self.ttl_seconds:
+                self._remove(meta_path.stem)
+                removed += 1
+            else:
+                entries.append((meta.get("validated_at", 0), meta.get("size", 0), meta_path.stem))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.debug(f"Evicted {removed} HTTP cache entries.")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.iterdir():
+                if path.is_file():
+                    path.unlink()
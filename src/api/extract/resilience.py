@@ -0,0 +1,507 @@
+"""
+Module: resilience
+Provides retries, a circuit breaker and request hedging for the API extraction requests.
+
+`ResilientHTTP` wraps one request (a zero-argument callable sending it with
+requests or httpx) and:
+    - retries connection errors, timeouts and retryable statuses (429, 5xx) with
+      exponential backoff and jitter, waiting the server's `Retry-After` instead
+      when the response carries one
+    - opens a circuit breaker after `failure_threshold` consecutive failed attempts,
+      failing fast until `reset_timeout` has elapsed and a trial request succeeds
+    - optionally hedges idempotent GETs: when an attempt is slower than the
+      `quantile` of the recent latencies, a second copy is sent and the first
+      answer wins
+
+Attempt latencies, retries, hedges and circuit openings are recorded as
+OpenTelemetry metrics (see `src.utils.metrics`) and summarized by `log_summary`.
+
+The behaviour is configured under `api.retry`, `api.circuit_breaker` and
+`api.hedging` in the configuration file.
+
+Dependencies:
+    - tenacity: For the retry loop, stop and backoff strategies.
+    - requests / httpx: For the retryable exception types of each client.
+    - opentelemetry-api: For the latency histogram and the retry counters.
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> http = ResilientHTTP.from_config(api_config)
+    >>> response = http.get(lambda: requests.get(url, timeout=30), url=url)
+    >>> response = await http.aget(lambda: client.get(url, params=params), url=url)
+"""
+
+import asyncio
+import email.utils
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type
+
+import httpx
+import requests
+from opentelemetry import metrics
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from src.utils.logger import logger
+from src.utils.metrics import TRACER_NAME
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+SYNC_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (requests.ConnectionError, requests.Timeout)
+ASYNC_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (httpx.TransportError,)
+
+_meter = metrics.get_meter(TRACER_NAME)
+_request_duration = _meter.create_histogram(
+    "etl.http.request.duration", unit="s", description="Latency of one API request attempt"
+)
+_request_retries = _meter.create_counter("etl.http.retries", unit="{retry}", description="Retried API requests")
+_request_hedges = _meter.create_counter("etl.http.hedges", unit="{request}", description="Hedged API requests")
+_circuit_opened = _meter.create_counter(
+    "etl.http.circuit_opened", unit="{event}", description="Times the API circuit breaker opened"
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is refused because the circuit breaker is open."""
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry settings of the API requests.
+
+    Attributes:
+        attempts (int): Tries per request, including the first one.
+        backoff_initial (float): Seconds before the first retry, doubled on each retry.
+        backoff_max (float): Upper bound of the exponential backoff, in seconds.
+        jitter (float): Maximum random seconds added to each backoff.
+        max_retry_after (float): Upper bound of the waits requested with Retry-After, in seconds.
+        statuses (Tuple[int, ...]): Response statuses that are retried.
+    """
+
+    attempts: int = 4
+    backoff_initial: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 1.0
+    max_retry_after: float = 120.0
+    statuses: Tuple[int, ...] = DEFAULT_RETRY_STATUSES
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Hedging settings of the idempotent API requests.
+
+    Attributes:
+        enabled (bool): Whether slow requests are hedged.
+        quantile (float): Latency quantile after which a second copy of the request is sent.
+        min_samples (int): Attempts observed before hedging starts.
+    """
+
+    enabled: bool = False
+    quantile: float = 0.95
+    min_samples: int = 20
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker shared by the requests of one extraction.
+
+    Closed: requests go through. Open: requests fail with CircuitOpenError until
+    `reset_timeout` has elapsed. Half-open: one trial request goes through; its
+    success closes the circuit and its failure opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failed attempts that open the circuit. Defaults to 5.
+        reset_timeout (float): Seconds the circuit stays open before a trial request. Defaults to 30.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half-open"."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def before_call(self) -> bool:
+        """
+        Let a request through, or refuse it while the circuit is open.
+
+        Returns:
+            bool: True if the request is the half-open trial. A trial that ends without an outcome
+            (e.g. cancelled) must be handed back with `release_trial`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial request running.
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return False
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return True
+        raise CircuitOpenError(
+            f"Circuit breaker open after {self.failures} consecutive failures; "
+            f"requests are refused for up to {self.reset_timeout:.0f}s."
+        )
+
+    def release_trial(self) -> None:
+        """Let another trial request through after the running one ended without an outcome."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failed attempt, opening the circuit at the threshold or after a failed trial."""
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or (self._opened_at is None and self.failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+                _circuit_opened.add(1)
+                logger.warning(f"API circuit breaker opened after {self.failures} consecutive failures.")
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent attempt latencies.
+
+    Args:
+        window (int): Number of latencies kept. Defaults to 200.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self._latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, seconds: float) -> None:
+        """Add the latency of one attempt."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return the `q` quantile of the recorded latencies (nearest rank), or None if none are recorded.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header, given in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): Header value.
+
+    Returns:
+        Optional[float]: Seconds to wait (0 for dates in the past), or None if missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class wait_retry_after:
+    """
+    Tenacity wait strategy honoring the Retry-After header of the last response, with a fallback strategy.
+
+    Args:
+        fallback (Callable[[RetryCallState], float]): Wait used when the server gave no Retry-After.
+        max_wait (float): Upper bound of the waits requested by the server.
+    """
+
+    def __init__(self, fallback: Callable[[RetryCallState], float], max_wait: float) -> None:
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        if outcome is not None and not outcome.failed:
+            retry_after = parse_retry_after(outcome.result().headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_wait)
+        return self.fallback(retry_state)
+
+
+class ResilientHTTP:
+    """
+    Retry, circuit-breaker and hedging wrapper around single API requests.
+
+    One instance is shared by the requests of an extraction, so that the breaker
+    and the latency window see all of them.
+
+    Args:
+        retry (Optional[RetryPolicy]): Retry settings. Defaults to RetryPolicy().
+        breaker (Optional[CircuitBreaker]): Circuit breaker, or None to disable it.
+        hedge (Optional[HedgePolicy]): Hedging settings. Defaults to HedgePolicy() (disabled).
+        sleep (Optional[Callable[[float], Any]]): Sleep function of the synchronous retries, mainly for testing.
+    """
+
+    def __init__(
+        self,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge: Optional[HedgePolicy] = None,
+        sleep: Optional[Callable[[float], Any]] = None,
+    ) -> None:
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker
+        self.hedge = hedge or HedgePolicy()
+        self.latencies = LatencyTracker()
+        self.stats = {"requests": 0, "attempts": 0, "retries": 0, "hedges": 0}
+        self._sleep = sleep or time.sleep
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> "ResilientHTTP":
+        """
+        Build the wrapper from the `retry`, `circuit_breaker` and `hedging` keys of the API configuration.
+
+        Args:
+            api_config (Dict[str, Any]): The `api` section of the configuration file.
+
+        Returns:
+            ResilientHTTP: The configured wrapper.
+        """
+        retry_config = dict(api_config.get("retry") or {})
+        if "statuses" in retry_config:
+            retry_config["statuses"] = tuple(retry_config["statuses"])
+        breaker_config = api_config.get("circuit_breaker") or {}
+        breaker = None if breaker_config.get("enabled") is False else CircuitBreaker(
+            breaker_config.get("failure_threshold", 5), breaker_config.get("reset_timeout", 30.0)
+        )
+        return cls(RetryPolicy(**retry_config), breaker, HedgePolicy(**(api_config.get("hedging") or {})))
+
+    def _retry_kwargs(self, url: str, exceptions: Sequence[Type[Exception]]) -> Dict[str, Any]:
+        """Build the tenacity arguments shared by the synchronous and asynchronous retry loops."""
+        policy = self.retry
+        backoff = wait_exponential_jitter(policy.backoff_initial, policy.backoff_max, jitter=policy.jitter)
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            outcome = retry_state.outcome
+            reason = type(outcome.exception()).__name__ if outcome.failed else str(outcome.result().status_code)
+            self.stats["retries"] += 1
+            _request_retries.add(1, {"reason": reason})
+            logger.warning(
+                f"API request to {url} failed ({reason}); retry {retry_state.attempt_number}/{policy.attempts - 1} "
+                f"in {retry_state.next_action.sleep:.1f}s."
+            )
+
+        return {
+            "stop": stop_after_attempt(policy.attempts),
+            "wait": wait_retry_after(backoff, policy.max_retry_after),
+            "retry": retry_if_exception_type(tuple(exceptions))
+            | retry_if_result(lambda response: response.status_code in policy.statuses),
+            "before_sleep": before_sleep,
+            "retry_error_callback": lambda retry_state: retry_state.outcome.result(),
+        }
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Return the latency after which an attempt is hedged, or None if hedging is off or not warmed up."""
+        if not self.hedge.enabled or len(self.latencies) < self.hedge.min_samples:
+            return None
+        return self.latencies.quantile(self.hedge.quantile)
+
+    def _check_breaker(self) -> bool:
+        """Pass the circuit breaker, returning True if the attempt is its half-open trial."""
+        return self.breaker is not None and self.breaker.before_call()
+
+    def _record(self, started: float, response: Any, error: Optional[BaseException]) -> None:
+        """Record the latency of an attempt and report its outcome to the circuit breaker."""
+        elapsed = time.perf_counter() - started
+        self.stats["attempts"] += 1
+        self.latencies.record(elapsed)
+        status = type(error).__name__ if error is not None else str(response.status_code)
+        _request_duration.record(elapsed, {"status": status})
+        if self.breaker is not None:
+            if error is not None or response.status_code in self.retry.statuses:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+
+    def _attempt(self, send: Callable[[], Any]) -> Any:
+        """Send one synchronous attempt through the circuit breaker."""
+        trial = self._check_breaker()
+        started = time.perf_counter()
+        try:
+            response = send()
+        except Exception as e:
+            self._record(started, None, e)
+            raise
+        except BaseException:
+            if trial:
+                self.breaker.release_trial()
+            raise
+        self._record(started, response, None)
+        return response
+
+    def _hedged_attempt(self, send: Callable[[], Any]) -> Any:
+        """Send a synchronous attempt, and a second copy if it is slower than the hedging delay."""
+        delay = self._hedge_delay()
+        if delay is None:
+            return self._attempt(send)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api-hedge")
+        pending = {self._executor.submit(self._attempt, send)}
+        done, pending = wait_futures(pending, timeout=delay)
+        if not done:
+            self.stats["hedges"] += 1
+            _request_hedges.add(1)
+            pending.add(self._executor.submit(self._attempt, send))
+        while True:
+            done, pending = wait_futures(done | pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is not None or not pending:
+                # The slower copy keeps running in the background; its result is ignored
+                return (winner or done.pop()).result()
+            done = set()
+
+    def get(
+        self, send: Callable[[], Any], url: str = "", exceptions: Sequence[Type[Exception]] = SYNC_RETRY_EXCEPTIONS
+    ) -> Any:
+        """
+        Send an idempotent request with retries, the circuit breaker and optional hedging.
+
+        Args:
+            send (Callable[[], Any]): Sends one attempt and returns the response (e.g. a `requests.get` call).
+            url (str): URL of the request, for logging.
+            exceptions (Sequence[Type[Exception]]): Exceptions that are retried. Defaults to the
+                connection errors and timeouts of requests.
+
+        Returns:
+            Any: The first successful or non-retryable response, or the last response once the
+            attempts are exhausted.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker refuses the request.
+            Exception: The last error of `send` once the attempts are exhausted.
+        """
+        self.stats["requests"] += 1
+        retrying = Retrying(sleep=self._sleep, **self._retry_kwargs(url, exceptions))
+        return retrying(self._hedged_attempt, send)
+
+    async def _aattempt(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send one asynchronous attempt through the circuit breaker."""
+        trial = self._check_breaker()
+        started = time.perf_counter()
+        try:
+            response = await send()
+        except Exception as e:
+            self._record(started, None, e)
+            raise
+        except BaseException:
+            # Cancelled, e.g. as the losing copy of a hedged request: the trial had no outcome
+            if trial:
+                self.breaker.release_trial()
+            raise
+        self._record(started, response, None)
+        return response
+
+    async def _ahedged_attempt(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send an asynchronous attempt, and a second copy if it is slower than the hedging delay."""
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._aattempt(send)
+        pending = {asyncio.ensure_future(self._aattempt(send))}
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if not done:
+            self.stats["hedges"] += 1
+            _request_hedges.add(1)
+            pending.add(asyncio.ensure_future(self._aattempt(send)))
+        try:
+            while True:
+                done, pending = await asyncio.wait(done | pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None or not pending:
+                    return (winner or done.pop()).result()
+                done = set()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aget(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        url: str = "",
+        exceptions: Sequence[Type[Exception]] = ASYNC_RETRY_EXCEPTIONS,
+    ) -> Any:
+        """
+        Asynchronous `get`, for coroutines sending the request (e.g. an `httpx.AsyncClient.get` call).
+
+        Args:
+            send (Callable[[], Awaitable[Any]]): Sends one attempt and returns the response.
+            url (str): URL of the request, for logging.
+            exceptions (Sequence[Type[Exception]]): Exceptions that are retried. Defaults to the
+                transport errors (connection errors and timeouts) of httpx.
+
+        Returns:
+            Any: The first successful or non-retryable response, or the last response once the
+            attempts are exhausted.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker refuses the request.
+            Exception: The last error of `send` once the attempts are exhausted.
+        """
+        self.stats["requests"] += 1
+        retrying = AsyncRetrying(**self._retry_kwargs(url, exceptions))
+        return await retrying(self._ahedged_attempt, send)
+
+    def log_summary(self) -> None:
+        """Log the request, retry and hedge counts with the p50/p95 attempt latencies."""
+        if not self.stats["requests"]:
+            return
+        p50, p95 = self.latencies.quantile(0.5), self.latencies.quantile(0.95)
+        logger.info(
+            f"API requests: {self.stats['requests']} ({self.stats['attempts']} attempts, "
+            f"{self.stats['retries']} retries, {self.stats['hedges']} hedged); "
+            f"latency p50 {(p50 or 0) * 1000:.0f} ms, p95 {(p95 or 0) * 1000:.0f} ms."
+        )
+
+    def close(self) -> None:
+        """Release the hedging threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -3,23 +3,32 @@ Module: api_saver
 Provides functions to save API data into a SQL Server database using pyodbc.
 
 This module uses SQLDatabaseConnector for database interactions.
-It can create tables dynamically (simple template) and insert data from pandas DataFrames.
+It can create tables dynamically, with column types inferred from the data, and bulk insert data from pandas DataFrames.
 
 Dependencies:
     - pandas: For data handling.
     - loguru: For structured logging.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional
 import pandas as pd
-from src.db.db_connector import SQLDatabaseConnector
+from src.db.db_connector import DEFAULT_BATCH_SIZE, SQLDatabaseConnector
+from src.db.parallel_loader import parallel_bulk_insert
+from src.db.schema import infer_schema
 from src.utils.logger import logger
+from src.utils.metrics import trace_span
 
 
 def save_api(
     df: pd.DataFrame,
     sql_connector: SQLDatabaseConnector,
-    table_name: str = "api_demo"
+    table_name: str = "api_demo",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    partitions: int = 1,
+    mode: str = "replace",
+    column_types: Optional[Dict[str, str]] = None,
+    key_columns: Optional[List[str]] = None,
+    delete_missing: bool = False,
 ) -> None:
     """
     Save a pandas DataFrame into a SQL Server table.
@@ -28,6 +37,16 @@ def save_api(
         df (pd.DataFrame): DataFrame containing the data to save.
         sql_connector (SQLDatabaseConnector): Connected database connector instance.
         table_name (str): Name of the target table in SQL Server. Defaults to "api_demo".
+        batch_size (int): Number of rows sent per batch during the bulk insert. Defaults to 1000.
+        partitions (int): Number of partitions loaded concurrently on separate connections.
+            Values above 1 enable the parallel mode. Defaults to 1.
+        mode (str): "replace" drops and recreates the table before loading; "append" keeps
+            existing rows, e.g. for incremental loads; "upsert" merges rows by `key_columns`
+            through a staging table in a single transaction. Defaults to "replace".
+        column_types (Optional[Dict[str, str]]): SQL type overrides for this table by column name,
+            e.g. {"Description": "NVARCHAR(500)"}. Other column types are inferred from the data.
+        key_columns (Optional[List[str]]): Business-key columns used by the "upsert" mode.
+        delete_missing (bool): In "upsert" mode, delete rows whose keys are no longer present. Defaults to False.
 
     Raises:
         ValueError: If DataFrame is empty.
@@ -38,22 +57,47 @@ def save_api(
         return
 
     try:
-        logger.info(f"Starting to save data to table: {table_name}")
-
-        # Create table dynamically (simple template)
-        columns = ", ".join([f"[{col}] NVARCHAR(MAX)" for col in df.columns])
-        create_table_sql = (
-            f"IF OBJECT_ID('{table_name}', 'U') IS NOT NULL DROP TABLE {table_name};"
-            f"CREATE TABLE {table_name} ({columns});"
-        )
-        sql_connector.execute_query(create_table_sql)
-        logger.debug(f"Table {table_name} created successfully.")
-
-        # Insert rows
-        insert_sql = f"INSERT INTO {table_name} VALUES ({', '.join(['?'] * len(df.columns))})"
-        for _, row in df.iterrows():
-            sql_connector.execute_query(insert_sql, params=list(row))
-        logger.success(f"Data saved successfully to table {table_name}")
+        with trace_span("save_api", **{"db.table": table_name, "db.rows": len(df), "etl.load_mode": mode}):
+            logger.info(f"Starting to save data to table: {table_name}")
+
+            schema = infer_schema(df, column_types)
+
+            # Merge by business key without emptying the table
+            if mode == "upsert":
+                if partitions > 1:
+                    logger.warning("Upsert mode loads through a single connection; partitions are ignored.")
+                sql_connector.upsert(
+                    table_name,
+                    df,
+                    key_columns or [],
+                    batch_size=batch_size,
+                    schema=schema,
+                    delete_missing=delete_missing,
+                )
+                logger.success(f"Data upserted successfully into table {table_name}")
+                return
+
+            # Create table dynamically with inferred column types
+            sql_connector.create_table(table_name, df, if_exists=mode, schema=schema)
+            logger.debug("Table {} created successfully.", table_name)
+
+            # Insert rows in batches, optionally in parallel partitions
+            if partitions > 1:
+                result = parallel_bulk_insert(
+                    sql_connector,
+                    table_name,
+                    df,
+                    partitions=partitions,
+                    batch_size=batch_size,
+                    schema=schema,
+                )
+                if not result.success:
+                    raise RuntimeError(
+                        f"Partitions {result.failed_partitions} failed to load into {table_name}."
+                    )
+            else:
+                sql_connector.bulk_insert(table_name, df, batch_size=batch_size, schema=schema)
+            logger.success(f"Data saved successfully to table {table_name}")
 
     except Exception as e:
         logger.exception(f"Failed to save data to table {table_name}: {e}")
@@ -12,6 +12,8 @@ Dependencies:
 """
 
 import pandas as pd
+from src.utils.cleaning import clean_frame
+from src.utils.dtypes import normalize_dtypes
 from src.utils.logger import logger
 
 
@@ -20,7 +22,8 @@ def transform_api(df: pd.DataFrame) -> pd.DataFrame:
     Transform and clean API data.
 
     This function removes duplicate rows, handles missing values in key columns,
-    and logs the number of valid records after transformation.
+    converts the columns to compact dtypes (see `src.utils.dtypes`), and logs the
+    number of valid records after transformation.
 
     Args:
         df (pd.DataFrame): Raw data extracted from the API.
@@ -38,17 +41,23 @@ def transform_api(df: pd.DataFrame) -> pd.DataFrame:
     try:
         logger.info("Starting API data transformation...")
 
-        # Remove duplicate rows
-        df_clean = df.drop_duplicates()
-
         # Drop rows with missing values in important columns
         required_columns = ["API", "Description"]
-        missing_cols = [col for col in required_columns if col not in df_clean.columns]
+        missing_cols = [col for col in required_columns if col not in df.columns]
         if missing_cols:
             logger.warning(f"Missing expected columns: {missing_cols}. They will be skipped in cleaning.")
 
-        cols_to_check = [col for col in required_columns if col in df_clean.columns]
-        df_clean = df_clean.dropna(subset=cols_to_check)
+        # Remove duplicate rows and rows missing required values in a single pass
+        cols_to_check = [col for col in required_columns if col in df.columns]
+        df_clean = clean_frame(df, required_columns=cols_to_check)
+
+        # Compact dtypes (see src.utils.dtypes)
+        df_clean, report = normalize_dtypes(df_clean, pipeline="api")
+        logger.debug("API data memory by column:\n{}", report)
+        logger.info(
+            f"API data memory: {report['bytes_before'].sum() / 1e6:.1f} MB -> "
+            f"{report['bytes_after'].sum() / 1e6:.1f} MB."
+        )
 
         logger.info(f"API data transformation completed: {len(df_clean)} valid records retained.")
         return df_clean
@@ -0,0 +1,180 @@
+"""
+Module: batch_extract
+Provides parallel extraction of many bot output files (Excel workbooks and CSVs).
+
+Every matching file is read in its own worker process, because Excel parsing
+is CPU-bound and would be serialized by the GIL in threads. All sheets of a
+workbook are read, and each row is tagged with its source file and sheet.
+Results are combined in a deterministic order (files sorted by path, sheets
+in workbook order) regardless of which worker finishes first. A file that
+fails to parse is reported and skipped without aborting the batch.
+
+Dependencies:
+    - pandas: For reading files and combining frames.
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> df, failures = extract_bot_files("data/*.xlsx", max_workers=4)
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from src.bot.extract.excel_cache import DEFAULT_CACHE_DIR, ExcelCache, default_engine
+from src.utils.logger import logger
+
+SUPPORTED_SUFFIXES = (".xlsx", ".xlsm", ".xls", ".csv")
+SOURCE_FILE_COLUMN = "source_file"
+SOURCE_SHEET_COLUMN = "source_sheet"
+_GLOB_CHARS = ("*", "?", "[")
+
+
+@dataclass
+class SourceFailure:
+    """
+    A file that could not be extracted.
+
+    Attributes:
+        path (str): Path of the file.
+        error (str): Error message.
+    """
+
+    path: str
+    error: str
+
+
+def is_batch_source(file_path: str) -> bool:
+    """
+    Tell whether a path designates several files (a directory or a glob pattern).
+
+    Args:
+        file_path (str): Path given to `extract_bot`.
+
+    Returns:
+        bool: True for directories and glob patterns.
+    """
+    return os.path.isdir(file_path) or any(char in file_path for char in _GLOB_CHARS)
+
+
+def resolve_sources(file_path: str) -> List[str]:
+    """
+    List the supported files designated by a directory, a glob pattern or a single path.
+
+    Args:
+        file_path (str): Directory, glob pattern (e.g. "data/**/*.xlsx") or file path.
+
+    Returns:
+        List[str]: Matching file paths, sorted. Excel lock files ("~$...") are skipped.
+    """
+    if os.path.isdir(file_path):
+        candidates = [str(path) for path in Path(file_path).iterdir()]
+    elif any(char in file_path for char in _GLOB_CHARS):
+        candidates = glob.glob(file_path, recursive=True)
+    else:
+        candidates = [file_path]
+    return sorted(
+        path
+        for path in candidates
+        if os.path.isfile(path)
+        and path.lower().endswith(SUPPORTED_SUFFIXES)
+        and not os.path.basename(path).startswith("~$")
+    )
+
+
+def read_source(file_path: str, cache: Optional[ExcelCache] = None) -> List[Tuple[Optional[str], pd.DataFrame]]:
+    """
+    Read every sheet of a workbook, or a CSV file.
+
+    Runs in a worker process, so it only takes picklable arguments. The workbook is opened once,
+    and every sheet is parsed from it.
+
+    Args:
+        file_path (str): Path of the file.
+        cache (Optional[ExcelCache]): Cache to read Excel workbooks through. Defaults to None (no cache).
+
+    Returns:
+        List[Tuple[Optional[str], pd.DataFrame]]: (sheet name, frame) pairs in workbook order.
+            The sheet name is None for CSV files.
+    """
+    if file_path.lower().endswith(".csv"):
+        return [(None, pd.read_csv(file_path))]
+    if cache is not None:
+        return cache.read_workbook(file_path)
+    with pd.ExcelFile(file_path, engine=default_engine()) as workbook:
+        return [(sheet, workbook.parse(sheet)) for sheet in workbook.sheet_names]
+
+
+def extract_bot_files(
+    file_path: str,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    cache: Optional[ExcelCache] = None,
+) -> Tuple[pd.DataFrame, List[SourceFailure]]:
+    """
+    Read all files and sheets matching a directory or glob pattern in parallel.
+
+    Args:
+        file_path (str): Directory, glob pattern or file path.
+        max_workers (Optional[int]): Number of worker processes. Defaults to the CPU count,
+            capped by the number of files. 1 reads the files in the current process.
+        use_cache (bool): Whether to read Excel sheets through the Parquet cache. Defaults to True.
+        cache_dir (str): Directory of the Excel cache, used when no `cache` is given.
+        cache (Optional[ExcelCache]): Cache of parsed workbooks. Worker processes use a copy of it, so
+            its hit counters are only updated when the files are read in the current process.
+
+    Returns:
+        Tuple[pd.DataFrame, List[SourceFailure]]: The combined rows, tagged with `source_file` and
+            `source_sheet`, and the files that failed.
+
+    Raises:
+        FileNotFoundError: If no supported file matches.
+    """
+    sources = resolve_sources(file_path)
+    if not sources:
+        logger.error(f"No supported files found for: {file_path}")
+        raise FileNotFoundError(f"No {', '.join(SUPPORTED_SUFFIXES)} files match {file_path}.")
+
+    cache = (cache or ExcelCache(cache_dir=cache_dir)) if use_cache else None
+    workers = min(max_workers or os.cpu_count() or 1, len(sources))
+    logger.info(f"Extracting {len(sources)} files from {file_path} with {workers} worker(s).")
+    start = time.perf_counter()
+
+    outcomes = []
+    if workers == 1:
+        for source in sources:
+            try:
+                outcomes.append(read_source(source, cache))
+            except Exception as e:
+                outcomes.append(e)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(read_source, source, cache) for source in sources]
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+
+    frames, failures = [], []
+    for source, outcome in zip(sources, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Failed to extract {source}: {outcome}")
+            failures.append(SourceFailure(source, str(outcome)))
+            continue
+        for sheet, df in outcome:
+            frames.append(df.assign(**{SOURCE_FILE_COLUMN: source, SOURCE_SHEET_COLUMN: sheet}))
+
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    logger.info(
+        f"Extracted {len(combined)} rows from {len(sources) - len(failures)}/{len(sources)} files "
+        f"in {time.perf_counter() - start:.2f}s."
+    )
+    return combined, failures
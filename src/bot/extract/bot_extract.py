@@ -4,41 +4,111 @@ Provides functions to extract data using RPA techniques (e.g., Selenium) or read
 
 This module supports multiple extraction strategies:
     - Reading data from Excel/CSV files
+    - Reading every file and sheet of a directory or glob pattern in parallel
     - Future extension to web scraping or automation via Selenium
 
 Dependencies:
     - pandas: For data handling and conversion.
     - loguru: For structured logging.
     - openpyxl / xlrd: For reading Excel files.
+    - python-calamine (optional): Faster Excel reader engine.
+
+Parsed workbooks are cached as Parquet (see `src.bot.extract.excel_cache`), so
+retries and reruns on an unchanged file skip the Excel parsing.
 """
 
 import pandas as pd
-from typing import Optional
+from datetime import date
+from numbers import Number
+from typing import Any, Optional
+from src.bot.extract.batch_extract import SOURCE_FILE_COLUMN, extract_bot_files, is_batch_source
+from src.bot.extract.excel_cache import ExcelCache
+from src.utils.dtypes import normalize_dtypes
 from src.utils.logger import logger
 import os
 
 
-def extract_bot(file_path: str = "data/bot_data.xlsx") -> pd.DataFrame:
+def _newer_than(df: pd.DataFrame, watermark_column: str, since: Any) -> pd.DataFrame:
+    """
+    Keep the rows whose watermark column is greater than the last committed watermark.
+
+    The watermark was taken from the transformed frame, while the raw column may still hold
+    strings (CSV files, text dates in Excel). The column is first normalized as the bot
+    transform does, then coerced to the watermark's type; values that cannot be compared
+    are dropped.
+
+    Args:
+        df (pd.DataFrame): Raw extracted data.
+        watermark_column (str): Column compared against `since`.
+        since (Any): Last committed watermark (timestamp, number or string).
+
+    Returns:
+        pd.DataFrame: The rows above the watermark.
+    """
+    normalized, _ = normalize_dtypes(df[[watermark_column]], pipeline="bot")
+    values = normalized[watermark_column]
+    if isinstance(since, date):
+        values = pd.to_datetime(values, errors="coerce")
+    elif isinstance(since, Number):
+        values = pd.to_numeric(values, errors="coerce")
+    else:
+        values = values.astype("string")
+    return df[(values > since).fillna(False).to_numpy(dtype=bool)]
+
+
+def extract_bot(
+    file_path: str = "data/bot_data.xlsx",
+    since: Any = None,
+    watermark_column: Optional[str] = None,
+    cache: Optional[ExcelCache] = None,
+    use_cache: bool = True,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Extract data using a bot simulation (RPA) or from a local file.
 
     Args:
-        file_path (str): Path to the input file (Excel). Defaults to "data/bot_data.xlsx".
+        file_path (str): Path to the input file (Excel), or a directory / glob pattern (e.g. "data/*.xlsx")
+            whose workbooks and CSVs are all read in parallel and tagged with `source_file` and
+            `source_sheet`. Defaults to "data/bot_data.xlsx".
+        since (Any): Watermark of the last successful load. Only rows with `watermark_column`
+            greater than it are returned. Defaults to None (all rows).
+        watermark_column (Optional[str]): Column compared against `since`. Defaults to None.
+        cache (Optional[ExcelCache]): Cache of parsed workbooks. Defaults to a cache in "output/.cache/excel".
+        use_cache (bool): Whether to serve unchanged workbooks from the cache. Defaults to True.
+        max_workers (Optional[int]): Worker processes for directory / glob sources. Defaults to the CPU count.
 
     Returns:
         pd.DataFrame: Extracted data as a DataFrame. Returns empty DataFrame if file is not found.
 
     Raises:
-        FileNotFoundError: If the specified file does not exist.
-        ValueError: If the file content cannot be read properly.
+        FileNotFoundError: If the specified file does not exist, or no file matches the pattern.
+        ValueError: If the file content cannot be read properly, or every matching file failed.
     """
     try:
-        if not os.path.exists(file_path):
+        if is_batch_source(file_path):
+            df, failures = extract_bot_files(
+                file_path, max_workers=max_workers, use_cache=use_cache, cache=cache
+            )
+            if failures and SOURCE_FILE_COLUMN not in df.columns:
+                raise ValueError(f"All {len(failures)} files matching {file_path} failed to extract.")
+            if failures:
+                logger.warning(
+                    f"{len(failures)} files skipped: {', '.join(failure.path for failure in failures)}"
+                )
+        elif not os.path.exists(file_path):
             logger.error(f"File not found: {file_path}")
             raise FileNotFoundError(f"The file {file_path} does not exist.")
+        else:
+            logger.info(f"Starting bot data extraction from file: {file_path}")
+            if use_cache:
+                df = (cache or ExcelCache()).read_excel(file_path)
+            else:
+                df = pd.read_excel(file_path)
 
-        logger.info(f"Starting bot data extraction from file: {file_path}")
-        df = pd.read_excel(file_path)
+        if since is not None and watermark_column:
+            df = _newer_than(df, watermark_column, since)
+            logger.info(f"Incremental extraction: keeping rows with {watermark_column} > {since}.")
         logger.info(f"Extraction completed successfully: {len(df)} records retrieved.")
 
         return df
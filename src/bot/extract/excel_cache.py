@@ -0,0 +1,265 @@
+"""
+Module: excel_cache
+Provides a local Parquet cache of parsed Excel sheets for the bot extraction.
+
+Parsing a workbook with openpyxl is the slowest step of the bot pipeline, and
+the same file is often read again by retries and reruns. `ExcelCache` stores
+each parsed sheet as a Parquet file (pickle when no Parquet engine is
+installed), together with a small JSON metadata file holding the source
+size, mtime, content hash and the time the original parse took:
+    - size and mtime unchanged         -> served from the cache
+    - size or mtime changed, same hash -> served from the cache (e.g. file copied or touched)
+    - content changed                  -> parsed again and the entry is replaced
+
+Workbooks are parsed with the calamine engine when `python-calamine` is
+installed (pandas >= 2.2), which is several times faster than openpyxl.
+
+Dependencies:
+    - pandas: For Excel parsing and DataFrame handling.
+    - loguru: For structured logging.
+    - python-calamine (optional): Faster Excel reader engine.
+
+Usage Example:
+    >>> cache = ExcelCache()
+    >>> df = cache.read_excel("data/bot_data.xlsx")
+    >>> sheets = cache.read_workbook("data/bot_data.xlsx")
+    >>> cache.seconds_saved
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from src.utils.frame_io import FRAME_SUFFIX, read_frame, write_frame
+from src.utils.logger import logger
+
+DEFAULT_CACHE_DIR = "output/.cache/excel"
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+_HASH_CHUNK_SIZE = 1024 * 1024
+# Cache key of the entry listing the sheets of a workbook, distinct from any sheet name or position
+_SHEET_INDEX = "::sheets"
+
+
+def default_engine() -> Optional[str]:
+    """
+    Return the fastest Excel engine available.
+
+    Returns:
+        Optional[str]: "calamine" when python-calamine is installed, otherwise None (pandas' default).
+    """
+    return "calamine" if CALAMINE_AVAILABLE else None
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Compute the BLAKE2b digest of a file's content, reading it in chunks.
+
+    Args:
+        path (Union[str, Path]): File to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExcelCache:
+    """
+    Cache of parsed Excel sheets keyed by file path, sheet, size, mtime and content hash.
+
+    Args:
+        cache_dir (str): Directory holding cached frames. Defaults to "output/.cache/excel".
+        engine (Optional[str]): pandas Excel engine. Defaults to calamine when available.
+
+    Attributes:
+        hits (int): Reads served from the cache.
+        misses (int): Reads that parsed the workbook.
+        seconds_saved (float): Parse time avoided by cache hits, net of the cache read time.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, engine: Optional[str] = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.engine = engine or default_engine()
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+
+    def _entry_paths(self, file_path: Path, sheet_name: Union[str, int]) -> Tuple[Path, Path]:
+        """Return the frame and metadata paths of a (file, sheet) entry."""
+        key = hashlib.sha1(f"{file_path.resolve()}::{sheet_name}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}{FRAME_SUFFIX}", self.cache_dir / f"{key}.json"
+
+    def _read_meta(self, meta_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_meta(self, meta_path: Path, meta: Dict[str, Any]) -> None:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = meta_path.with_name(f".{meta_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+
+    def _is_fresh(self, file_path: Path, stat: os.stat_result, meta: Optional[Dict[str, Any]], frame_path: Path) -> bool:
+        """
+        Tell whether a cached entry still matches the source file, refreshing its size/mtime if only those changed.
+        """
+        if not meta or not frame_path.exists():
+            return False
+        if meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        if meta["size"] != stat.st_size or meta["content_hash"] != file_digest(file_path):
+            return False
+        meta.update(mtime_ns=stat.st_mtime_ns)
+        return True
+
+    def _lookup(self, file_path: Path, stat: os.stat_result, sheet_name: Union[str, int]) -> Optional[pd.DataFrame]:
+        """
+        Return a cached sheet if its entry still matches the workbook, recording the hit.
+
+        Returns:
+            Optional[pd.DataFrame]: The cached sheet, or None if it must be parsed.
+        """
+        frame_path, meta_path = self._entry_paths(file_path, sheet_name)
+        meta = self._read_meta(meta_path)
+        if not self._is_fresh(file_path, stat, meta, frame_path):
+            return None
+
+        start = time.perf_counter()
+        try:
+            df = read_frame(frame_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Excel cache entry for {file_path}: {e}")
+            return None
+        self._write_meta(meta_path, meta)
+        saved = max(meta["parse_seconds"] - (time.perf_counter() - start), 0.0)
+        self.hits += 1
+        self.seconds_saved += saved
+        logger.info(f"Excel cache hit for {file_path} (sheet {sheet_name}): saved {saved:.2f}s of parsing.")
+        return df
+
+    def _store(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        sheet_name: Union[str, int],
+        df: pd.DataFrame,
+        parse_seconds: float,
+        content_hash: str,
+    ) -> None:
+        """Cache a parsed sheet. Frames that cannot be written are logged and left uncached."""
+        frame_path, meta_path = self._entry_paths(file_path, sheet_name)
+        try:
+            write_frame(df, frame_path)
+            self._write_meta(
+                meta_path,
+                {
+                    "source": str(file_path.resolve()),
+                    "sheet_name": sheet_name,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "content_hash": content_hash,
+                    "parse_seconds": parse_seconds,
+                },
+            )
+        except Exception as e:
+            # Mixed-type columns can't always be written as Parquet; the data is still returned
+            logger.warning(f"Could not cache parsed sheet of {file_path}: {e}")
+
+    def read_excel(self, file_path: Union[str, Path], sheet_name: Union[str, int] = 0, **kwargs: Any) -> pd.DataFrame:
+        """
+        Read an Excel sheet, serving it from the cache when the workbook has not changed.
+
+        Args:
+            file_path (Union[str, Path]): Path of the workbook.
+            sheet_name (Union[str, int]): Sheet name or position. Defaults to the first sheet.
+            **kwargs (Any): Extra keyword arguments for `pd.read_excel`. They are not part of the cache key.
+
+        Returns:
+            pd.DataFrame: The parsed sheet.
+
+        Raises:
+            FileNotFoundError: If the workbook does not exist.
+        """
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        df = self._lookup(file_path, stat, sheet_name)
+        if df is not None:
+            return df
+
+        self.misses += 1
+        start = time.perf_counter()
+        df = pd.read_excel(file_path, sheet_name=sheet_name, engine=self.engine, **kwargs)
+        parse_seconds = time.perf_counter() - start
+        logger.debug(f"Parsed {file_path} (sheet {sheet_name}) in {parse_seconds:.2f}s with engine {self.engine or 'default'}.")
+        self._store(file_path, stat, sheet_name, df, parse_seconds, file_digest(file_path))
+        return df
+
+    def read_workbook(self, file_path: Union[str, Path], **kwargs: Any) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Read every sheet of a workbook, serving them from the cache when the workbook has not changed.
+
+        The sheet names are cached with the sheets, so a hit does not open the workbook. On a miss,
+        the workbook is opened once and every sheet is parsed from it.
+
+        Args:
+            file_path (Union[str, Path]): Path of the workbook.
+            **kwargs (Any): Extra keyword arguments for `ExcelFile.parse`. They are not part of the cache key.
+
+        Returns:
+            List[Tuple[str, pd.DataFrame]]: (sheet name, frame) pairs in workbook order.
+
+        Raises:
+            FileNotFoundError: If the workbook does not exist.
+        """
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        _, index_path = self._entry_paths(file_path, _SHEET_INDEX)
+        index = self._read_meta(index_path)
+        if self._is_fresh(file_path, stat, index, index_path):
+            cached = [(sheet, self._lookup(file_path, stat, sheet)) for sheet in index["sheets"]]
+            if all(df is not None for _, df in cached):
+                self._write_meta(index_path, index)
+                return cached
+
+        self.misses += 1
+        content_hash = file_digest(file_path)
+        sheets = []
+        with pd.ExcelFile(file_path, engine=self.engine) as workbook:
+            for sheet in workbook.sheet_names:
+                start = time.perf_counter()
+                df = workbook.parse(sheet, **kwargs)
+                parse_seconds = time.perf_counter() - start
+                self._store(file_path, stat, sheet, df, parse_seconds, content_hash)
+                sheets.append((sheet, df))
+        logger.debug(f"Parsed {len(sheets)} sheets of {file_path} with engine {self.engine or 'default'}.")
+        self._write_meta(
+            index_path,
+            {
+                "sheets": [sheet for sheet, _ in sheets],
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "content_hash": content_hash,
+            },
+        )
+        return sheets
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.iterdir():
+            if path.is_file():
+                path.unlink()
+        logger.info(f"Excel cache cleared: {self.cache_dir}")
@@ -4,7 +4,8 @@ Provides functions to transform and clean data extracted via RPA (bot).
 
 This module applies standard data cleaning procedures such as:
     - Removing duplicates
-    - Handling missing values
+    - Normalizing dtypes (compact numerics, categoricals, parsed dates), with
+      missing values kept as nullable values instead of placeholders
     - Logging transformations
 It ensures data is ready for insertion into a database.
 
@@ -14,6 +15,8 @@ Dependencies:
 """
 
 import pandas as pd
+from src.utils.cleaning import clean_frame
+from src.utils.dtypes import normalize_dtypes
 from src.utils.logger import logger
 
 
@@ -21,8 +24,8 @@ def transform_bot(df: pd.DataFrame) -> pd.DataFrame:
     """
     Transform and clean bot-extracted data.
 
-    This function removes duplicate rows, fills missing values,
-    and logs the number of valid records after transformation.
+    This function removes duplicate rows, converts the columns to compact dtypes
+    (see `src.utils.dtypes`), and logs the number of valid records and the memory saved.
 
     Args:
         df (pd.DataFrame): Raw data extracted by the bot.
@@ -40,11 +43,16 @@ def transform_bot(df: pd.DataFrame) -> pd.DataFrame:
     try:
         logger.info("Starting bot data transformation...")
 
-        # Remove duplicate rows
-        df_clean = df.drop_duplicates()
+        # Remove duplicate rows in a single pass
+        df_clean = clean_frame(df)
 
-        # Fill missing values with placeholder
-        df_clean = df_clean.fillna("N/A")
+        # Compact dtypes; missing values stay nullable instead of "N/A" placeholders
+        df_clean, report = normalize_dtypes(df_clean, pipeline="bot")
+        logger.debug("Bot data memory by column:\n{}", report)
+        logger.info(
+            f"Bot data memory: {report['bytes_before'].sum() / 1e6:.1f} MB -> "
+            f"{report['bytes_after'].sum() / 1e6:.1f} MB."
+        )
 
         logger.info(f"Bot data transformation completed: {len(df_clean)} valid records retained.")
         return df_clean
@@ -6,12 +6,35 @@ This module defines a generic ETL pipeline base class that can be
 extended for specific data sources (API, RPA/Bot, CSV, etc.).
 It includes structured logging, standardized method signatures, 
 and a template for extract, transform, and load processes.
+
+Pipelines run in one of two modes:
+    - Batch: `extract` returns a single DataFrame (the default).
+    - Streaming: `extract` returns an iterator of DataFrame chunks, and
+      `transform`/`load` are applied chunk by chunk so that peak memory
+      depends on the chunk size instead of the dataset size.
+
+With a `state_store` and a `watermark_column`, pipelines run incrementally:
+the last committed high-water mark is exposed as `self.watermark` for
+`extract` to request only newer records, and it is advanced only after
+`load` succeeds, so a failed run is retried from the same point.
+
+With a `checkpoints` store, the output of extract and transform is persisted
+per run (see `src.core.checkpoint`), and a retry of the same run skips every
+stage whose artefact is still valid.
+
+Every stage is instrumented (see `src.utils.metrics`): wall and CPU time, rows
+in/out, rows/sec, output bytes and peak RSS are recorded in `self.metrics` and
+emitted as OpenTelemetry spans nested under one span per run.
 """
 
 import pandas as pd
 from abc import ABC, abstractmethod
 from loguru import logger
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.core.checkpoint import CheckpointStore, default_run_id, hash_frame, hash_inputs
+from src.core.state_store import StateStore
+from src.utils.metrics import StageMetrics, instrument_stage, trace_span
 
 
 class BaseETL(ABC):
@@ -20,26 +43,55 @@ class BaseETL(ABC):
 
     Attributes:
         name (str): Name of the ETL process.
-        data (Optional[pd.DataFrame]): Data loaded and processed during the ETL pipeline.
+        data (Optional[Union[pd.DataFrame, Dict[str, Any]]]): Data loaded and processed during the ETL pipeline
+            in batch mode, or summary statistics of the run in streaming mode.
+        chunk_index (Optional[int]): Index of the chunk being processed in streaming mode, None otherwise.
+        state_store (Optional[StateStore]): Store of the pipeline watermark for incremental runs.
+        watermark_column (Optional[str]): Column whose maximum loaded value becomes the next watermark.
+        watermark (Any): Last committed watermark, loaded at the start of `run`. None on a full load.
+        checkpoints (Optional[CheckpointStore]): Store of stage artefacts used to resume failed runs.
+        run_id (str): Identifier of the run the checkpoints belong to.
+        metrics (List[StageMetrics]): Measurements of the stages of the last run.
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(
+        self,
+        name: str,
+        state_store: Optional[StateStore] = None,
+        watermark_column: Optional[str] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
         """
         Initialize the BaseETL instance.
 
         Args:
             name (str): A descriptive name for the ETL process.
+            state_store (Optional[StateStore]): Store used to persist the watermark. Defaults to None (full loads).
+            watermark_column (Optional[str]): Monotonic column (timestamp or ID) tracked as watermark. Defaults to None.
+            checkpoints (Optional[CheckpointStore]): Store of stage artefacts. Defaults to None (no checkpoints).
+            run_id (Optional[str]): Run identifier; retries must reuse it to resume. Defaults to the Airflow
+                DAG run ID, or a new ID outside Airflow (no resume).
         """
         self.name = name
-        self.data: Optional[pd.DataFrame] = None
+        self.data: Optional[Union[pd.DataFrame, Dict[str, Any]]] = None
+        self.chunk_index: Optional[int] = None
+        self.state_store = state_store
+        self.watermark_column = watermark_column
+        self.watermark: Any = None
+        self.checkpoints = checkpoints
+        self.run_id = run_id or default_run_id()
+        self._stage_hash: Optional[str] = None
+        self.metrics: List[StageMetrics] = []
 
     @abstractmethod
-    def extract(self) -> pd.DataFrame:
+    def extract(self) -> Union[pd.DataFrame, Iterable[pd.DataFrame]]:
         """
         Extract data from the source system.
 
         Returns:
-            pd.DataFrame: Raw data extracted from the source.
+            Union[pd.DataFrame, Iterable[pd.DataFrame]]: Raw data extracted from the source,
+                either as a single DataFrame or as an iterable of DataFrame chunks (streaming mode).
         """
         pass
 
@@ -61,37 +113,217 @@ class BaseETL(ABC):
         """
         Load the transformed data into the target system.
 
+        In streaming mode this is called once per chunk; `self.chunk_index` tells
+        the first chunk (0) apart from the following ones, e.g. to create the
+        target table only once.
+
         Args:
             df (pd.DataFrame): Transformed data to load.
         """
         pass
 
+    def checkpoint_inputs(self) -> Dict[str, Any]:
+        """
+        Describe the inputs of `extract`, used to key its checkpoint.
+
+        Override to add anything that changes what `extract` returns, e.g. a source
+        file's mtime or the request parameters.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable inputs. Defaults to the name and the watermark.
+        """
+        return {"name": self.name, "watermark": self.watermark}
+
+    def _extract_stage(self) -> Union[pd.DataFrame, Iterable[pd.DataFrame]]:
+        """
+        Run `extract`, or reuse its checkpoint when the inputs did not change.
+
+        Returns:
+            Union[pd.DataFrame, Iterable[pd.DataFrame]]: Raw data. Streaming extracts are never checkpointed.
+        """
+        if self.checkpoints is None:
+            return self.extract()
+
+        input_hash = hash_inputs(self.checkpoint_inputs())
+        cached = self.checkpoints.load(self.name, self.run_id, "extract", input_hash)
+        if cached is not None:
+            logger.info(f"[{self.name}] Extract skipped: reusing checkpoint of run {self.run_id}.")
+            self._stage_hash = self.checkpoints.output_hash(self.name, self.run_id, "extract")
+            return cached
+
+        raw_data = self.extract()
+        if isinstance(raw_data, pd.DataFrame):
+            self._stage_hash = self.checkpoints.save(self.name, self.run_id, "extract", input_hash, raw_data)
+        return raw_data
+
+    def _transform_stage(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run `transform`, or reuse its checkpoint when the extracted data did not change.
+
+        Args:
+            raw_data (pd.DataFrame): Output of the extract stage.
+
+        Returns:
+            pd.DataFrame: Transformed data.
+        """
+        if self.checkpoints is None:
+            return self.transform(raw_data)
+
+        input_hash = self._stage_hash or hash_frame(raw_data)
+        cached = self.checkpoints.load(self.name, self.run_id, "transform", input_hash)
+        if cached is not None:
+            logger.info(f"[{self.name}] Transform skipped: reusing checkpoint of run {self.run_id}.")
+            self._stage_hash = self.checkpoints.output_hash(self.name, self.run_id, "transform")
+            return cached
+
+        processed_data = self.transform(raw_data)
+        self._stage_hash = self.checkpoints.save(self.name, self.run_id, "transform", input_hash, processed_data)
+        return processed_data
+
+    @property
+    def incremental(self) -> bool:
+        """True if the pipeline tracks a watermark."""
+        return self.state_store is not None and self.watermark_column is not None
+
+    def _max_watermark(self, df: pd.DataFrame, current: Any) -> Any:
+        """
+        Return the larger of `current` and the maximum watermark column value in `df`.
+
+        Args:
+            df (pd.DataFrame): Loaded data.
+            current (Any): Watermark seen so far.
+
+        Returns:
+            Any: The new candidate watermark.
+        """
+        if df.empty or self.watermark_column not in df.columns:
+            return current
+        values = df[self.watermark_column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # normalize_dtypes stores repeated codes as unordered categoricals, which have no max
+            values = values.astype(object)
+        candidate = values.max()
+        if pd.isna(candidate):
+            return current
+        return candidate if current is None or candidate > current else current
+
+    def _commit_watermark(self, value: Any) -> None:
+        """
+        Persist the watermark after a successful load, if it moved forward.
+
+        Args:
+            value (Any): Highest watermark column value loaded in this run.
+        """
+        if value is None or (self.watermark is not None and value <= self.watermark):
+            return
+        self.state_store.set_watermark(self.name, value)
+        logger.info(f"[{self.name}] Watermark advanced from {self.watermark} to {value}.")
+        self.watermark = value
+
+    def _run_streaming(self, chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+        """
+        Transform and load an iterable of raw chunks one at a time.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Raw data chunks returned by `extract`.
+
+        Returns:
+            Dict[str, Any]: Summary statistics with the number of chunks, rows extracted and rows loaded.
+        """
+        summary: Dict[str, Any] = {"chunks": 0, "rows_extracted": 0, "rows_loaded": 0}
+        high_water = None
+        try:
+            for index, raw_chunk in enumerate(chunks):
+                self.chunk_index = index
+                processed_chunk = self.transform(raw_chunk)
+                self.load(processed_chunk)
+                if self.incremental:
+                    high_water = self._max_watermark(processed_chunk, high_water)
+
+                summary["chunks"] += 1
+                summary["rows_extracted"] += len(raw_chunk)
+                summary["rows_loaded"] += len(processed_chunk)
+                logger.debug(
+                    f"[{self.name}] Chunk {index} processed: "
+                    f"{len(raw_chunk)} rows extracted, {len(processed_chunk)} rows loaded."
+                )
+        finally:
+            self.chunk_index = None
+
+        if self.incremental:
+            self._commit_watermark(high_water)
+        return summary
+
     def run(self) -> None:
         """
         Execute the full ETL pipeline: extract, transform, and load.
 
         This method provides structured logging for each step
-        and assigns the processed data to `self.data`.
+        and assigns the processed data to `self.data`. When `extract`
+        returns an iterable of chunks, each chunk is transformed and loaded
+        before the next one is read, and `self.data` only holds summary statistics.
         """
         logger.info(f"==== Starting ETL: {self.name} ====")
+        self._stage_hash = None
+        self.metrics = []
         try:
-            # Extract
-            raw_data = self.extract()
-            logger.info(f"[{self.name}] Extracted {len(raw_data)} rows.")
-
-            # Transform
-            processed_data = self.transform(raw_data)
-            logger.info(f"[{self.name}] Transformation completed.")
+            with trace_span(f"etl.{self.name}", **{"etl.pipeline": self.name, "etl.run_id": self.run_id}):
+                self._run_stages()
+        except Exception as e:
+            logger.exception(f"ETL {self.name} failed: {e}")
+            raise
 
-            # Load
-            self.load(processed_data)
-            logger.info(f"[{self.name}] Load completed successfully.")
+    def _run_stages(self) -> None:
+        """Run extract, transform and load, each inside an instrumented stage."""
+        if self.incremental:
+            self.watermark = self.state_store.get_watermark(self.name)
+            logger.info(f"[{self.name}] Incremental run from watermark: {self.watermark}")
 
-            # Store processed data
-            self.data = processed_data
+        # Extract
+        with instrument_stage(self.name, "extract") as stage:
+            raw_data = self._extract_stage()
+            stage.set_output(raw_data)
+        self.metrics.append(stage)
 
+        if not isinstance(raw_data, pd.DataFrame):
+            # Streaming: transform and load chunk by chunk
+            with instrument_stage(self.name, "stream") as stage:
+                summary = self._run_streaming(raw_data)
+                stage.rows_in, stage.rows_out = summary["rows_extracted"], summary["rows_loaded"]
+            self.metrics.append(stage)
+            logger.info(
+                f"[{self.name}] Streamed {summary['rows_extracted']} rows in "
+                f"{summary['chunks']} chunks; {summary['rows_loaded']} rows loaded."
+            )
+            self.data = summary
             logger.success(f"==== ETL {self.name} finished successfully! ====")
+            return
 
-        except Exception as e:
-            logger.exception(f"ETL {self.name} failed: {e}")
-            raise
+        logger.info(f"[{self.name}] Extracted {len(raw_data)} rows.")
+
+        # Transform
+        with instrument_stage(self.name, "transform", rows_in=len(raw_data)) as stage:
+            processed_data = self._transform_stage(raw_data)
+            stage.set_output(processed_data)
+        self.metrics.append(stage)
+        logger.info(f"[{self.name}] Transformation completed.")
+
+        # Load
+        load_hash = self._stage_hash
+        if self.checkpoints is not None and self.checkpoints.is_done(self.name, self.run_id, "load", load_hash):
+            logger.info(f"[{self.name}] Load skipped: run {self.run_id} already loaded this data.")
+        else:
+            with instrument_stage(self.name, "load", rows_in=len(processed_data)) as stage:
+                self.load(processed_data)
+            self.metrics.append(stage)
+            logger.info(f"[{self.name}] Load completed successfully.")
+            if self.incremental:
+                self._commit_watermark(self._max_watermark(processed_data, None))
+            if self.checkpoints is not None:
+                self.checkpoints.mark_done(self.name, self.run_id, "load", load_hash)
+                self.checkpoints.gc()
+
+        # Store processed data
+        self.data = processed_data
+
+        logger.success(f"==== ETL {self.name} finished successfully! ====")
@@ -0,0 +1,263 @@
+"""
+Module: checkpoint
+Provides content-addressed stage checkpoints that make BaseETL runs resumable.
+
+The output of each stage (extract, transform) is written as a Parquet
+artefact under `output/checkpoints/<pipeline>/<run_id>/`, named after the
+stage and a hash of the stage's inputs:
+    - extract:   hash of the pipeline's declared inputs (`BaseETL.checkpoint_inputs`)
+    - transform: hash of the extract artefact's content
+    - load:      a marker keyed by the hash of the transform artefact's content
+
+When a run is retried with the same run ID (e.g. an Airflow task retry, or a
+CLI rerun given the failed run's ID), every stage whose artefact matches its
+input hash is skipped, so a failure in `load` no longer repeats slow API calls
+or Excel parsing. Runs without an explicit ID get a fresh one and never reuse
+another run's artefacts. Old runs are garbage-collected by age and by number
+of runs kept per pipeline.
+
+Checkpointing is best effort: an output that cannot be persisted (e.g. a
+mixed-type column Parquet rejects) is logged and the run goes on without it.
+
+Dependencies:
+    - pandas: For hashing and persisting DataFrames.
+    - loguru: For structured logging.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from loguru import logger
+
+from src.utils.frame_io import FRAME_SUFFIX, read_frame, write_frame
+
+DEFAULT_CHECKPOINT_DIR = "output/checkpoints"
+DEFAULT_RETENTION_DAYS = 7
+DEFAULT_MAX_RUNS = 10
+
+
+def default_run_id() -> str:
+    """
+    Return the run ID used when a pipeline is not given one.
+
+    Returns:
+        str: The Airflow DAG run ID when running inside a task, so that task retries resume the
+            same run; otherwise a new ID, so that a later run never reuses this run's checkpoints.
+    """
+    return os.environ.get("AIRFLOW_CTX_DAG_RUN_ID") or f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+
+def hash_inputs(inputs: Any) -> str:
+    """
+    Hash JSON-serializable stage inputs.
+
+    Args:
+        inputs (Any): Stage inputs, e.g. a dict of parameters. Non-JSON values are hashed by their `str`.
+
+    Returns:
+        str: Hex digest.
+    """
+    raw = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """
+    Hash the content of a DataFrame: column names, dtypes, index and values.
+
+    Args:
+        df (pd.DataFrame): Frame to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """
+    Store of stage artefacts keyed by pipeline, run ID, stage and input hash.
+
+    Args:
+        root (str): Base directory of the checkpoints. Defaults to "output/checkpoints".
+        retention_days (float): Runs older than this are removed by `gc`. Defaults to 7.
+        max_runs (int): Number of most recent runs kept per pipeline by `gc`. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        root: str = DEFAULT_CHECKPOINT_DIR,
+        retention_days: float = DEFAULT_RETENTION_DAYS,
+        max_runs: int = DEFAULT_MAX_RUNS,
+    ) -> None:
+        self.root = Path(root)
+        self.retention_days = retention_days
+        self.max_runs = max_runs
+
+    @classmethod
+    def from_config(cls, checkpoint_config: Optional[Dict[str, Any]]) -> Optional["CheckpointStore"]:
+        """
+        Build a store from the `checkpoints` configuration section.
+
+        Args:
+            checkpoint_config (Optional[Dict[str, Any]]): Section with enabled, dir, retention_days and max_runs.
+
+        Returns:
+            Optional[CheckpointStore]: The store, or None if the section is missing or disabled.
+        """
+        if not checkpoint_config or not checkpoint_config.get("enabled", True):
+            return None
+        return cls(
+            root=checkpoint_config.get("dir", DEFAULT_CHECKPOINT_DIR),
+            retention_days=checkpoint_config.get("retention_days", DEFAULT_RETENTION_DAYS),
+            max_runs=checkpoint_config.get("max_runs", DEFAULT_MAX_RUNS),
+        )
+
+    def _run_dir(self, pipeline: str, run_id: str) -> Path:
+        safe_run_id = "".join(char if char.isalnum() or char in "-_." else "_" for char in run_id)
+        return self.root / pipeline / safe_run_id
+
+    def _manifest_path(self, pipeline: str, run_id: str, stage: str) -> Path:
+        return self._run_dir(pipeline, run_id) / f"{stage}.json"
+
+    def _read_manifest(self, pipeline: str, run_id: str, stage: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._manifest_path(pipeline, run_id, stage).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_manifest(self, pipeline: str, run_id: str, stage: str, manifest: Dict[str, Any]) -> None:
+        path = self._manifest_path(pipeline, run_id, stage)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def load(self, pipeline: str, run_id: str, stage: str, input_hash: str) -> Optional[pd.DataFrame]:
+        """
+        Return the artefact of a stage if it was produced from the same inputs.
+
+        Args:
+            pipeline (str): Pipeline name.
+            run_id (str): Run ID.
+            stage (str): Stage name, e.g. "extract".
+            input_hash (str): Hash of the stage inputs.
+
+        Returns:
+            Optional[pd.DataFrame]: The stored output, or None if there is no valid artefact.
+        """
+        manifest = self._read_manifest(pipeline, run_id, stage)
+        if not manifest or manifest.get("input_hash") != input_hash:
+            return None
+        artefact = self._run_dir(pipeline, run_id) / manifest["artefact"]
+        try:
+            return read_frame(artefact)
+        except Exception as e:
+            logger.warning(f"[{pipeline}] Ignoring unreadable {stage} checkpoint {artefact}: {e}")
+            return None
+
+    def save(self, pipeline: str, run_id: str, stage: str, input_hash: str, df: pd.DataFrame) -> str:
+        """
+        Persist the output of a stage and return its content hash.
+
+        Args:
+            pipeline (str): Pipeline name.
+            run_id (str): Run ID.
+            stage (str): Stage name, e.g. "extract".
+            input_hash (str): Hash of the stage inputs.
+            df (pd.DataFrame): Stage output.
+
+        Returns:
+            str: Content hash of the output, used as input hash of the next stage. It is returned
+                even when the output could not be persisted.
+        """
+        artefact_name = f"{stage}-{input_hash}{FRAME_SUFFIX}"
+        content_hash = hash_frame(df)
+        try:
+            write_frame(df, self._run_dir(pipeline, run_id) / artefact_name)
+        except Exception as e:
+            logger.warning(f"[{pipeline}] Could not checkpoint {stage} output for run {run_id}; continuing without it: {e}")
+            return content_hash
+        self._write_manifest(
+            pipeline,
+            run_id,
+            stage,
+            {
+                "input_hash": input_hash,
+                "output_hash": content_hash,
+                "artefact": artefact_name,
+                "rows": len(df),
+                "created_at": time.time(),
+            },
+        )
+        logger.debug(f"[{pipeline}] Checkpointed {stage} output ({len(df)} rows) for run {run_id}.")
+        return content_hash
+
+    def output_hash(self, pipeline: str, run_id: str, stage: str) -> Optional[str]:
+        """Return the recorded content hash of a stage output, if any."""
+        manifest = self._read_manifest(pipeline, run_id, stage)
+        return manifest.get("output_hash") if manifest else None
+
+    def is_done(self, pipeline: str, run_id: str, stage: str, input_hash: str) -> bool:
+        """
+        Tell whether a stage without output (e.g. load) already completed for the same inputs.
+
+        Args:
+            pipeline (str): Pipeline name.
+            run_id (str): Run ID.
+            stage (str): Stage name.
+            input_hash (str): Hash of the stage inputs.
+
+        Returns:
+            bool: True if a completion marker with the same input hash exists.
+        """
+        manifest = self._read_manifest(pipeline, run_id, stage)
+        return bool(manifest) and manifest.get("input_hash") == input_hash
+
+    def mark_done(self, pipeline: str, run_id: str, stage: str, input_hash: str) -> None:
+        """Record that a stage without output completed for the given inputs."""
+        self._write_manifest(pipeline, run_id, stage, {"input_hash": input_hash, "created_at": time.time()})
+
+    def gc(self, now: Optional[float] = None) -> int:
+        """
+        Remove runs older than the retention period and runs beyond `max_runs` per pipeline.
+
+        Args:
+            now (Optional[float]): Reference timestamp. Defaults to the current time.
+
+        Returns:
+            int: Number of run directories removed.
+        """
+        if not self.root.is_dir():
+            return 0
+
+        now = now or time.time()
+        removed = 0
+        for pipeline_dir in self.root.iterdir():
+            if not pipeline_dir.is_dir():
+                continue
+            runs = sorted(
+                (run_dir for run_dir in pipeline_dir.iterdir() if run_dir.is_dir()),
+                key=lambda run_dir: run_dir.stat().st_mtime,
+                reverse=True,
+            )
+            for position, run_dir in enumerate(runs):
+                expired = now - run_dir.stat().st_mtime > self.retention_days * 86400
+                if position >= self.max_runs or expired:
+                    shutil.rmtree(run_dir, ignore_errors=True)
+                    removed += 1
+
+        if removed:
+            logger.info(f"Removed {removed} old checkpoint runs from {self.root}.")
+        return removed
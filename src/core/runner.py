@@ -0,0 +1,268 @@
+"""
+Module: runner
+Provides a PipelineRunner that executes several BaseETL pipelines concurrently.
+
+Pipelines are registered with the pipelines they depend on, and each one is
+started as soon as all of its dependencies have succeeded, up to a
+concurrency cap. I/O-bound pipelines (API calls, database loads) run in a
+thread pool; CPU-bound pipelines (e.g. Excel parsing) can run in a process
+pool instead. Two failure policies are available:
+    - fail_fast=True: no new pipeline is started after the first failure.
+    - fail_fast=False: only the dependents of a failed pipeline are skipped.
+
+The run summary reports the status and wall time of every pipeline and the
+critical path, i.e. the chain of dependencies that determined the total time.
+
+Dependencies:
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> runner = PipelineRunner(max_workers=4)
+    >>> runner.add(ApiETL(connector))
+    >>> runner.add(BotETL(connector), executor="process")
+    >>> runner.add(ReportETL(connector), depends_on=["api", "bot"])
+    >>> summary = runner.run()
+    >>> summary.critical_path
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from src.core.base_etl import BaseETL
+
+EXECUTORS = ("thread", "process")
+
+
+@dataclass
+class PipelineResult:
+    """
+    Outcome of one pipeline in a runner execution.
+
+    Attributes:
+        name (str): Pipeline name.
+        status (str): "success", "failed" or "skipped".
+        seconds (float): Wall time of the pipeline run, 0 if it was skipped.
+        error (Optional[str]): Error message of a failed pipeline, or the reason it was skipped.
+    """
+
+    name: str
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class RunSummary:
+    """
+    Summary of a runner execution.
+
+    Attributes:
+        seconds (float): Total wall time.
+        results (Dict[str, PipelineResult]): Results by pipeline name, in registration order.
+        critical_path (List[str]): Longest chain of dependent pipelines by wall time.
+        critical_path_seconds (float): Sum of the wall times along the critical path.
+    """
+
+    seconds: float
+    results: Dict[str, PipelineResult] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """True if every pipeline succeeded."""
+        return all(result.status == "success" for result in self.results.values())
+
+    @property
+    def failed(self) -> List[str]:
+        """Names of the failed pipelines."""
+        return [name for name, result in self.results.items() if result.status == "failed"]
+
+
+def _run_pipeline(etl: BaseETL) -> float:
+    """
+    Run a pipeline and return its wall time. Module level so that it can run in a worker process.
+
+    Args:
+        etl (BaseETL): The pipeline.
+
+    Returns:
+        float: Wall time in seconds.
+    """
+    start = time.perf_counter()
+    etl.run()
+    return time.perf_counter() - start
+
+
+class PipelineRunner:
+    """
+    Runs BaseETL pipelines concurrently while honouring their dependencies.
+
+    Args:
+        max_workers (int): Maximum number of pipelines running at the same time. Defaults to 4.
+        fail_fast (bool): Stop starting pipelines after the first failure. Defaults to True.
+    """
+
+    def __init__(self, max_workers: int = 4, fail_fast: bool = True) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than zero.")
+        self.max_workers = max_workers
+        self.fail_fast = fail_fast
+        self._pipelines: Dict[str, BaseETL] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+        self._executors: Dict[str, str] = {}
+
+    def add(self, etl: BaseETL, depends_on: Iterable[str] = (), executor: str = "thread") -> "PipelineRunner":
+        """
+        Register a pipeline.
+
+        Pipelines run in a process must be picklable: they should open their own
+        connections inside `run` instead of holding a connector.
+
+        Args:
+            etl (BaseETL): The pipeline. Its `name` must be unique in the runner.
+            depends_on (Iterable[str]): Names of the pipelines that must succeed first.
+            executor (str): "thread" for I/O-bound pipelines, "process" for CPU-bound ones. Defaults to "thread".
+
+        Returns:
+            PipelineRunner: The runner, to chain calls.
+
+        Raises:
+            ValueError: If the name is already registered or the executor is unknown.
+        """
+        if etl.name in self._pipelines:
+            raise ValueError(f"Pipeline '{etl.name}' is already registered.")
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Expected one of {EXECUTORS}.")
+        self._pipelines[etl.name] = etl
+        self._dependencies[etl.name] = list(depends_on)
+        self._executors[etl.name] = executor
+        return self
+
+    def _topological_order(self) -> List[str]:
+        """
+        Order the pipelines so that every pipeline comes after its dependencies.
+
+        Raises:
+            ValueError: If a dependency is unknown or the dependencies contain a cycle.
+        """
+        for name, dependencies in self._dependencies.items():
+            unknown = [dep for dep in dependencies if dep not in self._pipelines]
+            if unknown:
+                raise ValueError(f"Pipeline '{name}' depends on unknown pipelines: {unknown}")
+
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, chain: List[str]) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle detected: {' -> '.join(chain + [name])}")
+            state[name] = "visiting"
+            for dep in self._dependencies[name]:
+                visit(dep, chain + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self._pipelines:
+            visit(name, [])
+        return order
+
+    def _critical_path(self, order: List[str], results: Dict[str, PipelineResult]) -> Tuple[List[str], float]:
+        """Return the longest chain of executed dependencies by wall time and its length in seconds."""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for name in order:
+            ran = [dep for dep in self._dependencies[name] if results[dep].status != "skipped"]
+            slowest = max(ran, key=lambda dep: finish[dep], default=None)
+            previous[name] = slowest
+            finish[name] = results[name].seconds + (finish[slowest] if slowest else 0.0)
+
+        if not finish:
+            return [], 0.0
+        node: Optional[str] = max(finish, key=finish.get)
+        total = finish[node]
+        path = []
+        while node:
+            path.append(node)
+            node = previous[node]
+        return path[::-1], total
+
+    def run(self) -> RunSummary:
+        """
+        Execute every registered pipeline.
+
+        Returns:
+            RunSummary: Per-pipeline results and the critical path.
+
+        Raises:
+            ValueError: If the dependency graph is invalid.
+        """
+        order = self._topological_order()
+        results: Dict[str, PipelineResult] = {}
+        pending = list(order)
+        running: Dict[Future, str] = {}
+        submitted_at: Dict[str, float] = {}
+        stop = False
+
+        logger.info(f"==== Running {len(order)} pipelines with up to {self.max_workers} in parallel ====")
+        start = time.perf_counter()
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline")
+        process_pool: Optional[ProcessPoolExecutor] = None
+        try:
+            while pending or running:
+                for name in list(pending):
+                    dependencies = self._dependencies[name]
+                    blocked = [dep for dep in dependencies if dep in results and results[dep].status != "success"]
+                    if stop or blocked:
+                        reason = "fail-fast after an earlier failure" if stop else f"dependencies failed: {blocked}"
+                        results[name] = PipelineResult(name, "skipped", error=reason)
+                        pending.remove(name)
+                        logger.warning(f"[{name}] Skipped ({reason}).")
+                    elif all(dep in results for dep in dependencies) and len(running) < self.max_workers:
+                        if self._executors[name] == "process":
+                            process_pool = process_pool or ProcessPoolExecutor(max_workers=self.max_workers)
+                            future = process_pool.submit(_run_pipeline, self._pipelines[name])
+                        else:
+                            future = thread_pool.submit(_run_pipeline, self._pipelines[name])
+                        running[future] = name
+                        submitted_at[name] = time.perf_counter()
+                        pending.remove(name)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = PipelineResult(name, "success", future.result())
+                        logger.info(f"[{name}] Pipeline finished in {results[name].seconds:.2f}s.")
+                    except Exception as e:
+                        elapsed = time.perf_counter() - submitted_at[name]
+                        results[name] = PipelineResult(name, "failed", elapsed, str(e))
+                        logger.error(f"[{name}] Pipeline failed: {e}")
+                        stop = stop or self.fail_fast
+        finally:
+            thread_pool.shutdown(wait=True)
+            if process_pool:
+                process_pool.shutdown(wait=True)
+
+        critical_path, critical_seconds = self._critical_path(order, results)
+        summary = RunSummary(
+            seconds=time.perf_counter() - start,
+            results={name: results[name] for name in self._pipelines},
+            critical_path=critical_path,
+            critical_path_seconds=critical_seconds,
+        )
+        for result in summary.results.values():
+            logger.info(f"  {result.name:<20} {result.status:<8} {result.seconds:8.2f}s")
+        logger.info(
+            f"==== Pipelines finished in {summary.seconds:.2f}s; critical path "
+            f"{' -> '.join(critical_path) or '-'} ({critical_seconds:.2f}s) ===="
+        )
+        return summary
@@ -0,0 +1,186 @@
+"""
+Module: state_store
+Provides persistent storage of per-pipeline high-water marks for incremental extraction.
+
+A watermark is the largest value of a monotonically increasing column (a
+timestamp or an ID) that has been loaded successfully by a pipeline. The
+next run only extracts records above it. Two backends are available:
+    - JSONFileStateStore: a single JSON file, rewritten atomically.
+    - SQLiteStateStore: a local SQLite database, safe for concurrent writers.
+
+Dependencies:
+    - pandas: For timestamp handling.
+    - loguru: For structured logging.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from loguru import logger
+
+DEFAULT_STATE_PATH = "output/state/watermarks.json"
+
+
+def encode_watermark(value: Any) -> Dict[str, Any]:
+    """
+    Encode a watermark value into a JSON-serializable record that preserves its type.
+
+    Args:
+        value (Any): A timestamp, date, integer, float or string.
+
+    Returns:
+        Dict[str, Any]: Record with `type` and `value` keys.
+    """
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return {"type": "timestamp", "value": pd.Timestamp(value).isoformat()}
+    if hasattr(value, "item"):
+        value = value.item()  # NumPy scalar
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return {"type": "str", "value": str(value)}
+    return {"type": "int" if isinstance(value, int) else "float", "value": value}
+
+
+def decode_watermark(record: Optional[Dict[str, Any]]) -> Any:
+    """
+    Decode a record produced by `encode_watermark`.
+
+    Args:
+        record (Optional[Dict[str, Any]]): Stored record.
+
+    Returns:
+        Any: The watermark value, or None if no record is stored.
+    """
+    if not record:
+        return None
+    if record["type"] == "timestamp":
+        return pd.Timestamp(record["value"])
+    return record["value"]
+
+
+class StateStore(ABC):
+    """
+    Abstract store of pipeline watermarks keyed by pipeline name.
+    """
+
+    @abstractmethod
+    def get_watermark(self, pipeline: str) -> Any:
+        """
+        Return the last committed watermark of a pipeline.
+
+        Args:
+            pipeline (str): Pipeline name (`BaseETL.name`).
+
+        Returns:
+            Any: The watermark, or None if the pipeline has never completed a load.
+        """
+        pass
+
+    @abstractmethod
+    def set_watermark(self, pipeline: str, value: Any) -> None:
+        """
+        Persist the watermark of a pipeline.
+
+        Args:
+            pipeline (str): Pipeline name (`BaseETL.name`).
+            value (Any): New watermark value.
+        """
+        pass
+
+
+class JSONFileStateStore(StateStore):
+    """
+    Watermark store backed by a JSON file.
+
+    Args:
+        path (str): Path of the JSON file. Defaults to "output/state/watermarks.json".
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def get_watermark(self, pipeline: str) -> Any:
+        with self._lock:
+            return decode_watermark(self._read().get(pipeline))
+
+    def set_watermark(self, pipeline: str, value: Any) -> None:
+        with self._lock:
+            state = self._read()
+            state[pipeline] = encode_watermark(value)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+
+
+class SQLiteStateStore(StateStore):
+    """
+    Watermark store backed by a local SQLite database.
+
+    Args:
+        path (str): Path of the SQLite database file. Defaults to "output/state/watermarks.db".
+    """
+
+    def __init__(self, path: str = "output/state/watermarks.db") -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            "pipeline TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """Run one statement in its own committed transaction and return the first row, if any."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+
+    def get_watermark(self, pipeline: str) -> Any:
+        row = self._execute("SELECT value FROM watermarks WHERE pipeline = ?", (pipeline,))
+        return decode_watermark(json.loads(row[0])) if row else None
+
+    def set_watermark(self, pipeline: str, value: Any) -> None:
+        self._execute(
+            "INSERT INTO watermarks (pipeline, value, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(pipeline) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (pipeline, json.dumps(encode_watermark(value)), datetime.now().isoformat()),
+        )
+
+
+def get_state_store(state_config: Optional[Dict[str, Any]] = None) -> StateStore:
+    """
+    Create the state store declared in the `state` configuration section.
+
+    Args:
+        state_config (Optional[Dict[str, Any]]): Section with `backend` ("file" or "sqlite") and `path`.
+
+    Returns:
+        StateStore: The configured store. Defaults to a JSON file store.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    state_config = state_config or {}
+    backend = state_config.get("backend", "file")
+    if backend == "file":
+        return JSONFileStateStore(state_config.get("path", DEFAULT_STATE_PATH))
+    if backend == "sqlite":
+        return SQLiteStateStore(state_config.get("path", "output/state/watermarks.db"))
+    logger.error(f"Unknown state store backend: {backend}")
+    raise ValueError(f"Unknown state store backend '{backend}'. Expected 'file' or 'sqlite'.")
@@ -0,0 +1,555 @@
+"""
+Module: backends
+Provides embedded database backends (SQLite and DuckDB) behind the SQLDatabaseConnector interface.
+
+`SQLiteConnector` and `DuckDBConnector` subclass `SQLDatabaseConnector`, so the
+savers, the parallel loader and the pipelines use them unchanged through
+`connect`, `execute_query`, `iter_query`, `create_table`, `bulk_insert`,
+`upsert` and `checkout`. They make development runs and load-path performance
+tests possible without a SQL Server:
+    - SQLite (standard library) binds the rows through batched `executemany` calls.
+    - DuckDB registers the DataFrame as a view and loads it with a single
+      INSERT ... SELECT, without binding parameters row by row. Result sets are
+      fetched as whole DataFrames (or Arrow tables) instead of row tuples.
+
+The SQL Server column types inferred by `src.db.schema` are mapped to the
+embedded dialects, and upserts run as UPDATE ... FROM and INSERT ... WHERE NOT
+EXISTS from a temp staging table, in one transaction.
+
+The backend is picked by `get_connector` from the `database` configuration
+section, or from the DB_BACKEND and DB_PATH environment variables.
+
+Dependencies:
+    - pandas: For data handling.
+    - duckdb (optional): For the DuckDB backend; imported on first use.
+    - pyyaml: For reading the `database` configuration section.
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> connector = get_connector({"backend": "duckdb", "path": "output/etl.duckdb"})
+    >>> connector.connect()
+    >>> save_api(df, connector)
+    >>> connector.execute_query("SELECT COUNT(*) AS n FROM api_demo")
+"""
+
+import functools
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+import pandas as pd
+from loguru import logger
+
+from src.db.db_connector import DEFAULT_ARRAYSIZE, DEFAULT_BATCH_SIZE, LOAD_MODES, SQLDatabaseConnector
+from src.db.schema import ColumnType, infer_schema
+from src.utils.metrics import trace_span
+
+BACKENDS = ("sqlserver", "sqlite", "duckdb")
+DEFAULT_PATHS = {"sqlite": "output/etl.sqlite", "duckdb": "output/etl.duckdb"}
+MEMORY_PATH = ":memory:"
+
+
+@functools.lru_cache(maxsize=None)
+def load_duckdb() -> Optional[ModuleType]:
+    """
+    Import duckdb on first use, so that importing the backends does not load it.
+
+    Returns:
+        Optional[ModuleType]: The duckdb module, or None if it is not installed.
+    """
+    try:
+        import duckdb
+    except ImportError:
+        return None
+    return duckdb
+
+
+# pyodbc binds Timestamps natively; sqlite3 needs an explicit adapter
+sqlite3.register_adapter(pd.Timestamp, lambda value: value.isoformat(sep=" "))
+
+
+class _EmbeddedCursor:
+    """DB-API cursor exposing the pyodbc cursor features used by SQLDatabaseConnector."""
+
+    def __init__(self, cursor: Any) -> None:
+        self._cursor = cursor
+        self.fast_executemany = False
+        self.arraysize = DEFAULT_ARRAYSIZE
+
+    def __enter__(self) -> "_EmbeddedCursor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._cursor.close()
+
+    def setinputsizes(self, sizes: Any) -> None:
+        pass  # parameter types follow the table definition
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        return self._cursor.fetchmany(size or self.arraysize)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class _DuckDBCursor(_EmbeddedCursor):
+    """
+    DuckDB cursor behaving like pyodbc for statements without a result set.
+
+    DuckDB answers DDL and DML with a one-row "Count" result; it is consumed into
+    `rowcount` and `description` is None, so the connector commits instead of fetching.
+    """
+
+    def __init__(self, cursor: Any) -> None:
+        super().__init__(cursor)
+        self.description = None
+        self.rowcount = -1
+
+    def execute(self, query: str, params: Optional[List[Any]] = None) -> "_DuckDBCursor":
+        self._cursor.execute(query, params or None)
+        self.description, self.rowcount = self._cursor.description, -1
+        if self.description and [column[0] for column in self.description] == ["Count"]:
+            row = self._cursor.fetchone()
+            self.description, self.rowcount = None, row[0] if row else -1
+        return self
+
+
+class _EmbeddedConnection:
+    """DB-API connection returning cursors with the pyodbc surface."""
+
+    cursor_class: Type[_EmbeddedCursor] = _EmbeddedCursor
+
+    def __init__(self, connection: Any) -> None:
+        self._connection = connection
+
+    def cursor(self) -> _EmbeddedCursor:
+        return self.cursor_class(self._connection.cursor())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+
+class _DuckDBConnection(_EmbeddedConnection):
+    """DuckDB connection; statements outside an explicit transaction are committed immediately."""
+
+    cursor_class = _DuckDBCursor
+
+    def rollback(self) -> None:
+        try:
+            self._connection.rollback()
+        except load_duckdb().TransactionException:
+            pass  # nothing to roll back in autocommit mode
+
+
+class EmbeddedConnector(SQLDatabaseConnector):
+    """
+    Base class of the connectors writing to an embedded database file instead of a SQL Server.
+
+    Subclasses provide the connection, the driver errors and the type mapping of their dialect.
+
+    Args:
+        path (str): Database file, or ":memory:".
+        arraysize (int): Number of rows fetched per `fetchmany` call. Defaults to 10000.
+        dtype_backend (str): "numpy" or "pyarrow" column types for result sets. Defaults to "numpy".
+
+    Attributes:
+        path (str): Database file, or ":memory:".
+    """
+
+    backend = ""
+    column_types: Dict[str, str] = {}
+    default_column_type = "TEXT"
+    distinct_operator = "IS DISTINCT FROM"
+
+    def __init__(
+        self, path: str, arraysize: int = DEFAULT_ARRAYSIZE, dtype_backend: str = "numpy"
+    ) -> None:
+        super().__init__(
+            server=self.backend,
+            database=path,
+            use_windows_auth=True,
+            arraysize=arraysize,
+            dtype_backend=dtype_backend,
+        )
+        self.path = path
+        if path != MEMORY_PATH:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    def quote_identifier(self, name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def column_sql(self, column_type: ColumnType) -> str:
+        """
+        Map a SQL Server column type to the type of the embedded dialect.
+
+        Args:
+            column_type (ColumnType): Type inferred by `src.db.schema`.
+
+        Returns:
+            str: Type used in CREATE TABLE.
+        """
+        name = re.match(r"\w*", column_type.sql).group(0).upper()
+        return self.column_types.get(name, self.default_column_type)
+
+    def create_table(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        if_exists: str = "replace",
+        schema: Optional[Dict[str, ColumnType]] = None,
+    ) -> None:
+        """
+        Creates a table with one typed column per DataFrame column.
+
+        Args:
+            table_name (str): The name of the table to create.
+            df (pd.DataFrame): The DataFrame whose columns define the table.
+            if_exists (str): "replace" drops and recreates an existing table; "append" only creates
+                a missing table. Defaults to "replace".
+            schema (Optional[Dict[str, ColumnType]]): Column types by name. Defaults to the inferred types.
+
+        Raises:
+            ValueError: If if_exists is not one of LOAD_MODES.
+            RuntimeError: If a statement fails.
+        """
+        if if_exists not in LOAD_MODES:
+            raise ValueError(f"if_exists must be one of {LOAD_MODES}, got '{if_exists}'.")
+
+        schema = schema or infer_schema(df)
+        columns = ", ".join(f"{self.quote_identifier(col)} {self.column_sql(schema[col])}" for col in df.columns)
+        if if_exists == "replace":
+            self.execute_query(f"DROP TABLE IF EXISTS {table_name}")
+        self.execute_query(f"CREATE TABLE IF NOT EXISTS {table_name} ({columns})")
+        logger.debug("Table {} ready ({}).", table_name, if_exists)
+
+    def _merge_statements(
+        self, table_name: str, staging_table: str, columns: List[str], key_columns: List[str], delete_missing: bool
+    ) -> List[str]:
+        """
+        Build the UPDATE, INSERT and optional DELETE statements that merge a staging table into the target.
+
+        Matched rows are only updated when a non-key column changed (NULL-safe comparison).
+
+        Returns:
+            List[str]: The statements, to run in order in one transaction.
+        """
+        quote = self.quote_identifier
+        matches = " AND ".join(f"target.{quote(col)} = source.{quote(col)}" for col in key_columns)
+        value_columns = [col for col in columns if col not in key_columns]
+        all_columns = ", ".join(quote(col) for col in columns)
+
+        statements = []
+        if value_columns:
+            assignments = ", ".join(f"{quote(col)} = source.{quote(col)}" for col in value_columns)
+            changed = " OR ".join(
+                f"target.{quote(col)} {self.distinct_operator} source.{quote(col)}" for col in value_columns
+            )
+            statements.append(
+                f"UPDATE {table_name} AS target SET {assignments} "
+                f"FROM {staging_table} AS source WHERE {matches} AND ({changed})"
+            )
+        statements.append(
+            f"INSERT INTO {table_name} ({all_columns}) SELECT {all_columns} FROM {staging_table} AS source "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {table_name} AS target WHERE {matches})"
+        )
+        if delete_missing:
+            statements.append(
+                f"DELETE FROM {table_name} AS target "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {staging_table} AS source WHERE {matches})"
+            )
+        return statements
+
+    def upsert(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        key_columns: List[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        schema: Optional[Dict[str, ColumnType]] = None,
+        delete_missing: bool = False,
+    ) -> int:
+        """
+        Upserts a DataFrame into a table through a temp staging table, in a single transaction.
+
+        Args:
+            table_name (str): The name of the target table.
+            df (pd.DataFrame): The data to upsert.
+            key_columns (List[str]): Business-key columns that identify a row. They must be unique in df.
+            batch_size (int): The number of rows per batch loaded into the staging table. Defaults to 1000.
+            schema (Optional[Dict[str, ColumnType]]): Column types. Defaults to the inferred schema.
+            delete_missing (bool): Delete target rows whose keys are not in df. Defaults to False.
+
+        Returns:
+            int: The number of rows inserted, updated or deleted.
+
+        Raises:
+            ValueError: If key columns are missing or not unique in df, or batch_size is smaller than 1.
+            RuntimeError: If the upsert fails. The transaction is rolled back.
+        """
+        self._check_upsert_args(df, key_columns, batch_size)
+        schema = schema or infer_schema(df)
+        self.create_table(table_name, df, if_exists="append", schema=schema)
+
+        staging_table = "stg_" + re.sub(r"\W", "_", table_name)
+        staging_columns = ", ".join(f"{self.quote_identifier(col)} {self.column_sql(schema[col])}" for col in df.columns)
+        statements = self._merge_statements(table_name, staging_table, list(df.columns), key_columns, delete_missing)
+
+        try:
+            start = time.perf_counter()
+            affected_rows = 0
+            with trace_span("db.upsert", **{"db.table": table_name, "db.rows": len(df)}):
+                with self.connection.cursor() as cursor:
+                    cursor.execute("BEGIN TRANSACTION")
+                    cursor.execute(f"CREATE TEMP TABLE {staging_table} ({staging_columns})")
+                    self._insert_batches(cursor, staging_table, df, batch_size, schema)
+                    for statement in statements:
+                        cursor.execute(statement)
+                        affected_rows += max(cursor.rowcount, 0)
+                    cursor.execute(f"DROP TABLE {staging_table}")
+                    cursor.execute("COMMIT")
+            elapsed = time.perf_counter() - start
+        except self.driver_errors as e:
+            self.connection.rollback()
+            logger.exception(f"Upsert into {table_name} failed.")
+            raise RuntimeError(
+                f"Upsert into {table_name} failed. Check logs for details."
+            ) from e
+
+        logger.info(
+            f"Upsert into {table_name} completed: {len(df)} rows staged, "
+            f"{affected_rows} rows merged in {elapsed:.2f}s."
+        )
+        return affected_rows
+
+
+class SQLiteConnector(EmbeddedConnector):
+    """
+    Connector for a SQLite database file, or a shared in-memory database.
+
+    Args:
+        path (str): Database file, or ":memory:". Defaults to "output/etl.sqlite".
+        arraysize (int): Number of rows fetched per `fetchmany` call. Defaults to 10000.
+        dtype_backend (str): "numpy" or "pyarrow" column types for result sets. Defaults to "numpy".
+    """
+
+    backend = "sqlite"
+    driver_errors = (sqlite3.Error,)
+    column_types = {
+        "BIT": "INTEGER",
+        "TINYINT": "INTEGER",
+        "SMALLINT": "INTEGER",
+        "INT": "INTEGER",
+        "BIGINT": "INTEGER",
+        "FLOAT": "REAL",
+        "REAL": "REAL",
+        "DECIMAL": "NUMERIC",
+        "NUMERIC": "NUMERIC",
+    }
+    default_column_type = "TEXT"
+    distinct_operator = "IS NOT"
+
+    def __init__(
+        self, path: str = DEFAULT_PATHS["sqlite"], arraysize: int = DEFAULT_ARRAYSIZE, dtype_backend: str = "numpy"
+    ) -> None:
+        super().__init__(path, arraysize=arraysize, dtype_backend=dtype_backend)
+        self._write_lock = threading.Lock()
+        # Pooled connections of an in-memory database must share it
+        self._uri = f"file:etl_{id(self)}?mode=memory&cache=shared" if path == MEMORY_PATH else Path(path).resolve().as_uri()
+
+    def open_connection(self) -> _EmbeddedConnection:
+        """
+        Opens a new connection to the SQLite database, usable from any thread.
+
+        Returns:
+            _EmbeddedConnection: A connection with pyodbc-like cursors.
+        """
+        return _EmbeddedConnection(sqlite3.connect(self._uri, uri=True, timeout=30, check_same_thread=False))
+
+    def _iter_frames(self, cursor: _EmbeddedCursor, chunk_size: int) -> Iterator[pd.DataFrame]:
+        # sqlite3 reports no column types; infer them from the fetched values
+        for frame in super()._iter_frames(cursor, chunk_size):
+            yield frame.infer_objects()
+
+    def bulk_insert(self, *args: Any, **kwargs: Any) -> int:
+        # SQLite has a single writer: serialize the writers of this process instead of failing on locks
+        with self._write_lock:
+            return super().bulk_insert(*args, **kwargs)
+
+    def upsert(self, *args: Any, **kwargs: Any) -> int:
+        with self._write_lock:
+            return super().upsert(*args, **kwargs)
+
+
+class DuckDBConnector(EmbeddedConnector):
+    """
+    Connector for a DuckDB database, loading DataFrames without binding parameters.
+
+    The database is opened once per connector; connections handed to the pool and to
+    `checkout` are cursors of that database, which is how DuckDB shares it between threads.
+
+    Args:
+        path (str): Database file, or ":memory:". Defaults to "output/etl.duckdb".
+        arraysize (int): Number of rows fetched per `fetchmany` call by `iter_query`. Defaults to 10000.
+        dtype_backend (str): "numpy" or "pyarrow" column types for result sets. Defaults to "numpy".
+    """
+
+    backend = "duckdb"
+    column_types = {
+        "BIT": "BOOLEAN",
+        "TINYINT": "TINYINT",
+        "SMALLINT": "SMALLINT",
+        "INT": "INTEGER",
+        "BIGINT": "BIGINT",
+        "FLOAT": "DOUBLE",
+        "REAL": "REAL",
+        "DATE": "DATE",
+        "DATETIME": "TIMESTAMP",
+        "DATETIME2": "TIMESTAMP",
+        "SMALLDATETIME": "TIMESTAMP",
+    }
+    default_column_type = "VARCHAR"
+
+    def __init__(
+        self, path: str = DEFAULT_PATHS["duckdb"], arraysize: int = DEFAULT_ARRAYSIZE, dtype_backend: str = "numpy"
+    ) -> None:
+        super().__init__(path, arraysize=arraysize, dtype_backend=dtype_backend)
+        self._database = None
+        self._database_lock = threading.Lock()
+
+    def column_sql(self, column_type: ColumnType) -> str:
+        if re.match(r"(DECIMAL|NUMERIC)\b", column_type.sql, re.IGNORECASE):
+            return column_type.sql
+        return super().column_sql(column_type)
+
+    @property
+    def driver_errors(self) -> Tuple[Type[Exception], ...]:
+        """Exceptions of the duckdb driver, caught and re-raised as RuntimeError."""
+        duckdb = load_duckdb()
+        return (duckdb.Error,) if duckdb else ()
+
+    def open_connection(self) -> _DuckDBConnection:
+        """
+        Opens a new connection (cursor) on the connector's DuckDB database.
+
+        Returns:
+            _DuckDBConnection: A connection with pyodbc-like cursors.
+
+        Raises:
+            RuntimeError: If duckdb is not installed.
+        """
+        duckdb = load_duckdb()
+        if duckdb is None:
+            raise RuntimeError("duckdb is not installed; it is required by the DuckDB backend.")
+        with self._database_lock:
+            if self._database is None:
+                self._database = duckdb.connect(self.path)
+        return _DuckDBConnection(self._database.cursor())
+
+    def disconnect(self) -> None:
+        """Closes the connection, the pool and the database, or only returns the connection of a `checkout` session."""
+        if self._checkout_pool is not None:
+            self._end_checkout()
+            return
+        super().disconnect()
+        with self._database_lock:
+            if self._database is not None:
+                self._database.close()
+                self._database = None
+
+    def _insert_batches(
+        self,
+        cursor: _DuckDBCursor,
+        table_name: str,
+        df: pd.DataFrame,
+        batch_size: int,
+        schema: Optional[Dict[str, ColumnType]],
+    ) -> None:
+        """
+        Loads a DataFrame with one INSERT ... SELECT over the frame registered as a view.
+
+        DuckDB scans the pandas columns directly, so no parameters are bound and
+        `batch_size` and `schema` are not needed.
+        """
+        view = "etl_frame_" + re.sub(r"\W", "_", table_name)
+        columns = ", ".join(self.quote_identifier(col) for col in df.columns)
+        cursor.register(view, df)
+        try:
+            with trace_span("db.insert_batch", **{"db.table": table_name, "db.rows": len(df)}):
+                cursor.execute(f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {view}")
+        finally:
+            cursor.unregister(view)
+
+    def _collect(self, cursor: _DuckDBCursor) -> Optional[pd.DataFrame]:
+        """
+        Fetches the pending result set as a whole DataFrame, converted by DuckDB from its columnar result.
+
+        Args:
+            cursor (_DuckDBCursor): A cursor on which a statement has just been executed.
+
+        Returns:
+            Optional[pd.DataFrame]: The result set, or None if it is empty or the statement returns no rows.
+        """
+        if cursor.description is None:
+            self.connection.commit()
+            return None
+        if self.dtype_backend == "pyarrow":
+            dataframe = cursor.fetch_arrow_table().to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            dataframe = cursor.fetchdf()
+        return dataframe if len(dataframe) else None
+
+
+CONNECTORS: Dict[str, Type[EmbeddedConnector]] = {"sqlite": SQLiteConnector, "duckdb": DuckDBConnector}
+
+
+def load_database_config(config_path: str = "config/config.yaml") -> Dict[str, Any]:
+    """
+    Read the `database` section of the configuration file.
+
+    Args:
+        config_path (str): Path to the YAML configuration file. Defaults to "config/config.yaml".
+
+    Returns:
+        Dict[str, Any]: The section, or an empty dict if the file or the section is missing.
+    """
+    if not os.path.exists(config_path):
+        return {}
+    import yaml
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        return (yaml.safe_load(f) or {}).get("database") or {}
+
+
+def get_connector(database_config: Optional[Dict[str, Any]] = None) -> SQLDatabaseConnector:
+    """
+    Create the connector of the configured database backend.
+
+    DB_BACKEND and DB_PATH override the `backend` and `path` keys of the section.
+    The SQL Server connector reads its credentials from the SQL_* environment variables.
+
+    Args:
+        database_config (Optional[Dict[str, Any]]): Section with `backend` ("sqlserver", "sqlite"
+            or "duckdb") and, for the embedded backends, `path`.
+
+    Returns:
+        SQLDatabaseConnector: A connector that is not yet connected. Defaults to SQL Server.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    database_config = database_config or {}
+    backend = (os.getenv("DB_BACKEND") or database_config.get("backend") or "sqlserver").lower()
+    if backend == "sqlserver":
+        return SQLDatabaseConnector.from_env()
+    if backend not in CONNECTORS:
+        logger.error(f"Unknown database backend: {backend}")
+        raise ValueError(f"Unknown database backend '{backend}'. Expected one of {BACKENDS}.")
+
+    path = os.getenv("DB_PATH") or database_config.get("path") or DEFAULT_PATHS[backend]
+    logger.info(f"Using the {backend} backend at {path}.")
+    return CONNECTORS[backend](path)
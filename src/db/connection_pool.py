@@ -0,0 +1,330 @@
+"""
+Module: connection_pool
+Provides a thread-safe pool of database connections.
+
+The pool keeps between `min_size` and `max_size` open connections so that
+parallel loaders and concurrent ETL runs can reuse connections instead of
+paying the login handshake for every run. Connections are validated on
+checkout, idle connections are evicted after `idle_timeout` seconds, and
+checkout wait times are tracked in the pool statistics.
+
+Dependencies:
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> pool = ConnectionPool(factory=lambda: pyodbc.connect(conn_str), min_size=1, max_size=4)
+    >>> with pool.connection() as conn:
+    ...     conn.cursor().execute("SELECT 1")
+    >>> pool.stats()
+    >>> pool.close()
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of the connection pool usage.
+
+    Attributes:
+        size (int): Number of connections currently owned by the pool (idle + in use).
+        idle (int): Number of idle connections ready for checkout.
+        in_use (int): Number of connections currently checked out.
+        max_size (int): Maximum number of connections allowed.
+        checkouts (int): Total number of successful checkouts.
+        created (int): Total number of connections opened by the pool.
+        evicted (int): Total number of connections closed because they were idle or failed validation.
+        timeouts (int): Total number of checkouts that timed out waiting for a connection.
+        total_wait_seconds (float): Accumulated time spent waiting for checkouts.
+        max_wait_seconds (float): Longest single checkout wait.
+    """
+
+    size: int
+    idle: int
+    in_use: int
+    max_size: int
+    checkouts: int
+    created: int
+    evicted: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        """Average checkout wait in seconds."""
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class ConnectionPool:
+    """
+    A thread-safe connection pool with liveness validation and idle eviction.
+
+    Args:
+        factory (Callable[[], Any]): Callable that opens and returns a new DB-API connection.
+        min_size (int): Number of connections opened eagerly and kept through idle eviction. Defaults to 1.
+        max_size (int): Maximum number of connections the pool may own. Defaults to 5.
+        timeout (float): Seconds to wait for a free connection before raising TimeoutError. Defaults to 30.
+        idle_timeout (float): Seconds after which an idle connection above `min_size` is closed. Defaults to 300.
+        validation_query (str): Query used to check that a connection is alive on checkout. Defaults to "SELECT 1".
+
+    Raises:
+        ValueError: If the size limits are inconsistent.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        idle_timeout: float = 300.0,
+        validation_query: str = "SELECT 1",
+    ) -> None:
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.validation_query = validation_query
+
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._checkouts = 0
+        self._created = 0
+        self._evicted = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+        for _ in range(min_size):
+            conn = self._open()
+            self._idle.append((conn, time.monotonic()))
+            self._size += 1
+        logger.info(f"Connection pool initialized (min_size={min_size}, max_size={max_size}).")
+
+    def _open(self) -> Any:
+        """Open a new connection through the factory."""
+        conn = self.factory()
+        with self._cond:
+            self._created += 1
+        return conn
+
+    def _is_alive(self, conn: Any) -> bool:
+        """Run the validation query on a connection and report whether it succeeded."""
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.validation_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        """Close a connection, ignoring errors from already broken connections."""
+        try:
+            conn.close()
+        except Exception:
+            logger.debug("Ignoring error while closing pooled connection.")
+
+    def _pop_expired_locked(self) -> List[Any]:
+        """Remove idle connections older than `idle_timeout`, keeping at least `min_size` connections."""
+        expired = []
+        now = time.monotonic()
+        kept: Deque[Tuple[Any, float]] = deque()
+        for conn, last_used in self._idle:
+            if now - last_used > self.idle_timeout and self._size > self.min_size:
+                expired.append(conn)
+                self._size -= 1
+                self._evicted += 1
+            else:
+                kept.append((conn, last_used))
+        self._idle = kept
+        return expired
+
+    def evict_idle(self) -> int:
+        """
+        Close idle connections that exceeded `idle_timeout`.
+
+        Returns:
+            int: The number of connections closed.
+        """
+        with self._cond:
+            expired = self._pop_expired_locked()
+            if expired:
+                self._cond.notify_all()
+        for conn in expired:
+            self._close_quietly(conn)
+        if expired:
+            logger.debug(f"Evicted {len(expired)} idle pooled connections.")
+        return len(expired)
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a validated connection, opening a new one if the pool is below `max_size`.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a free connection. Defaults to the pool timeout.
+
+        Returns:
+            Any: A live DB-API connection. It must be returned with `release`.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+            TimeoutError: If no connection becomes available in time.
+        """
+        start = time.monotonic()
+        deadline = start + (self.timeout if timeout is None else timeout)
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                expired = self._pop_expired_locked()
+                conn = None
+                must_open = False
+                if self._idle:
+                    # LIFO keeps the most recently used connections warm
+                    conn, _ = self._idle.pop()
+                    self._in_use += 1
+                elif self._size < self.max_size:
+                    self._size += 1
+                    self._in_use += 1
+                    must_open = True
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise TimeoutError(
+                            f"Timed out after {time.monotonic() - start:.2f}s waiting for a pooled connection."
+                        )
+                    self._cond.wait(remaining)
+                    continue
+
+            for expired_conn in expired:
+                self._close_quietly(expired_conn)
+
+            if must_open:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_alive(conn):
+                logger.warning("Discarding pooled connection that failed validation.")
+                self.release(conn, discard=True)
+                continue
+
+            waited = time.monotonic() - start
+            with self._cond:
+                self._checkouts += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """
+        Return a checked out connection to the pool.
+
+        Args:
+            conn (Any): The connection obtained from `acquire`.
+            discard (bool): Close the connection instead of keeping it. Defaults to False.
+        """
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._size -= 1
+                self._evicted += int(discard)
+                close = True
+            else:
+                self._idle.append((conn, time.monotonic()))
+                close = False
+            self._cond.notify()
+        if close:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Check out a connection for the duration of a `with` block.
+
+        Pending work is rolled back if the block raises, so the connection is
+        returned to the pool in a clean state.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a free connection. Defaults to the pool timeout.
+
+        Yields:
+            Any: A live DB-API connection.
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        except BaseException:
+            discard = False
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+            self.release(conn, discard=discard)
+            raise
+        self.release(conn)
+
+    def stats(self) -> PoolStats:
+        """
+        Return a snapshot of the pool usage statistics.
+
+        Returns:
+            PoolStats: Current pool size, usage and wait statistics.
+        """
+        with self._cond:
+            return PoolStats(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._in_use,
+                max_size=self.max_size,
+                checkouts=self._checkouts,
+                created=self._created,
+                evicted=self._evicted,
+                timeouts=self._timeouts,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+    def close(self) -> None:
+        """
+        Close all idle connections and stop handing out new ones.
+
+        Connections still checked out are closed when they are released.
+        """
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._size -= len(idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+        logger.info("Connection pool closed.")
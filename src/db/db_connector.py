@@ -3,9 +3,12 @@ Module: db_connector
 This module provides the `SQLDatabaseConnector` class for connecting to and interacting with a Microsoft SQL Server database using PyODBC.
 
 The class allows for establishing a connection to the database, executing SQL queries, and closing the connection.
+Connections can optionally be pooled (see `src.db.connection_pool`) and checked out per thread.
+
+Embedded SQLite and DuckDB databases are available behind the same interface through `src.db.backends`.
 
 Dependencies:
-    pyodbc: A Python DB-API module for ODBC.
+    pyodbc: A Python DB-API module for ODBC. Only required to connect to SQL Server; imported on first use.
     pandas: A data analysis and manipulation library that provides data structures and functions needed to work with structured data.
 
 Classes:
@@ -27,16 +30,72 @@ Usage Example:
     >>> query = "SELECT * FROM table_name WHERE column = ?"
     >>> result_df = sql_connector.execute_query(query, params=[value])
 
+    >>> # Stream a large result set in bounded chunks
+    >>> for chunk in sql_connector.iter_query(query, params=[value], chunk_size=50000):
+    ...     process(chunk)
+
+    >>> # Bulk insert a DataFrame in batches
+    >>> sql_connector.bulk_insert("table_name", df, batch_size=1000)
+
+    >>> # Upsert by business key through a staging table and a single MERGE
+    >>> sql_connector.upsert("table_name", df, key_columns=["id"])
+
+    >>> # Share connections across threads through a pool
+    >>> sql_connector.create_pool(min_size=1, max_size=4)
+    >>> with sql_connector.checkout() as session:
+    ...     session.bulk_insert("table_name", df)
+
     >>> # Disconnect from the database
     >>> sql_connector.disconnect()
 """
 
-from typing import List, Optional, Union
+import copy
+import functools
+import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import pandas as pd
-import pyodbc
 from loguru import logger
 
+from src.db.connection_pool import ConnectionPool
+from src.db.query_registry import QueryRegistry, default_registry
+from src.db.result_builder import build_frame
+from src.db.schema import ColumnType, infer_schema
+from src.utils.logger import ProgressLog, SampledLog
+from src.utils.metrics import trace_span
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_ARRAYSIZE = 10000
+PREPARED_CURSOR_LIMIT = 32
+LOAD_MODES = ("replace", "append")
+
+# Success lines of single statements are sampled: row-by-row callers would log every statement
+_query_log = SampledLog("Executed {count} queries ({total} in total); the last one returned {rows} rows.")
+_file_query_log = SampledLog(
+    "Executed {count} queries from SQL files ({total} in total); the last one ({file_path}) returned {rows} rows."
+)
+
+
+@functools.lru_cache(maxsize=None)
+def load_pyodbc() -> Optional[ModuleType]:
+    """
+    Import pyodbc on first use, so that importing the connector does not load the ODBC driver manager.
+
+    Returns:
+        Optional[ModuleType]: The pyodbc module, or None if it is not installed (the embedded
+        backends of src.db.backends run without it).
+    """
+    try:
+        import pyodbc
+    except ImportError:
+        return None
+    return pyodbc
+
 
 class SQLDatabaseConnector:
     """
@@ -48,6 +107,8 @@ class SQLDatabaseConnector:
         use_windows_auth (bool): Whether to use Windows Authentication (True) or SQL Server Authentication (False).
         username (str, optional): The username for SQL Server Authentication. Required if use_windows_auth is False.
         password (str, optional): The password for SQL Server Authentication. Required if use_windows_auth is False.
+        arraysize (int, optional): Number of rows fetched per `fetchmany` call when reading result sets. Defaults to 10000.
+        dtype_backend (str, optional): "numpy" or "pyarrow" column types for result sets. Defaults to "numpy".
 
     Attributes:
         server (str): The server name or IP address of the SQL Server instance.
@@ -55,7 +116,12 @@ class SQLDatabaseConnector:
         use_windows_auth (bool): Indicates if Windows Authentication is used.
         username (Optional[str]): Username for SQL Server Authentication.
         password (Optional[str]): Password for SQL Server Authentication.
+        arraysize (int): Number of rows fetched per `fetchmany` call when reading result sets.
+        dtype_backend (str): Column type backend used to build result set DataFrames.
         connection (Optional[pyodbc.Connection]): The connection object to the database. Initially None.
+        pool (Optional[ConnectionPool]): Connection pool used by `checkout`. Initially None.
+        query_registry (QueryRegistry): Cache of SQL files read by `execute_query_from_file`.
+        driver_errors (Tuple[Type[Exception], ...]): Exceptions of the database driver, caught and re-raised as RuntimeError.
     """
 
     def __init__(
@@ -65,6 +131,8 @@ class SQLDatabaseConnector:
         use_windows_auth: bool,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        arraysize: int = DEFAULT_ARRAYSIZE,
+        dtype_backend: str = "numpy",
     ) -> None:
         """
         Initialize the SQLDatabaseConnector object.
@@ -75,13 +143,91 @@ class SQLDatabaseConnector:
             use_windows_auth (bool): Whether to use Windows Authentication or not.
             username (Optional[str]): The username for SQL Server Authentication.
             password (Optional[str]): The password for SQL Server Authentication.
+            arraysize (int): Number of rows fetched per `fetchmany` call. Defaults to 10000.
+            dtype_backend (str): "numpy" or "pyarrow" column types for result sets. Defaults to "numpy".
         """
         self.server = server
         self.database = database
         self.use_windows_auth = use_windows_auth
         self.username = username
         self.password = password
+        self.arraysize = arraysize
+        self.dtype_backend = dtype_backend
         self.connection = None
+        self.pool: Optional[ConnectionPool] = None
+        self.query_registry: QueryRegistry = default_registry
+        self._prepared_cursors: "OrderedDict[str, pyodbc.Cursor]" = OrderedDict()
+        # Pool the connection was checked out from, on the sessions yielded by `checkout`
+        self._checkout_pool: Optional[ConnectionPool] = None
+
+    @classmethod
+    def from_env(cls) -> "SQLDatabaseConnector":
+        """
+        Creates a connector for SQL Server Authentication from the SQL_* environment variables.
+
+        Returns:
+            SQLDatabaseConnector: A connector that is not yet connected.
+        """
+        return cls(
+            server=os.getenv("SQL_SERVER"),
+            database=os.getenv("SQL_DATABASE"),
+            use_windows_auth=False,
+            username=os.getenv("SQL_USERNAME"),
+            password=os.getenv("SQL_PASSWORD"),
+        )
+
+    @property
+    def driver_errors(self) -> Tuple[Type[Exception], ...]:
+        """Exceptions of the database driver, caught and re-raised as RuntimeError."""
+        pyodbc = load_pyodbc()
+        return (pyodbc.Error,) if pyodbc else ()
+
+    def _build_connection_string(self) -> str:
+        """
+        Builds the ODBC connection string for the configured authentication mode.
+
+        Returns:
+            str: The ODBC connection string.
+
+        Raises:
+            ValueError: If SQL Server Authentication is used without username or password.
+        """
+        if self.use_windows_auth:
+            # Connection string using Windows Authentication
+            return (
+                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+                f"SERVER={self.server};"
+                f"DATABASE={self.database};"
+                f"Trusted_Connection=yes;"
+            )
+        if not self.username or not self.password:
+            raise ValueError(
+                "Username and password are required for SQL Server Authentication."
+            )
+        # Connection string for SQL Server Authentication
+        return (
+            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+            f"SERVER={self.server};"
+            f"DATABASE={self.database};"
+            f"UID={self.username};"
+            f"PWD={self.password};"
+        )
+
+    def open_connection(self) -> "pyodbc.Connection":
+        """
+        Opens a new raw connection to the SQL Server database without binding it to the connector.
+
+        Returns:
+            pyodbc.Connection: A new database connection.
+
+        Raises:
+            RuntimeError: If pyodbc is not installed.
+            pyodbc.Error: If there is an error with the database connection.
+        """
+        pyodbc = load_pyodbc()
+        if pyodbc is None:
+            raise RuntimeError("pyodbc is not installed; it is required to connect to SQL Server.")
+        return pyodbc.connect(self._build_connection_string())
 
     def connect(self) -> None:
         """
@@ -91,56 +237,295 @@ class SQLDatabaseConnector:
             pyodbc.Error: If there is an error with the database connection.
         """
         try:
-            if self.use_windows_auth:
-                # Connection string using Windows Authentication
-                connection_string = (
-                    f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                    f"SERVER={self.server};"
-                    f"DATABASE={self.database};"
-                    f"Trusted_Connection=yes;"
-                )
-            else:
-                if not self.username or not self.password:
-                    raise ValueError(
-                        "Username and password are required for SQL Server Authentication."
-                    )
-                # Connection string for SQL Server Authentication
-                connection_string = (
-                    f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                    f"SERVER={self.server};"
-                    f"DATABASE={self.database};"
-                    f"UID={self.username};"
-                    f"PWD={self.password};"
-                )
-
-            self.connection = pyodbc.connect(connection_string)
+            self.connection = self.open_connection()
             logger.info("Successfully connected to the SQL database.")
-        except pyodbc.Error as e:
+        except self.driver_errors as e:
             logger.exception("Failed to connect to the database.")
             raise RuntimeError(
                 "Database connection failed. Check logs for details."
             ) from e
 
+    def create_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        idle_timeout: float = 300.0,
+    ) -> ConnectionPool:
+        """
+        Creates a thread-safe connection pool for this connector and uses it for `checkout`.
+
+        Args:
+            min_size (int): Number of connections kept open. Defaults to 1.
+            max_size (int): Maximum number of concurrent connections. Defaults to 5.
+            timeout (float): Seconds to wait for a free connection on checkout. Defaults to 30.
+            idle_timeout (float): Seconds after which idle connections above min_size are closed. Defaults to 300.
+
+        Returns:
+            ConnectionPool: The pool attached to the connector.
+
+        Raises:
+            RuntimeError: If the initial connections cannot be opened.
+        """
+        try:
+            self.pool = ConnectionPool(
+                factory=self.open_connection,
+                min_size=min_size,
+                max_size=max_size,
+                timeout=timeout,
+                idle_timeout=idle_timeout,
+            )
+            return self.pool
+        except self.driver_errors as e:
+            logger.exception("Failed to create the connection pool.")
+            raise RuntimeError(
+                "Connection pool creation failed. Check logs for details."
+            ) from e
+
+    @contextmanager
+    def checkout(
+        self, pool: Optional[ConnectionPool] = None
+    ) -> Iterator["SQLDatabaseConnector"]:
+        """
+        Yields a connector bound to a pooled connection for the duration of a `with` block.
+
+        The yielded connector exposes the same query and load methods and can be used safely
+        from its own thread. Its `disconnect` only returns its connection to the pool, which
+        stays open for the other sessions. Without a pool, the connector itself is yielded.
+
+        Args:
+            pool (Optional[ConnectionPool]): Pool to check out from. Defaults to the connector's own pool.
+
+        Yields:
+            SQLDatabaseConnector: A connector bound to a checked out connection.
+        """
+        pool = pool or self.pool
+        if pool is None:
+            yield self
+            return
+
+        session = copy.copy(self)
+        session.connection = pool.acquire()
+        session._prepared_cursors = OrderedDict()
+        session._checkout_pool = pool
+        try:
+            yield session
+        except BaseException:
+            session._end_checkout(failed=True)
+            raise
+        session._end_checkout()
+
+    def _end_checkout(self, failed: bool = False) -> None:
+        """
+        Returns the connection of a `checkout` session to its pool, once.
+
+        Pending work is rolled back if the session failed, so the connection is returned in a
+        clean state; a connection that cannot be rolled back is discarded.
+
+        Args:
+            failed (bool): Whether the `with` block raised. Defaults to False.
+        """
+        pool, self._checkout_pool = self._checkout_pool, None
+        if pool is None:
+            return
+        self._close_prepared_cursors()
+        connection, self.connection = self.connection, None
+        discard = False
+        if failed:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        pool.release(connection, discard=discard)
+
     def disconnect(self) -> None:
         """
-        Closes the connection to the SQL Server database.
+        Closes the connection to the SQL Server database and the connection pool, if any.
+
+        On a session yielded by `checkout`, only returns the session's connection to the pool.
 
         Raises:
             pyodbc.Error: If there is an error with the database during disconnection.
         """
+        if self._checkout_pool is not None:
+            self._end_checkout()
+            return
         try:
+            if self.pool:
+                self.pool.close()
+                self.pool = None
+            self._close_prepared_cursors()
             if self.connection:
                 self.connection.close()
                 logger.info("Successfully disconnected from the SQL database.")
-        except pyodbc.Error as e:
+        except self.driver_errors as e:
             logger.exception("Failed to disconnect from the database.")
             raise RuntimeError("Failed to disconnect from the database.") from e
 
+    def _prepared_cursor(self, query: str) -> "pyodbc.Cursor":
+        """
+        Returns the cursor dedicated to a query text, creating it if needed.
+
+        pyodbc only re-prepares a statement when the SQL text differs from the last one executed
+        on the cursor, so keeping one cursor per text lets the driver reuse the prepared plan.
+        The least recently used cursor is closed beyond `PREPARED_CURSOR_LIMIT` texts.
+
+        Args:
+            query (str): The SQL text.
+
+        Returns:
+            pyodbc.Cursor: A cursor on the current connection.
+        """
+        cursor = self._prepared_cursors.get(query)
+        if cursor is not None:
+            self._prepared_cursors.move_to_end(query)
+            return cursor
+
+        cursor = self.connection.cursor()
+        cursor.arraysize = self.arraysize
+        self._prepared_cursors[query] = cursor
+        if len(self._prepared_cursors) > PREPARED_CURSOR_LIMIT:
+            _, evicted = self._prepared_cursors.popitem(last=False)
+            evicted.close()
+        return cursor
+
+    def quote_identifier(self, name: str) -> str:
+        """Quotes a column name for the SQL dialect of the connection."""
+        return f"[{name}]"
+
+    def _discard_prepared_cursor(self, query: str) -> None:
+        """Closes and forgets the cursor of a query text, e.g. after a failed execution."""
+        cursor = self._prepared_cursors.pop(query, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except self.driver_errors:
+                pass
+
+    def _close_prepared_cursors(self) -> None:
+        """Closes every cached prepared cursor."""
+        for query in list(self._prepared_cursors):
+            self._discard_prepared_cursor(query)
+
+    def _iter_frames(
+        self, cursor: "pyodbc.Cursor", chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yields DataFrames built from `fetchmany` batches of an executed cursor.
+
+        Each batch is converted column by column into typed arrays (see `src.db.result_builder`),
+        using the types reported by `cursor.description`.
+
+        Args:
+            cursor (pyodbc.Cursor): A cursor holding a pending result set.
+            chunk_size (int): The maximum number of rows per yielded DataFrame.
+
+        Yields:
+            pd.DataFrame: The next batch of rows.
+        """
+        description = cursor.description
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield build_frame(rows, description, self.dtype_backend)
+
+    def iter_query(
+        self,
+        query: str,
+        params: Optional[List[Union[str, int]]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Executes a SQL query and lazily yields its result set as DataFrame chunks.
+
+        Only one chunk is held in memory at a time, which keeps memory bounded for large extracts.
+        Statements without a result set are committed and yield nothing.
+
+        Args:
+            query (str): The SQL query to execute, with `?` placeholders for parameters.
+            params (Optional[List[Union[str, int]]]): The parameters to pass with the query. Defaults to None.
+            chunk_size (Optional[int]): The number of rows per chunk. Defaults to the connector's `arraysize`.
+
+        Yields:
+            pd.DataFrame: The next chunk of the result set.
+
+        Raises:
+            RuntimeError: If there is an error with the SQL query execution.
+        """
+        chunk_size = chunk_size or self.arraysize
+        try:
+            logger.debug("Executing query: {} with parameters: {}", query, params)
+            with self.connection.cursor() as cursor:
+                cursor.arraysize = chunk_size
+                cursor.execute(query, params or [])
+
+                if cursor.description is None:
+                    self.connection.commit()
+                    _query_log.hit(rows=0)
+                    return
+
+                total_rows = 0
+                for chunk in self._iter_frames(cursor, chunk_size):
+                    total_rows += len(chunk)
+                    yield chunk
+                logger.info("Query streamed successfully. Retrieved {} rows.", total_rows)
+        except self.driver_errors as e:
+            logger.exception("Query execution failed.")
+            raise RuntimeError("Query execution failed. Check logs for details.") from e
+
+    def _execute(
+        self, query: str, params: Optional[List[Union[str, int]]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Executes a SQL query and returns its results as a single DataFrame if it produces a result set.
+
+        Rows are fetched through the same `fetchmany` path as `iter_query`, so only one raw batch of
+        driver rows is alive at a time while the DataFrame is being assembled.
+
+        Args:
+            query (str): The SQL query to execute, with `?` placeholders for parameters.
+            params (Optional[List[Union[str, int]]]): The parameters to pass with the query.
+
+        Returns:
+            Optional[pd.DataFrame]: The query results for statements that return rows, otherwise None.
+        """
+        with trace_span("db.query", **{"db.statement": query[:200]}) as span, self.connection.cursor() as cursor:
+            cursor.arraysize = self.arraysize
+            cursor.execute(query, params or [])
+            dataframe = self._collect(cursor)
+            span.set_attribute("db.rows", 0 if dataframe is None else len(dataframe))
+            return dataframe
+
+    def _collect(self, cursor: "pyodbc.Cursor") -> Optional[pd.DataFrame]:
+        """
+        Fetches the pending result set of an executed cursor, or commits when there is none.
+
+        Result sets are detected from `cursor.description`, so CTEs, stored procedures and
+        `INSERT ... OUTPUT` statements are handled like plain SELECTs.
+
+        Args:
+            cursor (pyodbc.Cursor): A cursor on which a statement has just been executed.
+
+        Returns:
+            Optional[pd.DataFrame]: The result set, or None if it is empty or the statement returns no rows.
+        """
+        if cursor.description is not None:
+            chunks = list(self._iter_frames(cursor, self.arraysize))
+            if not chunks:
+                return None
+            if len(chunks) == 1:
+                return chunks[0]
+            return pd.concat(chunks, ignore_index=True)
+
+        self.connection.commit()
+        return None
+
     def execute_query(
         self, query: str, params: Optional[List[Union[str, int]]] = None
     ) -> Optional[pd.DataFrame]:
         """
-        Executes a SQL query on the connected database and returns the results as a pandas DataFrame if the query is a SELECT statement.
+        Executes a SQL query on the connected database and returns the results as a pandas DataFrame if the query returns a result set.
 
         Args:
             query (str): The SQL query to execute, with `?` placeholders for parameters.
@@ -153,32 +538,11 @@ class SQLDatabaseConnector:
             pyodbc.Error: If there is an error with the SQL query execution.
         """
         try:
-            logger.debug(f"Executing query: {query} with parameters: {params}")
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params or [])
-
-                if "SELECT" in query.upper():
-                    data = cursor.fetchall()
-                    columns = [desc[0] for desc in cursor.description]
-
-                    if data:
-                        data_as_lists = [list(row) for row in data]
-                        if len(data_as_lists[0]) == len(columns):
-                            dataframe = pd.DataFrame(data_as_lists, columns=columns)
-                            logger.info(
-                                f"Query executed successfully. Retrieved {len(dataframe)} rows."
-                            )
-                            return dataframe
-                        else:
-                            logger.exception("Mismatch between data shape and columns.")
-                            raise ValueError(
-                                "Shape of passed values does not match the column names."
-                            )
-                else:
-                    self.connection.commit()
-                    logger.info("Query executed successfully.")
-                    return None
-        except pyodbc.Error as e:
+            logger.debug("Executing query: {} with parameters: {}", query, params)
+            dataframe = self._execute(query, params)
+            _query_log.hit(rows=0 if dataframe is None else len(dataframe))
+            return dataframe
+        except self.driver_errors as e:
             logger.exception("Query execution failed.")
             raise RuntimeError("Query execution failed. Check logs for details.") from e
 
@@ -186,7 +550,10 @@ class SQLDatabaseConnector:
         self, file_path: str, params: Optional[List[Union[str, int]]] = None
     ) -> Optional[pd.DataFrame]:
         """
-        Executes a SQL query from a file and returns the results as a pandas DataFrame if the query is a SELECT statement.
+        Executes a SQL query from a file and returns the results as a pandas DataFrame if the query returns a result set.
+
+        The file is read once through the `query_registry` (and again only when it changes on disk),
+        and repeated executions reuse the same prepared cursor, which makes row-by-row calls cheap.
 
         Args:
             file_path (str): The path to the SQL file containing the query.
@@ -200,45 +567,317 @@ class SQLDatabaseConnector:
             pyodbc.Error: If there is an error with the SQL query execution.
         """
         try:
-            logger.debug(f"Reading SQL query from file: {file_path}")
-            with open(file_path, "r", encoding="utf-8") as file:
-                query = file.read()
-
-            logger.debug(
-                f"Executing query from file: {file_path} with parameters: {params}"
-            )
-
-            # Executar a query lida do arquivo e retornar um DataFrame se for um SELECT
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params or [])
-
-                if "SELECT" in query.upper():
-                    data = cursor.fetchall()
-                    columns = [desc[0] for desc in cursor.description]
-
-                    if data:
-                        data_as_lists = [list(row) for row in data]
-                        if len(data_as_lists[0]) == len(columns):
-                            dataframe = pd.DataFrame(data_as_lists, columns=columns)
-                            logger.info(
-                                f"Query from file executed successfully. Retrieved {len(dataframe)} rows."
-                            )
-                            return dataframe
-                        else:
-                            logger.exception("Mismatch between data shape and columns.")
-                            raise ValueError(
-                                "Shape of passed values does not match the column names."
-                            )
-                else:
-                    self.connection.commit()
-                    logger.info("Query from file executed successfully.")
-                    return None
+            compiled = self.query_registry.get(file_path)
+            logger.debug("Executing query from file: {} with parameters: {}", file_path, params)
+            cursor = self._prepared_cursor(compiled.text)
+            try:
+                with trace_span("db.query", **{"db.statement": compiled.text[:200], "db.file": file_path}):
+                    cursor.execute(compiled.text, params or [])
+                    dataframe = self._collect(cursor)
+            except self.driver_errors:
+                self._discard_prepared_cursor(compiled.text)
+                raise
+            _file_query_log.hit(rows=0 if dataframe is None else len(dataframe), file_path=file_path)
+            return dataframe
 
         except FileNotFoundError as e:
             logger.exception(f"SQL file not found: {file_path}")
             raise e
-        except pyodbc.Error as e:
+        except self.driver_errors as e:
             logger.exception("Query execution from file failed.")
             raise RuntimeError(
                 "Query execution from file failed. Check logs for details."
             ) from e
+
+    def create_table(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        if_exists: str = "replace",
+        schema: Optional[Dict[str, ColumnType]] = None,
+    ) -> None:
+        """
+        Creates a table with one typed column per DataFrame column.
+
+        Args:
+            table_name (str): The name of the table to create.
+            df (pd.DataFrame): The DataFrame whose columns define the table.
+            if_exists (str): "replace" drops and recreates an existing table; "append" keeps an
+                existing table and only creates it when missing. Defaults to "replace".
+            schema (Optional[Dict[str, ColumnType]]): Column types by name. Defaults to the types
+                inferred by `src.db.schema.infer_schema`.
+
+        Raises:
+            ValueError: If if_exists is not one of LOAD_MODES.
+            RuntimeError: If the statement fails.
+        """
+        if if_exists not in LOAD_MODES:
+            raise ValueError(f"if_exists must be one of {LOAD_MODES}, got '{if_exists}'.")
+
+        schema = schema or infer_schema(df)
+        columns = ", ".join([f"[{col}] {schema[col].sql}" for col in df.columns])
+        if if_exists == "replace":
+            create_table_sql = (
+                f"IF OBJECT_ID('{table_name}', 'U') IS NOT NULL DROP TABLE {table_name};"
+                f"CREATE TABLE {table_name} ({columns});"
+            )
+        else:
+            create_table_sql = (
+                f"IF OBJECT_ID('{table_name}', 'U') IS NULL CREATE TABLE {table_name} ({columns});"
+                + self._widen_columns_sql(table_name, {col: schema[col] for col in df.columns})
+            )
+        self.execute_query(create_table_sql)
+        logger.debug("Table {} ready ({}).", table_name, if_exists)
+
+    @staticmethod
+    def _widen_columns_sql(table_name: str, schema: Dict[str, ColumnType]) -> str:
+        """
+        Builds the statements that widen the NVARCHAR columns of an existing table to the given sizes.
+
+        Appended batches, streaming chunks and upserts are sized from their own values while the
+        table keeps the sizes of its first load, so longer strings would otherwise be rejected.
+        A column is only altered when it is narrower than the new size; it is never shrunk.
+
+        Args:
+            table_name (str): The name of the target table.
+            schema (Dict[str, ColumnType]): Column types inferred from the data about to be loaded.
+
+        Returns:
+            str: The conditional ALTER statements, empty if no column is an NVARCHAR.
+        """
+        statements = []
+        for col, column in schema.items():
+            if not column.sql.upper().startswith("NVARCHAR("):
+                continue
+            # sys.columns.max_length is in bytes (2 per character), -1 for NVARCHAR(MAX)
+            narrower_bytes = 2 * column.size - 1 if column.size else 8000
+            column_name = col.replace("'", "''")
+            statements.append(
+                f"IF EXISTS (SELECT 1 FROM sys.columns WHERE object_id = OBJECT_ID('{table_name}') "
+                f"AND name = '{column_name}' AND system_type_id = 231 "
+                f"AND max_length BETWEEN 0 AND {narrower_bytes}) "
+                f"ALTER TABLE {table_name} ALTER COLUMN [{col}] {column.sql};"
+            )
+        return "".join(statements)
+
+    def _insert_batches(
+        self,
+        cursor: "pyodbc.Cursor",
+        table_name: str,
+        df: pd.DataFrame,
+        batch_size: int,
+        schema: Optional[Dict[str, ColumnType]],
+    ) -> None:
+        """
+        Sends the rows of a DataFrame to an INSERT statement in `executemany` batches, without committing.
+
+        Args:
+            cursor (pyodbc.Cursor): Cursor of the transaction that receives the rows.
+            table_name (str): The name of the target table.
+            df (pd.DataFrame): The data to insert.
+            batch_size (int): The number of rows per `executemany` call.
+            schema (Optional[Dict[str, ColumnType]]): Column types used to bind parameters.
+        """
+        columns = ", ".join(self.quote_identifier(col) for col in df.columns)
+        placeholders = ", ".join(["?"] * len(df.columns))
+        insert_sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+        values = df.to_numpy(dtype=object, na_value=None)
+        progress = ProgressLog(f"Inserting into {table_name}", total=len(values), level="DEBUG")
+
+        cursor.fast_executemany = True
+        # Columns without an explicit binding (e.g. mixed types) are left to the driver with None
+        input_sizes = [schema[col].input_size for col in df.columns] if schema else []
+        if any(size is not None for size in input_sizes):
+            cursor.setinputsizes(input_sizes)
+        for offset in range(0, len(values), batch_size):
+            batch = values[offset : offset + batch_size].tolist()
+            with trace_span("db.insert_batch", **{"db.table": table_name, "db.rows": len(batch)}):
+                cursor.executemany(insert_sql, batch)
+            progress.advance(len(batch))
+
+    def bulk_insert(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        schema: Optional[Dict[str, ColumnType]] = None,
+    ) -> int:
+        """
+        Inserts a pandas DataFrame into a table using batched `executemany` calls with `fast_executemany` enabled.
+
+        Parameters are built from a single object NumPy array (missing values mapped to None) instead of
+        iterating over Series rows, and the whole load is committed once at the end. When a schema is
+        given, parameters are bound with `setinputsizes` to the column types instead of as LOBs.
+
+        Args:
+            table_name (str): The name of the target table.
+            df (pd.DataFrame): The data to insert. Column names must match the table columns.
+            batch_size (int): The number of rows sent to the driver per `executemany` call. Defaults to 1000.
+            schema (Optional[Dict[str, ColumnType]]): Column types used to bind parameters. Defaults to None.
+
+        Returns:
+            int: The number of rows inserted.
+
+        Raises:
+            ValueError: If batch_size is smaller than 1.
+            RuntimeError: If the insert fails. The transaction is rolled back.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+        if df.empty:
+            logger.warning(f"No rows to insert into {table_name}.")
+            return 0
+
+        total_rows = len(df)
+        try:
+            logger.debug(
+                "Bulk inserting {} rows into {} in batches of {}.", total_rows, table_name, batch_size
+            )
+            start = time.perf_counter()
+            with trace_span("db.bulk_insert", **{"db.table": table_name, "db.rows": total_rows}):
+                with self.connection.cursor() as cursor:
+                    self._insert_batches(cursor, table_name, df, batch_size, schema)
+                self.connection.commit()
+            elapsed = time.perf_counter() - start
+        except self.driver_errors as e:
+            self.connection.rollback()
+            logger.exception(f"Bulk insert into {table_name} failed.")
+            raise RuntimeError(
+                f"Bulk insert into {table_name} failed. Check logs for details."
+            ) from e
+
+        rows_per_sec = total_rows / elapsed if elapsed > 0 else float("inf")
+        logger.info(
+            f"Bulk insert into {table_name} completed: {total_rows} rows in "
+            f"{elapsed:.2f}s ({rows_per_sec:,.0f} rows/sec)."
+        )
+        return total_rows
+
+    @staticmethod
+    def _build_merge_sql(
+        table_name: str,
+        staging_table: str,
+        columns: List[str],
+        key_columns: List[str],
+        delete_missing: bool,
+    ) -> str:
+        """
+        Builds a set-based MERGE from a staging table into the target table.
+
+        Matched rows are only updated when at least one non-key column changed
+        (a NULL-safe comparison through EXISTS/EXCEPT).
+
+        Args:
+            table_name (str): The target table.
+            staging_table (str): The table holding the new rows.
+            columns (List[str]): All columns to load.
+            key_columns (List[str]): Business-key columns used to match rows.
+            delete_missing (bool): Whether to delete target rows absent from the staging table.
+
+        Returns:
+            str: The MERGE statement.
+        """
+        on_clause = " AND ".join(f"target.[{col}] = source.[{col}]" for col in key_columns)
+        value_columns = [col for col in columns if col not in key_columns]
+        all_columns = ", ".join(f"[{col}]" for col in columns)
+        source_columns = ", ".join(f"source.[{col}]" for col in columns)
+
+        merge_sql = (
+            f"MERGE {table_name} WITH (HOLDLOCK) AS target "
+            f"USING {staging_table} AS source ON {on_clause} "
+        )
+        if value_columns:
+            changed = (
+                f"EXISTS (SELECT {', '.join(f'source.[{col}]' for col in value_columns)} "
+                f"EXCEPT SELECT {', '.join(f'target.[{col}]' for col in value_columns)})"
+            )
+            assignments = ", ".join(f"target.[{col}] = source.[{col}]" for col in value_columns)
+            merge_sql += f"WHEN MATCHED AND {changed} THEN UPDATE SET {assignments} "
+        merge_sql += f"WHEN NOT MATCHED BY TARGET THEN INSERT ({all_columns}) VALUES ({source_columns})"
+        if delete_missing:
+            merge_sql += " WHEN NOT MATCHED BY SOURCE THEN DELETE"
+        return merge_sql + ";"
+
+    @staticmethod
+    def _check_upsert_args(df: pd.DataFrame, key_columns: List[str], batch_size: int) -> None:
+        """
+        Validates the arguments of an upsert.
+
+        Raises:
+            ValueError: If key columns are missing or not unique in df, or batch_size is smaller than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+        if not key_columns:
+            raise ValueError("Upsert requires at least one key column.")
+        missing_keys = [col for col in key_columns if col not in df.columns]
+        if missing_keys:
+            raise ValueError(f"Key columns not found in DataFrame: {missing_keys}")
+        if df.duplicated(subset=key_columns).any():
+            raise ValueError(f"Key columns {key_columns} are not unique in the data to upsert.")
+
+    def upsert(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        key_columns: List[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        schema: Optional[Dict[str, ColumnType]] = None,
+        delete_missing: bool = False,
+    ) -> int:
+        """
+        Upserts a DataFrame into a table through a staging table and a single MERGE statement.
+
+        The rows are bulk loaded into a session temp table, then merged into the target in the
+        same transaction, so readers never see an empty or partially loaded table. The target
+        table is created first if it does not exist.
+
+        Args:
+            table_name (str): The name of the target table.
+            df (pd.DataFrame): The data to upsert.
+            key_columns (List[str]): Business-key columns that identify a row. They must be unique in df.
+            batch_size (int): The number of rows per `executemany` call into the staging table. Defaults to 1000.
+            schema (Optional[Dict[str, ColumnType]]): Column types. Defaults to the inferred schema.
+            delete_missing (bool): Delete target rows whose keys are not in df. Only meaningful for full
+                extracts. Defaults to False.
+
+        Returns:
+            int: The number of rows inserted, updated or deleted by the MERGE.
+
+        Raises:
+            ValueError: If key columns are missing or not unique in df, or batch_size is smaller than 1.
+            RuntimeError: If the upsert fails. The transaction is rolled back.
+        """
+        self._check_upsert_args(df, key_columns, batch_size)
+        schema = schema or infer_schema(df)
+        self.create_table(table_name, df, if_exists="append", schema=schema)
+
+        staging_table = "#stg_" + re.sub(r"\W", "_", table_name)
+        staging_columns = ", ".join(f"[{col}] {schema[col].sql}" for col in df.columns)
+        merge_sql = self._build_merge_sql(
+            table_name, staging_table, list(df.columns), key_columns, delete_missing
+        )
+
+        try:
+            start = time.perf_counter()
+            with trace_span("db.upsert", **{"db.table": table_name, "db.rows": len(df)}):
+                with self.connection.cursor() as cursor:
+                    cursor.execute(f"CREATE TABLE {staging_table} ({staging_columns});")
+                    self._insert_batches(cursor, staging_table, df, batch_size, schema)
+                    cursor.execute(merge_sql)
+                    affected_rows = cursor.rowcount
+                    cursor.execute(f"DROP TABLE {staging_table};")
+                self.connection.commit()
+            elapsed = time.perf_counter() - start
+        except self.driver_errors as e:
+            self.connection.rollback()
+            logger.exception(f"Upsert into {table_name} failed.")
+            raise RuntimeError(
+                f"Upsert into {table_name} failed. Check logs for details."
+            ) from e
+
+        logger.info(
+            f"Upsert into {table_name} completed: {len(df)} rows staged, "
+            f"{affected_rows} rows merged in {elapsed:.2f}s."
+        )
+        return affected_rows
@@ -0,0 +1,200 @@
+"""
+Module: parallel_loader
+Provides a parallel, partitioned bulk loader on top of SQLDatabaseConnector.
+
+The DataFrame is split into contiguous row partitions that are loaded
+concurrently by a thread pool, each partition on its own connection and in
+its own transaction. pyodbc releases the GIL while the driver talks to the
+server, so threads are enough to overlap the network round trips.
+
+Dependencies:
+    - pandas: For data handling.
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> result = parallel_bulk_insert(sql_connector, "bot_demo", df, partitions=4)
+    >>> result.success, result.rows_per_sec
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pandas as pd
+from loguru import logger
+
+from src.db.connection_pool import ConnectionPool
+from src.db.db_connector import DEFAULT_BATCH_SIZE, SQLDatabaseConnector
+from src.db.schema import ColumnType
+
+
+@dataclass
+class PartitionResult:
+    """
+    Outcome of loading a single partition.
+
+    Attributes:
+        partition (int): Zero-based partition number.
+        rows (int): Number of rows in the partition.
+        seconds (float): Wall time spent loading the partition, including connection checkout.
+        success (bool): Whether the partition was committed.
+        error (Optional[str]): Error message if the partition was rolled back.
+    """
+
+    partition: int
+    rows: int
+    seconds: float
+    success: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class ParallelLoadResult:
+    """
+    Aggregate outcome of a parallel load.
+
+    Attributes:
+        table_name (str): Target table.
+        seconds (float): Total wall time of the load.
+        partitions (List[PartitionResult]): Per-partition results ordered by partition number.
+    """
+
+    table_name: str
+    seconds: float
+    partitions: List[PartitionResult] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """True if every partition was committed."""
+        return all(part.success for part in self.partitions)
+
+    @property
+    def rows_loaded(self) -> int:
+        """Number of rows in committed partitions."""
+        return sum(part.rows for part in self.partitions if part.success)
+
+    @property
+    def rows_per_sec(self) -> float:
+        """Aggregate throughput of committed rows."""
+        return self.rows_loaded / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def failed_partitions(self) -> List[int]:
+        """Partition numbers that were rolled back."""
+        return [part.partition for part in self.partitions if not part.success]
+
+
+def _load_partition(
+    sql_connector: SQLDatabaseConnector,
+    pool: ConnectionPool,
+    table_name: str,
+    df: pd.DataFrame,
+    partition: int,
+    batch_size: int,
+    schema: Optional[Dict[str, ColumnType]],
+) -> PartitionResult:
+    """
+    Load one partition on its own pooled connection and transaction.
+
+    Args:
+        sql_connector (SQLDatabaseConnector): Connector used as template for the pooled session.
+        pool (ConnectionPool): Pool providing the connection.
+        table_name (str): Target table.
+        df (pd.DataFrame): Rows of the partition.
+        partition (int): Zero-based partition number.
+        batch_size (int): Rows per `executemany` batch.
+        schema (Optional[Dict[str, ColumnType]]): Column types used to bind parameters.
+
+    Returns:
+        PartitionResult: The partition outcome. Errors are captured, not raised.
+    """
+    start = time.perf_counter()
+    try:
+        with sql_connector.checkout(pool) as session:
+            session.bulk_insert(table_name, df, batch_size=batch_size, schema=schema)
+        return PartitionResult(partition, len(df), time.perf_counter() - start, True)
+    except Exception as e:
+        logger.error(f"Partition {partition} of {table_name} failed and was rolled back: {e}")
+        return PartitionResult(partition, len(df), time.perf_counter() - start, False, str(e))
+
+
+def parallel_bulk_insert(
+    sql_connector: SQLDatabaseConnector,
+    table_name: str,
+    df: pd.DataFrame,
+    partitions: int = 4,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    schema: Optional[Dict[str, ColumnType]] = None,
+) -> ParallelLoadResult:
+    """
+    Bulk insert a DataFrame by loading row partitions concurrently on separate connections.
+
+    Each partition is committed or rolled back independently. The connector's pool is used
+    when it has one; otherwise a temporary pool sized to the number of partitions is created
+    and closed once the load finishes.
+
+    Args:
+        sql_connector (SQLDatabaseConnector): Database connector used to open connections.
+        table_name (str): Target table. It must already exist.
+        df (pd.DataFrame): Data to load.
+        partitions (int): Number of partitions and concurrent connections. Defaults to 4.
+        batch_size (int): Rows per `executemany` batch inside each partition. Defaults to 1000.
+        schema (Optional[Dict[str, ColumnType]]): Column types used to bind parameters. Defaults to None.
+
+    Returns:
+        ParallelLoadResult: Per-partition timings and the aggregate outcome.
+
+    Raises:
+        ValueError: If partitions is smaller than 1.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be greater than zero.")
+
+    partitions = max(1, min(partitions, len(df)))
+    bounds = [len(df) * i // partitions for i in range(partitions + 1)]
+    slices = [df.iloc[bounds[i] : bounds[i + 1]] for i in range(partitions)]
+
+    pool = sql_connector.pool
+    owns_pool = pool is None
+    if owns_pool:
+        pool = ConnectionPool(
+            factory=sql_connector.open_connection, min_size=0, max_size=partitions
+        )
+
+    logger.info(
+        f"Starting parallel load of {len(df)} rows into {table_name} "
+        f"using {partitions} partitions."
+    )
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=partitions, thread_name_prefix=f"load-{table_name}"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _load_partition, sql_connector, pool, table_name, part, i, batch_size, schema
+                )
+                for i, part in enumerate(slices)
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        if owns_pool:
+            pool.close()
+
+    result = ParallelLoadResult(table_name, time.perf_counter() - start, results)
+    for part in result.partitions:
+        logger.debug(
+            f"Partition {part.partition}: {part.rows} rows in {part.seconds:.2f}s "
+            f"({'committed' if part.success else 'rolled back'})."
+        )
+    if result.success:
+        logger.info(
+            f"Parallel load into {table_name} completed: {result.rows_loaded} rows in "
+            f"{result.seconds:.2f}s ({result.rows_per_sec:,.0f} rows/sec)."
+        )
+    else:
+        logger.error(
+            f"Parallel load into {table_name} failed for partitions {result.failed_partitions}."
+        )
+    return result
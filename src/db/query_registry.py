@@ -0,0 +1,126 @@
+"""
+Module: query_registry
+Provides a process-wide cache of SQL files used by `execute_query_from_file`.
+
+Each file is read once and kept with its modification time, so repeated
+executions of the same file do not touch the disk again. An entry is reloaded
+as soon as the file's mtime or size changes on disk. Whether a statement
+returns rows is detected from `cursor.description` at execution time.
+
+Dependencies:
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> registry = QueryRegistry()
+    >>> compiled = registry.get("src/db/queries/select.sql")
+    >>> registry.stats()
+    {'entries': 1, 'hits': 0, 'misses': 1, 'reloads': 0}
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """
+    A SQL file loaded into memory.
+
+    Attributes:
+        path (str): Absolute path of the file.
+        text (str): SQL text as written in the file.
+        mtime_ns (int): Modification time of the file when it was read.
+        size (int): Size of the file when it was read.
+    """
+
+    path: str
+    text: str
+    mtime_ns: int
+    size: int
+
+
+class QueryRegistry:
+    """
+    Thread-safe cache of compiled SQL files, invalidated by modification time.
+
+    Attributes:
+        hits (int): Lookups served from memory.
+        misses (int): Lookups that had to read the file for the first time.
+        reloads (int): Lookups that re-read a file changed on disk.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, CompiledQuery] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def get(self, file_path: str) -> CompiledQuery:
+        """
+        Return the compiled query of a SQL file, reading it only if it is new or changed.
+
+        Args:
+            file_path (str): Path of the SQL file.
+
+        Returns:
+            CompiledQuery: The cached or freshly loaded query.
+
+        Raises:
+            FileNotFoundError: If the SQL file does not exist.
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self.hits += 1
+                return entry
+
+            if entry:
+                self.reloads += 1
+                logger.debug(f"SQL file changed on disk, reloading: {file_path}")
+            else:
+                self.misses += 1
+                logger.debug(f"Loading SQL file into the query registry: {file_path}")
+
+            with open(path, "r", encoding="utf-8") as file:
+                text = file.read()
+            entry = CompiledQuery(
+                path=path,
+                text=text,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+            self._entries[path] = entry
+            return entry
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the registry counters.
+
+        Returns:
+            Dict[str, int]: Number of cached entries, hits, misses and reloads.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+            }
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.reloads = 0
+
+
+# Shared by every connector of the process
+default_registry = QueryRegistry()
@@ -0,0 +1,106 @@
+"""
+Module: result_builder
+Builds typed, columnar DataFrames from batches of pyodbc rows.
+
+Instead of converting every Row into a list and letting pandas infer types
+row-wise (which leaves most columns as `object`), each batch is transposed
+once into per-column tuples and every column is converted straight into a
+typed array, using the Python type reported by `cursor.description`:
+    - int       -> int64, or nullable Int64 when the batch contains NULLs
+    - float     -> float64 (NULL -> NaN)
+    - bool      -> bool, or nullable boolean when the batch contains NULLs
+    - datetime  -> datetime64
+    - date      -> datetime64
+    - others    -> object (strings, Decimal, bytes, GUIDs)
+
+With the "pyarrow" backend, columns are built as Arrow arrays instead, which
+also stores strings and decimals natively.
+
+Dependencies:
+    - numpy: For typed column arrays.
+    - pandas: For DataFrame assembly.
+    - pyarrow (optional): For the "pyarrow" backend.
+"""
+
+import datetime
+import importlib.util
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+def _numpy_column(values: Tuple[Any, ...], type_code: Optional[type]) -> Any:
+    """
+    Convert the values of one column into a typed array.
+
+    Args:
+        values (Tuple[Any, ...]): Column values of a batch, None for NULL.
+        type_code (Optional[type]): Python type from `cursor.description`.
+
+    Returns:
+        Any: A NumPy array or a pandas extension array.
+    """
+    try:
+        has_nulls = None in values
+        if type_code is bool:
+            return pd.array(values, dtype="boolean") if has_nulls else np.array(values, dtype=bool)
+        if type_code is int:
+            return pd.array(values, dtype="Int64") if has_nulls else np.array(values, dtype=np.int64)
+        if type_code is float:
+            return np.array(values, dtype=np.float64)
+        if type_code in (datetime.datetime, datetime.date):
+            return pd.to_datetime(np.array(values, dtype=object))
+    except (TypeError, ValueError, OverflowError):
+        pass  # Unexpected values for the reported type, keep them as objects
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _arrow_column(values: Tuple[Any, ...]) -> Any:
+    """Convert the values of one column into an Arrow-backed pandas array."""
+    import pyarrow as pa
+
+    return pd.arrays.ArrowExtensionArray(pa.array(values, from_pandas=True))
+
+
+def build_frame(
+    rows: Sequence[Sequence[Any]],
+    description: Sequence[Tuple[Any, ...]],
+    dtype_backend: str = "numpy",
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from a batch of rows, one typed array per column.
+
+    Args:
+        rows (Sequence[Sequence[Any]]): Rows returned by `fetchmany`.
+        description (Sequence[Tuple[Any, ...]]): The cursor's `description` (name and type code first).
+        dtype_backend (str): "numpy" for NumPy/pandas dtypes or "pyarrow" for Arrow-backed columns.
+            Defaults to "numpy".
+
+    Returns:
+        pd.DataFrame: The batch as a DataFrame with one typed column per result column.
+
+    Raises:
+        ValueError: If the backend is unknown, or "pyarrow" is requested but not installed.
+    """
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Unknown dtype_backend '{dtype_backend}'. Expected one of {DTYPE_BACKENDS}.")
+    if dtype_backend == "pyarrow" and not PYARROW_AVAILABLE:
+        raise ValueError("The 'pyarrow' dtype_backend requires pyarrow to be installed.")
+
+    names = [desc[0] for desc in description]
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    if dtype_backend == "pyarrow":
+        arrays = [_arrow_column(values) for values in columns]
+    else:
+        arrays = [_numpy_column(values, desc[1]) for values, desc in zip(columns, description)]
+
+    # Positional assembly keeps duplicate column names returned by the query
+    frame = pd.DataFrame({position: array for position, array in enumerate(arrays)})
+    frame.columns = names
+    return frame
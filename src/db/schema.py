@@ -0,0 +1,244 @@
+"""
+Module: schema
+Provides SQL Server column type inference for DataFrames loaded by the savers.
+
+Types are inferred from the pandas dtypes and the observed values:
+    - bool                -> BIT
+    - integers            -> INT, or BIGINT when values exceed the 32-bit range
+    - floats              -> FLOAT
+    - datetimes           -> DATETIME2
+    - dates               -> DATE
+    - strings             -> NVARCHAR(n), n being the longest value rounded up to a size bucket
+    - categoricals        -> the type of their categories
+    - mixed / very long   -> NVARCHAR(MAX)
+
+Each inferred type carries the matching ODBC parameter description so that
+`cursor.setinputsizes` binds parameters with the column's real type instead of
+as LOBs. Types can be overridden per column with SQL type strings.
+
+String sizes only describe the data seen so far: appends, streaming chunks and
+upserts into an existing table widen its narrower NVARCHAR columns first (see
+`SQLDatabaseConnector.create_table`).
+
+Dependencies:
+    - pandas: For dtype inspection.
+"""
+
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, Mapping, Optional, Tuple
+
+import pandas as pd
+from pandas.api import types as ptypes
+
+# Standard ODBC SQL type codes (the values of the pyodbc constants), so that type
+# inference does not import the driver
+odbc = SimpleNamespace(
+    SQL_WVARCHAR=-9,
+    SQL_VARCHAR=12,
+    SQL_BIT=-7,
+    SQL_TINYINT=-6,
+    SQL_SMALLINT=5,
+    SQL_INTEGER=4,
+    SQL_BIGINT=-5,
+    SQL_REAL=7,
+    SQL_DOUBLE=8,
+    SQL_DECIMAL=3,
+    SQL_TYPE_DATE=91,
+    SQL_TYPE_TIMESTAMP=93,
+)
+
+STRING_SIZE_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4000)
+INT32_MIN, INT32_MAX = -(2**31), 2**31 - 1
+
+
+@dataclass(frozen=True)
+class ColumnType:
+    """
+    SQL type of a column and the matching ODBC parameter description.
+
+    Attributes:
+        sql (str): Type used in CREATE TABLE, e.g. "NVARCHAR(64)".
+        odbc_type (Optional[int]): pyodbc SQL type code, or None to let the driver pick the binding.
+        size (int): Column size passed to `setinputsizes` (0 for MAX types).
+        decimal_digits (int): Decimal digits passed to `setinputsizes`.
+    """
+
+    sql: str
+    odbc_type: Optional[int]
+    size: int = 0
+    decimal_digits: int = 0
+
+    @property
+    def input_size(self) -> Optional[Tuple[int, int, int]]:
+        """The `setinputsizes` entry for the column, or None if it has no explicit binding."""
+        if self.odbc_type is None:
+            return None
+        return (self.odbc_type, self.size, self.decimal_digits)
+
+
+NVARCHAR_MAX = ColumnType("NVARCHAR(MAX)", odbc.SQL_WVARCHAR, 0)
+BIT = ColumnType("BIT", odbc.SQL_BIT, 1)
+INT = ColumnType("INT", odbc.SQL_INTEGER, 10)
+BIGINT = ColumnType("BIGINT", odbc.SQL_BIGINT, 19)
+FLOAT = ColumnType("FLOAT", odbc.SQL_DOUBLE, 53)
+DATETIME2 = ColumnType("DATETIME2", odbc.SQL_TYPE_TIMESTAMP, 27, 7)
+DATE = ColumnType("DATE", odbc.SQL_TYPE_DATE, 10)
+
+
+def nvarchar(max_length: int) -> ColumnType:
+    """
+    Return an NVARCHAR type sized to the smallest bucket that fits `max_length` characters.
+
+    Args:
+        max_length (int): Longest observed value.
+
+    Returns:
+        ColumnType: NVARCHAR(n), or NVARCHAR(MAX) beyond 4000 characters.
+    """
+    for bucket in STRING_SIZE_BUCKETS:
+        if max_length <= bucket:
+            return ColumnType(f"NVARCHAR({bucket})", odbc.SQL_WVARCHAR, bucket)
+    return NVARCHAR_MAX
+
+
+def _integer_type(series: pd.Series) -> ColumnType:
+    """Pick INT or BIGINT from the value range."""
+    if series.empty or series.isna().all():
+        return INT
+    return INT if INT32_MIN <= series.min() and series.max() <= INT32_MAX else BIGINT
+
+
+def infer_column_type(series: pd.Series) -> ColumnType:
+    """
+    Infer the SQL Server type of a column.
+
+    Args:
+        series (pd.Series): Column values.
+
+    Returns:
+        ColumnType: The inferred type.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return infer_column_type(pd.Series(dtype.categories))
+    if ptypes.is_bool_dtype(dtype):
+        return BIT
+    if ptypes.is_integer_dtype(dtype):
+        return _integer_type(series)
+    if ptypes.is_float_dtype(dtype):
+        return FLOAT
+    if ptypes.is_datetime64_any_dtype(dtype):
+        return DATETIME2
+
+    values = series.dropna()
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred == "boolean":
+        return BIT
+    if inferred == "integer":
+        return _integer_type(pd.to_numeric(values))
+    if inferred in ("floating", "mixed-integer-float", "decimal"):
+        return FLOAT
+    if inferred in ("datetime", "datetime64"):
+        return DATETIME2
+    if inferred == "date":
+        return DATE
+    if inferred == "empty":
+        return nvarchar(0)
+    if inferred == "string":
+        return nvarchar(int(values.str.len().max()))
+    return ColumnType("NVARCHAR(MAX)", None)
+
+
+_SQL_TYPE_PATTERN = re.compile(r"^\s*(\w+)\s*(?:\(\s*(\w+)\s*(?:,\s*(\d+)\s*)?\))?\s*$")
+
+
+def parse_sql_type(sql: str) -> ColumnType:
+    """
+    Build a ColumnType from a SQL Server type string such as "NVARCHAR(50)" or "DECIMAL(18, 2)".
+
+    Unknown types are kept as written and bound without an explicit input size.
+
+    Args:
+        sql (str): SQL type.
+
+    Returns:
+        ColumnType: The parsed type.
+    """
+    match = _SQL_TYPE_PATTERN.match(sql)
+    if not match:
+        return ColumnType(sql, None)
+
+    name, arg, scale = match.group(1).upper(), match.group(2), match.group(3)
+    length = 0 if arg is None or arg.upper() == "MAX" else int(arg)
+    fixed = {"BIT": BIT, "INT": INT, "BIGINT": BIGINT, "FLOAT": FLOAT, "DATE": DATE}
+    if name in fixed and arg is None:
+        return fixed[name]
+    if name == "SMALLINT":
+        return ColumnType(sql, odbc.SQL_SMALLINT, 5)
+    if name == "TINYINT":
+        return ColumnType(sql, odbc.SQL_TINYINT, 3)
+    if name == "REAL":
+        return ColumnType(sql, odbc.SQL_REAL, 24)
+    if name in ("DECIMAL", "NUMERIC"):
+        return ColumnType(sql, odbc.SQL_DECIMAL, length or 18, int(scale or 0))
+    if name == "DATETIME2":
+        precision = 7 if arg is None else length
+        return ColumnType(sql, odbc.SQL_TYPE_TIMESTAMP, 20 + precision if precision else 19, precision)
+    if name == "DATETIME":
+        return ColumnType(sql, odbc.SQL_TYPE_TIMESTAMP, 23, 3)
+    if name in ("NVARCHAR", "NCHAR"):
+        return ColumnType(sql, odbc.SQL_WVARCHAR, length)
+    if name in ("VARCHAR", "CHAR"):
+        return ColumnType(sql, odbc.SQL_VARCHAR, length)
+    return ColumnType(sql, None)
+
+
+_NUMERIC_ORDER = ("BIT", "INT", "BIGINT", "FLOAT")
+
+
+def widen_column_type(left: ColumnType, right: ColumnType) -> ColumnType:
+    """
+    Return the narrowest type able to hold the values of both types.
+
+    Used to merge the schemas inferred from separate partitions of the same table.
+
+    Args:
+        left (ColumnType): Type inferred from one partition.
+        right (ColumnType): Type inferred from another partition.
+
+    Returns:
+        ColumnType: The widened type; NVARCHAR(MAX) when the types are unrelated.
+    """
+    if left == right:
+        return left
+    if left.sql in _NUMERIC_ORDER and right.sql in _NUMERIC_ORDER:
+        return max(left, right, key=lambda column: _NUMERIC_ORDER.index(column.sql))
+    if {left.sql, right.sql} == {"DATE", "DATETIME2"}:
+        return DATETIME2
+    if left.sql.startswith("NVARCHAR(") and right.sql.startswith("NVARCHAR("):
+        if NVARCHAR_MAX.sql in (left.sql, right.sql):
+            return NVARCHAR_MAX
+        return nvarchar(max(left.size, right.size))
+    return NVARCHAR_MAX
+
+
+def infer_schema(
+    df: pd.DataFrame, overrides: Optional[Mapping[str, str]] = None
+) -> Dict[str, ColumnType]:
+    """
+    Infer the SQL Server type of every column, applying per-column overrides.
+
+    Args:
+        df (pd.DataFrame): Data to load.
+        overrides (Optional[Mapping[str, str]]): SQL type strings by column name, e.g. {"id": "BIGINT"}.
+
+    Returns:
+        Dict[str, ColumnType]: Column types in DataFrame column order.
+    """
+    overrides = overrides or {}
+    return {
+        col: parse_sql_type(overrides[col]) if col in overrides else infer_column_type(df[col])
+        for col in df.columns
+    }
@@ -0,0 +1,231 @@
+"""
+Module: dtypes
+Provides the dtype normalization stage applied to transformed frames.
+
+Extracted and cleaned frames are mostly made of `object` columns. `normalize_dtypes`
+converts every column to the most compact dtype that holds its values exactly:
+    - placeholder strings ("", "N/A", "null") become missing values; other
+      values such as "NA" (a country code) or "None" are kept
+    - integers, and numeric strings without leading zeros, are downcast to the
+      smallest integer type (nullable Int8..Int64 when values are missing); they
+      are parsed exactly, and numbers a float64 cannot hold exactly stay strings
+    - floats become float32 when the conversion is lossless, or integers when
+      every value is whole (e.g. Excel integer columns with blanks)
+    - True/False values become bool, or the nullable "boolean" dtype
+    - date strings are parsed with a format guessed from the values; with a
+      `pipeline` name, a format that parsed a column is cached for that
+      pipeline's later frames and partitions
+    - low-cardinality strings become categoricals, the other strings `string[pyarrow]`
+    - mixed-type columns (e.g. numbers next to free text) are converted to strings,
+      so no `object` column is left
+
+Missing values stay as nullable NA instead of being replaced with placeholders,
+so numeric columns keep a numeric dtype. The stage returns a per-column report
+of the memory used before and after.
+
+Dependencies:
+    - pandas: For dtype inspection and conversion.
+    - numpy: For integer ranges and lossless checks.
+    - pyarrow (optional): For `string[pyarrow]` columns. Strings stay `object` without it.
+"""
+
+import importlib.util
+import warnings
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as ptypes
+from pandas.tseries.api import guess_datetime_format
+
+PLACEHOLDERS = frozenset({"", "N/A", "null"})
+CATEGORY_MAX_RATIO = 0.5
+SAMPLE_SIZE = 100
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+_INTEGER_TYPES = (np.int8, np.int16, np.int32, np.int64)
+# Largest magnitude up to which every integer is exactly representable as a float64
+_MAX_EXACT_FLOAT = 2**53
+
+# Date format that parsed a column, by (pipeline, column), reused by the pipeline's later frames
+_date_formats: Dict[Tuple[str, str], str] = {}
+
+
+def _downcast_integers(series: pd.Series) -> pd.Series:
+    """Convert integral values to the smallest integer dtype, nullable if values are missing."""
+    values = series.dropna()
+    low, high = (values.min(), values.max()) if len(values) else (0, 0)
+    has_nulls = len(values) < len(series)
+    for dtype in _INTEGER_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return series.astype(pd.api.types.pandas_dtype(dtype.__name__.capitalize()) if has_nulls else dtype)
+    return series
+
+
+def _downcast_numeric(series: pd.Series) -> pd.Series:
+    """Downcast a numeric column without losing values."""
+    if ptypes.is_bool_dtype(series.dtype):
+        return series
+    if ptypes.is_integer_dtype(series.dtype):
+        return _downcast_integers(series)
+
+    values = series.dropna().to_numpy(dtype=np.float64)
+    if len(values) and np.isfinite(values).all() and (values == np.round(values)).all():
+        if np.iinfo(np.int64).min <= values.min() and values.max() <= np.iinfo(np.int64).max:
+            return _downcast_integers(series.astype("Int64"))
+    compact = series.astype(np.float32)
+    if np.array_equal(compact.to_numpy(dtype=np.float64), series.to_numpy(dtype=np.float64), equal_nan=True):
+        return compact
+    return series
+
+
+def _to_exact_numeric(values: pd.Series) -> Optional[pd.Series]:
+    """
+    Convert a column to numbers without going through float64 for integers.
+
+    Integer values are parsed exactly into a nullable Int64 column, so identifiers longer than
+    2^53 keep their last digits when the column has missing values.
+
+    Returns:
+        Optional[pd.Series]: The numeric column (NaN for missing floats), or None if a value is not
+        a number or is a float beyond ±2^53, where distinct values could collapse into one.
+    """
+    numeric = pd.to_numeric(values, errors="coerce", dtype_backend="numpy_nullable")
+    if numeric.notna().sum() != values.notna().sum():
+        return None
+    if ptypes.is_integer_dtype(numeric.dtype):
+        return numeric
+    if not ptypes.is_float_dtype(numeric.dtype) or (numeric.abs() > _MAX_EXACT_FLOAT).any():
+        return None
+    return numeric.astype(np.float64)
+
+
+def _parse_dates(
+    values: pd.Series, non_null: pd.Series, cache_key: Optional[Tuple[str, str]]
+) -> Optional[pd.Series]:
+    """
+    Parse a string column as datetimes with the cached format of the column, or a newly guessed one.
+
+    Only formats that parsed the whole column are cached, so a first value that is not a date
+    does not disable date parsing for later frames.
+
+    Returns:
+        Optional[pd.Series]: The parsed column, or None if the values are not all dates in one format.
+    """
+    date_format = _date_formats.get(cache_key) if cache_key else None
+    if date_format is None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            date_format = guess_datetime_format(str(non_null.iloc[0]))
+        if date_format is None:
+            return None
+
+    sample = pd.to_datetime(non_null.iloc[:SAMPLE_SIZE], format=date_format, errors="coerce")
+    if sample.isna().any():
+        return None
+    parsed = pd.to_datetime(values, format=date_format, errors="coerce", cache=True)
+    if parsed.notna().sum() != len(non_null):
+        return None
+    if cache_key:
+        _date_formats[cache_key] = date_format
+    return parsed
+
+
+def _compact_strings(values: pd.Series, non_null: pd.Series, category_max_ratio: float) -> pd.Series:
+    """Store repeated strings as a categorical and the others as Arrow strings."""
+    if non_null.nunique() <= category_max_ratio * len(values):
+        return values.astype("category")
+    if PYARROW_AVAILABLE:
+        return values.astype("string[pyarrow]")
+    return values
+
+
+def _normalize_object(
+    series: pd.Series, cache_key: Optional[Tuple[str, str]], category_max_ratio: float
+) -> pd.Series:
+    """Convert an object column to the most compact dtype holding its values."""
+    values = series.mask(series.isin(PLACEHOLDERS))
+    non_null = values.dropna()
+    if non_null.empty:
+        return values
+
+    inferred = ptypes.infer_dtype(non_null, skipna=False)
+    if inferred == "boolean":
+        return values.astype("boolean") if len(non_null) < len(values) else values.astype(bool)
+    if inferred in ("integer", "floating", "mixed-integer-float", "decimal"):
+        numeric = _to_exact_numeric(values)
+        if numeric is not None:
+            return _downcast_numeric(numeric)
+    elif inferred in ("datetime", "datetime64", "date"):
+        return pd.to_datetime(values)
+    if inferred != "string":
+        # Mixed types (e.g. 1, "n/a", 3.5) and out-of-range numbers are stored as strings
+        values = values.map(str, na_action="ignore")
+        return _compact_strings(values, values.dropna(), category_max_ratio)
+
+    if pd.to_numeric(non_null.iloc[:SAMPLE_SIZE], errors="coerce").notna().all():
+        numeric = _to_exact_numeric(values)
+        # Identifiers such as zip codes keep their leading zeros as strings
+        if numeric is not None and not non_null.str.match(r"[+-]?0\d").any():
+            return _downcast_numeric(numeric)
+    parsed = _parse_dates(values, non_null, cache_key)
+    if parsed is not None:
+        return parsed
+    return _compact_strings(values, non_null, category_max_ratio)
+
+
+def normalize_dtypes(
+    df: pd.DataFrame, category_max_ratio: float = CATEGORY_MAX_RATIO, pipeline: Optional[str] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Convert every column of a frame to its most compact exact dtype.
+
+    Args:
+        df (pd.DataFrame): Frame to normalize. It is not modified.
+        category_max_ratio (float): Strings become categoricals when the number of distinct values
+            is at most this share of the rows. Defaults to 0.5.
+        pipeline (Optional[str]): Name of the pipeline the frame belongs to, used to cache the date
+            formats of its columns across frames. Defaults to None (no cache).
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The normalized frame, and the memory report with one row
+        per column (dtype_before, dtype_after, bytes_before, bytes_after, saved). Sum the byte
+        columns for the frame totals.
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if ptypes.is_object_dtype(series.dtype):
+            cache_key = (pipeline, str(column)) if pipeline else None
+            columns[column] = _normalize_object(series, cache_key, category_max_ratio)
+        elif ptypes.is_numeric_dtype(series.dtype):
+            columns[column] = _downcast_numeric(series)
+        else:
+            columns[column] = series
+    normalized = pd.DataFrame(columns, index=df.index)
+    return normalized, memory_report(df, normalized)
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare the memory used by each column of two versions of a frame.
+
+    Args:
+        before (pd.DataFrame): Original frame.
+        after (pd.DataFrame): Converted frame with the same columns.
+
+    Returns:
+        pd.DataFrame: One row per column, indexed by column name, with dtypes, deep sizes in bytes
+        and the saved share of memory. Totals are not included as a row, so a column named
+        "total" cannot be overwritten.
+    """
+    report = pd.DataFrame(
+        {
+            "dtype_before": before.dtypes.astype(str),
+            "dtype_after": after.dtypes.astype(str),
+            "bytes_before": before.memory_usage(index=False, deep=True),
+            "bytes_after": after.memory_usage(index=False, deep=True),
+        }
+    )
+    report["saved"] = 1 - report["bytes_after"] / report["bytes_before"].where(report["bytes_before"] > 0)
+    return report
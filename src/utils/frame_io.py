@@ -0,0 +1,68 @@
+"""
+Module: frame_io
+Provides helpers to persist pandas DataFrames as local artefacts.
+
+Frames are written as Parquet when a Parquet engine (pyarrow or fastparquet)
+is installed, and as pickle otherwise, so caches keep working on machines
+without the optional dependency.
+
+Dependencies:
+    - pandas: For DataFrame serialization.
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+PARQUET_AVAILABLE = any(
+    importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet")
+)
+FRAME_SUFFIX = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+
+
+def write_frame(df: pd.DataFrame, path: Union[str, Path]) -> Path:
+    """
+    Write a DataFrame atomically, as Parquet or pickle depending on the file suffix.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (Union[str, Path]): Target file path ending in `.parquet` or `.pkl`.
+
+    Returns:
+        Path: The written file path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if path.suffix == ".parquet":
+            df.to_parquet(tmp_path, index=False)
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def read_frame(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read a DataFrame written by `write_frame`.
+
+    Args:
+        path (Union[str, Path]): File path ending in `.parquet` or `.pkl`.
+
+    Returns:
+        pd.DataFrame: The stored DataFrame.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
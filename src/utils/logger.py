@@ -1,4 +1,146 @@
+"""
+Module: logger
+Configures the shared loguru logger and provides rate-limited logging for hot paths.
+
+The file sink is enqueued: records are handed to a background writer instead of
+being written by the calling thread, and the queue is drained at interpreter
+exit (or explicitly with `shutdown_logging`), after `SampledLog` lines still
+holding unreported events have been flushed.
+
+Hot paths (per-query, per-batch, per-row loops) should pass format arguments
+instead of f-strings, so nothing is formatted when the level is disabled, and
+use `SampledLog` or `ProgressLog` instead of one line per event.
+
+Dependencies:
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> logger.debug("Executing query: {} with parameters: {}", query, params)
+    >>> query_log = SampledLog("Executed {count} queries ({total} in total).")
+    >>> query_log.hit()
+    >>> progress = ProgressLog("Loading api_demo", total=len(df))
+    >>> progress.advance(len(batch))
+"""
+
+import atexit
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
 from loguru import logger
 
+LOG_INTERVAL = 5.0
+
 # Configuração básica de logging
-logger.add("logs/etl.log", rotation="1 MB", retention="7 days", level="INFO")
+logger.add("logs/etl.log", rotation="1 MB", retention="7 days", level="INFO", enqueue=True)
+
+
+# Sampled lines alive in the process, flushed by `shutdown_logging`
+_sampled_logs: "weakref.WeakSet[SampledLog]" = weakref.WeakSet()
+
+
+def shutdown_logging() -> None:
+    """Flush the pending `SampledLog` counts and wait until the enqueued records have been written."""
+    for sampled in list(_sampled_logs):
+        sampled.flush()
+    logger.complete()
+
+
+atexit.register(shutdown_logging)
+
+
+class SampledLog:
+    """
+    Log line emitted for the first event and then at most once per interval, with the events counted in between.
+
+    The message is formatted by loguru with the keyword fields `count` (events since the
+    previous line), `total` (events since creation) and those passed to `hit`.
+
+    Args:
+        message (str): Message template, e.g. "Executed {count} queries ({total} in total).".
+        interval (float): Minimum number of seconds between two lines. Defaults to 5.
+        level (str): Log level. Defaults to "INFO".
+    """
+
+    def __init__(self, message: str, interval: float = LOG_INTERVAL, level: str = "INFO") -> None:
+        self.message = message
+        self.interval = interval
+        self.level = level
+        self.total = 0
+        self._count = 0
+        self._last_emit: Optional[float] = None
+        self._fields: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        _sampled_logs.add(self)
+
+    def hit(self, n: int = 1, **fields: Any) -> None:
+        """
+        Count events and emit the line if the interval has elapsed.
+
+        Args:
+            n (int): Number of events. Defaults to 1.
+            **fields (Any): Extra fields of the message, taken from the event that emits the line.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._count += n
+            self.total += n
+            self._fields = fields
+            if self._last_emit is not None and now - self._last_emit < self.interval:
+                return
+            count, total, self._count, self._last_emit = self._count, self.total, 0, now
+        logger.opt(depth=1).log(self.level, self.message, count=count, total=total, **fields)
+
+    def flush(self) -> None:
+        """Emit the events counted since the last line, if any, with the fields of the latest event."""
+        with self._lock:
+            if not self._count:
+                return
+            count, total, self._count, self._last_emit = self._count, self.total, 0, time.monotonic()
+            fields = self._fields
+        logger.opt(depth=1).log(self.level, self.message, count=count, total=total, **fields)
+
+
+class ProgressLog:
+    """
+    Periodic progress line for a loop over rows or batches.
+
+    Args:
+        label (str): What is being processed, e.g. "Bulk insert into api_demo".
+        total (Optional[int]): Expected number of rows, if known.
+        interval (float): Minimum number of seconds between two lines. Defaults to 5.
+        level (str): Log level. Defaults to "INFO".
+    """
+
+    def __init__(
+        self, label: str, total: Optional[int] = None, interval: float = LOG_INTERVAL, level: str = "INFO"
+    ) -> None:
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.level = level
+        self.done = 0
+        self._start = self._last_emit = time.monotonic()
+
+    def advance(self, n: int) -> None:
+        """
+        Record processed rows and emit a progress line if the interval has elapsed.
+
+        Args:
+            n (int): Rows processed since the previous call.
+        """
+        self.done += n
+        now = time.monotonic()
+        if now - self._last_emit < self.interval:
+            return
+        self._last_emit = now
+        elapsed = now - self._start
+        logger.opt(depth=1).log(
+            self.level,
+            "{}: {:,}{} rows ({:,.0f} rows/sec).",
+            self.label,
+            self.done,
+            f"/{self.total:,}" if self.total is not None else "",
+            self.done / elapsed if elapsed > 0 else 0.0,
+        )
@@ -0,0 +1,334 @@
+"""
+Module: metrics
+Provides per-stage performance instrumentation for the ETL pipelines.
+
+Each instrumented block records:
+    - wall time and CPU time
+    - rows in, rows out and rows/sec
+    - size of the output frame in bytes (shallow, without string payloads)
+    - peak RSS of the process while the block ran (sampled with psutil)
+
+The measurements are attached as attributes of an OpenTelemetry span and
+recorded as OpenTelemetry histograms. `configure_telemetry` installs the
+SDK providers with JSON-lines exporters (spans in one file, metric data points
+in a sibling `.metrics.jsonl` file), so the telemetry can be inspected on
+machines without a collector, and OTLP exporters when
+`OTEL_EXPORTER_OTLP_ENDPOINT` is set and the exporter package is installed.
+Without `configure_telemetry` (or without the SDK), spans are no-ops and the
+overhead is limited to the measurements themselves.
+
+Dependencies:
+    - opentelemetry-api / opentelemetry-sdk: For spans and metrics.
+    - psutil: For CPU time and RSS sampling.
+    - loguru: For structured logging.
+
+Usage Example:
+    >>> configure_telemetry("output/metrics/telemetry.jsonl")
+    >>> with instrument_stage("api", "transform", rows_in=len(df)) as stage:
+    ...     df_clean = transform_api(df)
+    ...     stage.set_output(df_clean)
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import pandas as pd
+import psutil
+from loguru import logger
+from opentelemetry import metrics, trace
+
+TRACER_NAME = "etl-template"
+DEFAULT_TELEMETRY_PATH = "output/metrics/telemetry.jsonl"
+RSS_SAMPLE_INTERVAL = 0.05
+
+_tracer = trace.get_tracer(TRACER_NAME)
+_meter = metrics.get_meter(TRACER_NAME)
+_stage_duration = _meter.create_histogram("etl.stage.duration", unit="s", description="Wall time of an ETL stage")
+_stage_rows = _meter.create_histogram("etl.stage.rows", unit="{row}", description="Rows produced by an ETL stage")
+_stage_peak_rss = _meter.create_histogram("etl.stage.peak_rss", unit="By", description="Peak RSS during an ETL stage")
+
+try:
+    from opentelemetry.sdk.metrics.export import MetricExporter, MetricExportResult
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+except ImportError:  # SDK not installed: spans and metrics stay no-ops
+    SpanExporter = MetricExporter = object
+    SpanExportResult = MetricExportResult = None
+
+
+@dataclass
+class StageMetrics:
+    """
+    Measurements of one instrumented stage.
+
+    Attributes:
+        pipeline (str): Pipeline name.
+        stage (str): Stage name, e.g. "extract".
+        wall_seconds (float): Elapsed wall time.
+        cpu_seconds (float): User and system CPU time of the process during the stage.
+        rows_in (Optional[int]): Rows received by the stage.
+        rows_out (Optional[int]): Rows produced by the stage.
+        rows_per_sec (Optional[float]): Throughput, based on rows_out (or rows_in for sinks).
+        bytes_out (Optional[int]): Shallow memory size of the output frame.
+        peak_rss_bytes (int): Highest sampled RSS of the process during the stage.
+    """
+
+    pipeline: str
+    stage: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    rows_per_sec: Optional[float] = None
+    bytes_out: Optional[int] = None
+    peak_rss_bytes: int = 0
+
+    def set_output(self, df: Any) -> None:
+        """
+        Record the rows and size of the stage output.
+
+        Args:
+            df (Any): Output of the stage. Only DataFrames are measured.
+        """
+        if isinstance(df, pd.DataFrame):
+            self.rows_out = len(df)
+            self.bytes_out = int(df.memory_usage(index=False, deep=False).sum())
+
+    def as_attributes(self) -> Dict[str, Any]:
+        """Return the measurements as span attributes, omitting unknown values."""
+        return {f"etl.{key}": value for key, value in asdict(self).items() if value is not None}
+
+
+class _RSSSampler(threading.Thread):
+    """Background thread recording the highest RSS of the process."""
+
+    def __init__(self, process: psutil.Process) -> None:
+        super().__init__(name="rss-sampler", daemon=True)
+        self.process = process
+        self.peak = process.memory_info().rss
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(RSS_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def stop(self) -> int:
+        self._stop_event.set()
+        self.join()
+        return max(self.peak, self.process.memory_info().rss)
+
+
+@contextmanager
+def instrument_stage(pipeline: str, stage: str, rows_in: Optional[int] = None) -> Iterator[StageMetrics]:
+    """
+    Measure a pipeline stage inside an OpenTelemetry span.
+
+    Args:
+        pipeline (str): Pipeline name.
+        stage (str): Stage name.
+        rows_in (Optional[int]): Rows received by the stage, if known.
+
+    Yields:
+        StageMetrics: Measurements; call `set_output` with the stage result to record rows out and bytes.
+    """
+    stage_metrics = StageMetrics(pipeline, stage, rows_in=rows_in)
+    process = psutil.Process()
+    sampler = _RSSSampler(process)
+    sampler.start()
+    cpu_start = process.cpu_times()
+    start = time.perf_counter()
+
+    with _tracer.start_as_current_span(f"{pipeline}.{stage}") as span:
+        try:
+            yield stage_metrics
+        finally:
+            stage_metrics.wall_seconds = time.perf_counter() - start
+            cpu_end = process.cpu_times()
+            stage_metrics.cpu_seconds = (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system)
+            stage_metrics.peak_rss_bytes = sampler.stop()
+            rows = stage_metrics.rows_out if stage_metrics.rows_out is not None else stage_metrics.rows_in
+            if rows is not None and stage_metrics.wall_seconds > 0:
+                stage_metrics.rows_per_sec = rows / stage_metrics.wall_seconds
+
+            span.set_attributes(stage_metrics.as_attributes())
+            labels = {"pipeline": pipeline, "stage": stage}
+            _stage_duration.record(stage_metrics.wall_seconds, labels)
+            _stage_peak_rss.record(stage_metrics.peak_rss_bytes, labels)
+            if rows is not None:
+                _stage_rows.record(rows, labels)
+            logger.debug(
+                f"[{pipeline}] {stage}: {stage_metrics.wall_seconds:.2f}s wall, "
+                f"{stage_metrics.cpu_seconds:.2f}s CPU, rows {rows_in} -> {stage_metrics.rows_out}, "
+                f"peak RSS {stage_metrics.peak_rss_bytes / 1024 / 1024:.0f} MB."
+            )
+
+
+@contextmanager
+def trace_span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Open a child span, e.g. around a query or a batch insert.
+
+    Args:
+        name (str): Span name.
+        **attributes (Any): Span attributes. None values are dropped.
+
+    Yields:
+        Any: The span, to add attributes once the work is done.
+    """
+    with _tracer.start_as_current_span(name) as span:
+        span.set_attributes({key: value for key, value in attributes.items() if value is not None})
+        yield span
+
+
+class JSONLinesSpanExporter(SpanExporter):
+    """
+    OpenTelemetry span exporter appending one JSON document per span to a local file.
+
+    Args:
+        path (str): Output file. Defaults to "output/metrics/telemetry.jsonl".
+    """
+
+    def __init__(self, path: str = DEFAULT_TELEMETRY_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any]) -> Any:
+        lines = []
+        for span in spans:
+            context = span.get_span_context()
+            lines.append(
+                json.dumps(
+                    {
+                        "name": span.name,
+                        "trace_id": format(context.trace_id, "032x"),
+                        "span_id": format(context.span_id, "016x"),
+                        "parent_id": format(span.parent.span_id, "016x") if span.parent else None,
+                        "start_time_ns": span.start_time,
+                        "end_time_ns": span.end_time,
+                        "status": span.status.status_code.name,
+                        "attributes": dict(span.attributes or {}),
+                    },
+                    default=str,
+                )
+            )
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+
+def metrics_path_for(jsonl_path: str) -> str:
+    """Return the metrics file written next to a span file, e.g. "telemetry.metrics.jsonl"."""
+    return str(Path(jsonl_path).with_suffix(".metrics.jsonl"))
+
+
+class JSONLinesMetricExporter(MetricExporter):
+    """
+    OpenTelemetry metric exporter appending one JSON document per data point to a local file.
+
+    Histogram points carry count, sum, min, max and the bucket counts; counter and gauge points
+    carry their value. Values are cumulative since the start of the process.
+
+    Args:
+        path (str): Output file. Defaults to "output/metrics/telemetry.metrics.jsonl".
+    """
+
+    def __init__(self, path: str = metrics_path_for(DEFAULT_TELEMETRY_PATH)) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, metrics_data: Any, timeout_millis: float = 10_000, **kwargs: Any) -> Any:
+        lines = []
+        for resource_metrics in metrics_data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    for point in metric.data.data_points:
+                        record = {
+                            "name": metric.name,
+                            "unit": metric.unit,
+                            "time_ns": point.time_unix_nano,
+                            "attributes": dict(point.attributes or {}),
+                        }
+                        for field in ("value", "count", "sum", "min", "max"):
+                            if hasattr(point, field):
+                                record[field] = getattr(point, field)
+                        if hasattr(point, "bucket_counts"):
+                            bounds = [str(bound) for bound in point.explicit_bounds] + ["+Inf"]
+                            record["buckets"] = dict(zip(bounds, point.bucket_counts))
+                        lines.append(json.dumps(record, default=str))
+        if lines:
+            with self._lock, open(self.path, "a", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        return MetricExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        return True
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs: Any) -> None:
+        pass
+
+
+def configure_telemetry(
+    jsonl_path: Optional[str] = DEFAULT_TELEMETRY_PATH, service_name: str = TRACER_NAME
+) -> bool:
+    """
+    Install the OpenTelemetry SDK providers with JSON-lines exporters and, if configured, OTLP.
+
+    Metrics are collected every minute and once more at `shutdown_telemetry`.
+
+    Args:
+        jsonl_path (Optional[str]): File receiving one JSON line per span; metric data points go to
+            `metrics_path_for(jsonl_path)`. None disables the local exporters.
+        service_name (str): Service name reported with the telemetry.
+
+    Returns:
+        bool: True if the SDK was installed, False if it is not available.
+    """
+    try:
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning("opentelemetry-sdk is not installed; telemetry stays disabled.")
+        return False
+
+    resource = Resource.create({"service.name": service_name})
+    tracer_provider = TracerProvider(resource=resource)
+    metric_readers = []
+    if jsonl_path:
+        tracer_provider.add_span_processor(BatchSpanProcessor(JSONLinesSpanExporter(jsonl_path)))
+        metric_readers.append(PeriodicExportingMetricReader(JSONLinesMetricExporter(metrics_path_for(jsonl_path))))
+
+    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        try:
+            from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning("OTEL_EXPORTER_OTLP_ENDPOINT is set but the OTLP exporter is not installed.")
+        else:
+            tracer_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+            metric_readers.append(PeriodicExportingMetricReader(OTLPMetricExporter()))
+
+    trace.set_tracer_provider(tracer_provider)
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=metric_readers))
+    logger.info(f"Telemetry enabled (spans and metrics written next to {jsonl_path or 'OTLP only'}).")
+    return True
+
+
+def shutdown_telemetry() -> None:
+    """Flush and shut down the installed providers, if any."""
+    for provider in (trace.get_tracer_provider(), metrics.get_meter_provider()):
+        if hasattr(provider, "shutdown"):
+            provider.shutdown()
@@ -8,6 +8,7 @@ import json
 from pathlib import Path
 from src.api.extract.api_extract import extract_api
 from src.bot.extract.bot_extract import extract_bot
+from src.utils.logger import shutdown_logging
 
 @pytest.fixture
 def mock_api_response_df():
@@ -24,3 +25,10 @@ def mock_bot_dataframe():
     mock_file = Path(__file__).parent / "mocks/mock_bot_data.xlsx"
     df = pd.read_excel(mock_file)
     return df
+
+
+@pytest.fixture(scope="session", autouse=True)
+def flush_sampled_logs():
+    """Flush the sampled log lines while pytest still captures output, instead of at interpreter exit."""
+    yield
+    shutdown_logging()
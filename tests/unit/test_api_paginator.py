@@ -0,0 +1,70 @@
+"""
+Unit tests for the concurrent paginated API extractor.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from src.api.extract.api_paginator import fetch_all_records, get_path
+
+
+def make_transport(total_records):
+    """Return a mock transport serving `total_records` entries with page/offset/cursor pagination."""
+    records = [{"id": i} for i in range(total_records)]
+
+    def handler(request):
+        params = request.url.params
+        if "page" in params:
+            size = int(params["per_page"])
+            start = (int(params["page"]) - 1) * size
+            return httpx.Response(200, json={"entries": records[start : start + size]})
+        if "offset" in params:
+            start, size = int(params["offset"]), int(params["limit"])
+            return httpx.Response(200, json={"entries": records[start : start + size]})
+        start, size = int(params.get("cursor", 0)), int(params["limit"])
+        next_cursor = start + size if start + size < total_records else None
+        return httpx.Response(200, json={"data": records[start : start + size], "meta": {"next": next_cursor}})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.parametrize(
+    "pagination, data_key",
+    [
+        ({"style": "page", "page_size": 10}, "entries"),
+        ({"style": "offset", "page_size": 10}, "entries"),
+        ({"style": "cursor", "page_size": 10, "cursor_path": "meta.next"}, "data"),
+    ],
+)
+def test_fetch_all_records_follows_pagination(pagination, data_key):
+    """
+    Test that every pagination style returns all records in order.
+    """
+    api_config = {
+        "concurrency": 3,
+        "endpoints": [{"url": "https://api.test/items", "data_key": data_key, "pagination": pagination}],
+    }
+
+    records = asyncio.run(fetch_all_records(api_config, transport=make_transport(45)))
+
+    assert [record["id"] for record in records] == list(range(45))
+
+
+def test_fetch_all_records_rejects_unknown_style():
+    """
+    Test that an unknown pagination style is reported as a configuration error.
+    """
+    api_config = {"endpoints": [{"url": "https://api.test/items", "pagination": {"style": "links"}}]}
+
+    with pytest.raises(ValueError):
+        asyncio.run(fetch_all_records(api_config, transport=make_transport(1)))
+
+
+def test_get_path_reads_nested_keys():
+    """
+    Test that dotted paths are resolved and missing keys return None.
+    """
+    payload = {"meta": {"next": "abc"}}
+    assert get_path(payload, "meta.next") == "abc"
+    assert get_path(payload, "meta.missing.key") is None
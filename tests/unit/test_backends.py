@@ -0,0 +1,102 @@
+"""
+Unit tests for the embedded SQLite and DuckDB backends.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.api.saver.api_saver import save_api
+from src.db.backends import DuckDBConnector, SQLiteConnector, get_connector
+from src.db.db_connector import SQLDatabaseConnector
+
+
+@pytest.fixture(params=[SQLiteConnector, DuckDBConnector], ids=["sqlite", "duckdb"])
+def connector(request):
+    """Yield a connected in-memory connector of each backend, skipping DuckDB when it is not installed."""
+    if request.param is DuckDBConnector:
+        pytest.importorskip("duckdb")
+    connector = request.param(":memory:")
+    connector.connect()
+    yield connector
+    connector.disconnect()
+
+
+def test_saver_round_trip(connector):
+    """
+    Test that save_api loads a DataFrame unchanged into an embedded backend.
+    """
+    df = pd.DataFrame({"API": ["a", "b", None], "Score": [1.5, np.nan, 3.0], "HTTPS": [True, False, True]})
+
+    save_api(df, connector, table_name="api_demo")
+
+    result = connector.execute_query("SELECT * FROM api_demo")
+    assert result["API"].tolist() == ["a", "b", None]
+    assert result["Score"].tolist()[::2] == [1.5, 3.0] and pd.isna(result["Score"].iloc[1])
+    assert connector.execute_query("DELETE FROM api_demo") is None
+
+
+def test_upsert_updates_inserts_and_deletes(connector):
+    """
+    Test that upsert merges by key, only counts changed rows and deletes missing keys on request.
+    """
+    initial = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    connector.create_table("t", initial)
+    connector.bulk_insert("t", initial)
+
+    changes = pd.DataFrame({"id": [2, 3, 4], "name": ["B", "c", "d"]})
+    affected = connector.upsert("t", changes, key_columns=["id"], delete_missing=True)
+
+    rows = connector.execute_query("SELECT id, name FROM t ORDER BY id")
+    assert rows.values.tolist() == [[2, "B"], [3, "c"], [4, "d"]]
+    assert affected == 3
+    assert connector.upsert("t", changes, key_columns=["id"]) == 0
+
+
+def test_checkout_shares_the_database(connector):
+    """
+    Test that pooled sessions see the tables of an in-memory database.
+    """
+    connector.create_table("t", pd.DataFrame({"id": [1]}))
+    connector.bulk_insert("t", pd.DataFrame({"id": [1, 2]}))
+    connector.create_pool(min_size=1, max_size=2)
+
+    with connector.checkout() as session:
+        assert session.execute_query("SELECT COUNT(*) AS n FROM t")["n"].iloc[0] == 2
+
+
+def test_failed_upsert_is_rolled_back(connector):
+    """
+    Test that an upsert failing mid-transaction leaves the target table untouched.
+    """
+    initial = pd.DataFrame({"id": [1], "name": ["a"]})
+    connector.create_table("t", initial)
+    connector.bulk_insert("t", initial)
+
+    with pytest.raises(RuntimeError):
+        connector.upsert("t", pd.DataFrame({"id": [1], "missing": ["x"]}), key_columns=["id"])
+
+    assert connector.execute_query("SELECT name FROM t")["name"].tolist() == ["a"]
+
+
+def test_get_connector_reads_backend_from_env(monkeypatch, tmp_path):
+    """
+    Test that DB_BACKEND and DB_PATH override the configuration section.
+    """
+    monkeypatch.setenv("DB_BACKEND", "sqlite")
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "etl.sqlite"))
+
+    connector = get_connector({"backend": "duckdb"})
+
+    assert isinstance(connector, SQLiteConnector)
+    assert connector.path == str(tmp_path / "etl.sqlite")
+
+
+def test_get_connector_defaults_to_sql_server(monkeypatch):
+    """
+    Test that SQL Server stays the default backend and unknown backends are rejected.
+    """
+    monkeypatch.delenv("DB_BACKEND", raising=False)
+
+    assert type(get_connector()) is SQLDatabaseConnector
+    with pytest.raises(ValueError):
+        get_connector({"backend": "oracle"})
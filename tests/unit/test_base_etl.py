@@ -0,0 +1,152 @@
+"""
+Unit tests for the BaseETL pipeline template.
+"""
+
+import pandas as pd
+import pytest
+from src.core.base_etl import BaseETL
+from src.core.checkpoint import CheckpointStore
+from src.core.state_store import JSONFileStateStore
+
+
+class DummyETL(BaseETL):
+    """Minimal ETL that drops null rows and records what it loads."""
+
+    def __init__(self, source):
+        super().__init__("dummy")
+        self.source = source
+        self.loaded = []
+
+    def extract(self):
+        return self.source
+
+    def transform(self, df):
+        return df.dropna()
+
+    def load(self, df):
+        self.loaded.append((self.chunk_index, len(df)))
+
+
+def test_run_batch_mode_keeps_processed_data():
+    """
+    Test that a DataFrame extract is loaded once and kept in self.data.
+    """
+    etl = DummyETL(pd.DataFrame({"a": [1, None, 3]}))
+    etl.run()
+
+    assert etl.loaded == [(None, 2)]
+    assert isinstance(etl.data, pd.DataFrame)
+    assert len(etl.data) == 2
+
+
+def test_run_streaming_mode_processes_chunks():
+    """
+    Test that an iterator extract is transformed and loaded per chunk and only stats are kept.
+    """
+    chunks = (pd.DataFrame({"a": [i, None]}) for i in range(3))
+    etl = DummyETL(chunks)
+    etl.run()
+
+    assert etl.loaded == [(0, 1), (1, 1), (2, 1)]
+    assert etl.data == {"chunks": 3, "rows_extracted": 6, "rows_loaded": 3}
+    assert etl.chunk_index is None
+
+
+class IncrementalETL(DummyETL):
+    """ETL that records the watermark it was started with and can fail on load."""
+
+    def __init__(self, source, store, fail=False):
+        BaseETL.__init__(self, "incremental", state_store=store, watermark_column="id")
+        self.source = source
+        self.loaded = []
+        self.fail = fail
+        self.seen_watermark = "unset"
+
+    def extract(self):
+        self.seen_watermark = self.watermark
+        return self.source[self.source["id"] > (self.watermark or 0)]
+
+    def load(self, df):
+        if self.fail:
+            raise RuntimeError("load failed")
+        super().load(df)
+
+
+def test_run_advances_watermark_only_after_successful_load(tmp_path):
+    """
+    Test that a failed load keeps the previous watermark and a successful one advances it.
+    """
+    store = JSONFileStateStore(str(tmp_path / "state.json"))
+    source = pd.DataFrame({"id": [1, 2, 3]})
+
+    IncrementalETL(source, store).run()
+    assert store.get_watermark("incremental") == 3
+
+    more = pd.DataFrame({"id": [1, 2, 3, 4, 5]})
+    with pytest.raises(RuntimeError):
+        IncrementalETL(more, store, fail=True).run()
+    assert store.get_watermark("incremental") == 3
+
+    etl = IncrementalETL(more, store)
+    etl.run()
+    assert etl.seen_watermark == 3
+    assert etl.loaded == [(None, 2)]
+    assert store.get_watermark("incremental") == 5
+
+
+def test_watermark_of_a_categorical_column(tmp_path):
+    """
+    Test that the watermark is taken from a categorical column without requiring an ordered dtype.
+    """
+    store = JSONFileStateStore(str(tmp_path / "state.json"))
+    etl = IncrementalETL(pd.DataFrame({"id": [1]}), store)
+
+    codes = pd.DataFrame({"id": pd.Series(["v1", "v3", "v2", "v3"], dtype="category")})
+
+    assert etl._max_watermark(codes, None) == "v3"
+    assert etl._max_watermark(codes, "v4") == "v4"
+
+class CheckpointedETL(DummyETL):
+    """ETL with a checkpoint store whose load can fail."""
+
+    def __init__(self, source, checkpoints, fail=False):
+        BaseETL.__init__(self, "checkpointed", checkpoints=checkpoints, run_id="run-1")
+        self.source = source
+        self.loaded = []
+        self.extract_calls = 0
+        self.transform_calls = 0
+        self.fail = fail
+
+    def extract(self):
+        self.extract_calls += 1
+        return self.source
+
+    def transform(self, df):
+        self.transform_calls += 1
+        return df.dropna()
+
+    def load(self, df):
+        if self.fail:
+            raise RuntimeError("load failed")
+        self.loaded.append(len(df))
+
+
+def test_run_resumes_from_checkpoints_after_failed_load(tmp_path):
+    """
+    Test that a retry of the same run skips extract and transform and only loads.
+    """
+    checkpoints = CheckpointStore(root=str(tmp_path))
+    source = pd.DataFrame({"a": [1, None, 3]})
+    failing = CheckpointedETL(source, checkpoints, fail=True)
+    with pytest.raises(RuntimeError):
+        failing.run()
+
+    retry = CheckpointedETL(source, checkpoints)
+    retry.run()
+
+    assert (retry.extract_calls, retry.transform_calls) == (0, 0)
+    assert retry.loaded == [2]
+
+    rerun = CheckpointedETL(source, checkpoints)
+    rerun.run()
+    assert rerun.loaded == []
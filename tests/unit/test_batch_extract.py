@@ -0,0 +1,52 @@
+"""
+Unit tests for the parallel multi-file bot extraction.
+"""
+
+import pandas as pd
+import pytest
+from src.bot.extract.batch_extract import extract_bot_files, resolve_sources
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a directory with a two-sheet workbook, a CSV, a broken workbook and an unrelated file."""
+    with pd.ExcelWriter(tmp_path / "b_report.xlsx") as writer:
+        pd.DataFrame({"id": [1, 2]}).to_excel(writer, sheet_name="first", index=False)
+        pd.DataFrame({"id": [3]}).to_excel(writer, sheet_name="second", index=False)
+    pd.DataFrame({"id": [4, 5]}).to_csv(tmp_path / "a_export.csv", index=False)
+    (tmp_path / "c_broken.xlsx").write_bytes(b"not a workbook")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    return tmp_path
+
+
+def test_resolve_sources_filters_and_sorts(data_dir):
+    """
+    Test that directories and glob patterns resolve to sorted supported files.
+    """
+    names = [path.rsplit("/", 1)[-1] for path in resolve_sources(str(data_dir))]
+
+    assert names == ["a_export.csv", "b_report.xlsx", "c_broken.xlsx"]
+    assert resolve_sources(str(data_dir / "*.csv")) == [str(data_dir / "a_export.csv")]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_extract_bot_files_tags_rows_and_isolates_failures(data_dir, tmp_path, max_workers):
+    """
+    Test that every sheet is read in a deterministic order and a broken file is reported, not raised.
+    """
+    df, failures = extract_bot_files(
+        str(data_dir), max_workers=max_workers, cache_dir=str(tmp_path / "cache")
+    )
+
+    assert df["id"].tolist() == [4, 5, 1, 2, 3]
+    assert df["source_sheet"].tolist() == [None, None, "first", "first", "second"]
+    assert df["source_file"].str.endswith(("a_export.csv", "b_report.xlsx")).all()
+    assert [failure.path for failure in failures] == [str(data_dir / "c_broken.xlsx")]
+
+
+def test_extract_bot_files_raises_without_matches(tmp_path):
+    """
+    Test that a pattern without matching files raises FileNotFoundError.
+    """
+    with pytest.raises(FileNotFoundError):
+        extract_bot_files(str(tmp_path / "*.xlsx"))
@@ -8,9 +8,9 @@ from src.bot.transform.bot_transform import transform_bot
 
 def test_transform_bot(mock_bot_dataframe):
     """
-    Test that transform_bot removes duplicates and fills N/A values.
+    Test that transform_bot removes duplicates and keeps missing values as nulls instead of placeholders.
     """
     df = transform_bot(mock_bot_dataframe)
     assert isinstance(df, pd.DataFrame)
     assert df.duplicated().sum() == 0
-    assert df.isna().sum().sum() == 0  # no NaN values
+    assert not df.isin(["N/A"]).any().any()  # no placeholder values
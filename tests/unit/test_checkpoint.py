@@ -0,0 +1,74 @@
+"""
+Unit tests for the stage checkpoint store.
+"""
+
+import os
+import time
+
+import pandas as pd
+from src.core.checkpoint import CheckpointStore, default_run_id, hash_frame, hash_inputs
+
+
+def test_load_returns_artefact_only_for_same_inputs(tmp_path):
+    """
+    Test that an artefact is served only when the input hash matches.
+    """
+    store = CheckpointStore(root=str(tmp_path))
+    df = pd.DataFrame({"a": [1, 2]})
+    output_hash = store.save("pipe", "run", "extract", hash_inputs({"since": 1}), df)
+
+    pd.testing.assert_frame_equal(store.load("pipe", "run", "extract", hash_inputs({"since": 1})), df)
+    assert store.load("pipe", "run", "extract", hash_inputs({"since": 2})) is None
+    assert store.output_hash("pipe", "run", "extract") == output_hash == hash_frame(df)
+
+
+def test_hash_frame_depends_on_content():
+    """
+    Test that frames with different values or dtypes hash differently.
+    """
+    df = pd.DataFrame({"a": [1, 2]})
+
+    assert hash_frame(df) == hash_frame(df.copy())
+    assert hash_frame(df) != hash_frame(pd.DataFrame({"a": [1, 3]}))
+    assert hash_frame(df) != hash_frame(df.astype(float))
+
+
+def test_gc_removes_expired_and_excess_runs(tmp_path):
+    """
+    Test that gc keeps only recent runs within the retention period.
+    """
+    store = CheckpointStore(root=str(tmp_path), retention_days=1, max_runs=2)
+    now = time.time()
+    for index, age_days in enumerate([0, 0.1, 0.2, 5]):
+        store.mark_done("pipe", f"run-{index}", "load", "hash")
+        run_dir = tmp_path / "pipe" / f"run-{index}"
+        os.utime(run_dir, (now - age_days * 86400, now - age_days * 86400))
+
+    removed = store.gc(now=now)
+
+    assert removed == 2
+    assert sorted(path.name for path in (tmp_path / "pipe").iterdir()) == ["run-0", "run-1"]
+
+
+def test_default_run_id_is_new_per_run_outside_airflow(monkeypatch):
+    """
+    Test that runs without an explicit ID never share one outside Airflow.
+    """
+    monkeypatch.delenv("AIRFLOW_CTX_DAG_RUN_ID", raising=False)
+    assert default_run_id() != default_run_id()
+
+    monkeypatch.setenv("AIRFLOW_CTX_DAG_RUN_ID", "scheduled__2025-08-27")
+    assert default_run_id() == "scheduled__2025-08-27"
+
+
+def test_save_skips_outputs_that_cannot_be_persisted(tmp_path):
+    """
+    Test that an unwritable output is not checkpointed but still hashed.
+    """
+    store = CheckpointStore(root=str(tmp_path))
+    df = pd.DataFrame({"mixed": [1, "N/A", 3.5]})
+
+    output_hash = store.save("pipe", "run", "extract", "in", df)
+
+    assert output_hash == hash_frame(df)
+    assert store.load("pipe", "run", "extract", "in") is None
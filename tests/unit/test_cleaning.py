@@ -0,0 +1,52 @@
+"""
+Unit tests for the fused cleaning routine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.cleaning import clean_frame
+
+
+@pytest.fixture
+def messy_df():
+    """Return a frame with duplicates, nulls, mixed dtypes and a non-default index."""
+    df = pd.DataFrame(
+        {
+            "API": ["a", "b", "a", None, "c", "b", "d"],
+            "Description": ["x", None, "x", "y", "z", None, "w"],
+            "Score": [1.0, 2.0, 1.0, np.nan, 3.0, 2.0, np.nan],
+            "Flag": [True, False, True, True, False, False, True],
+        },
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+    df["Category"] = pd.Categorical(["k", "k", "k", None, "m", "k", "m"])
+    return df
+
+
+def test_clean_frame_matches_chained_dedup_and_dropna(messy_df):
+    """
+    Test that clean_frame matches drop_duplicates followed by dropna on required columns.
+    """
+    expected = messy_df.drop_duplicates().dropna(subset=["API", "Description"])
+    result = clean_frame(messy_df, required_columns=["API", "Description"])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_clean_frame_matches_chained_dedup_and_fillna(messy_df):
+    """
+    Test that clean_frame matches drop_duplicates followed by fillna.
+    """
+    df = messy_df.drop(columns="Category")
+    expected = df.drop_duplicates().fillna("N/A")
+    result = clean_frame(df, fill_value="N/A")
+    pd.testing.assert_frame_equal(result, expected)
+    assert messy_df["Description"].isna().sum() == 2  # input untouched
+
+
+def test_clean_frame_treats_none_and_nan_as_equal_duplicates():
+    """
+    Test that rows differing only in the kind of null are duplicates, like drop_duplicates.
+    """
+    df = pd.DataFrame({"a": ["x", "x"], "b": [None, np.nan]})
+    assert len(clean_frame(df)) == len(df.drop_duplicates()) == 1
@@ -0,0 +1,102 @@
+"""
+Unit tests for the ConnectionPool.
+"""
+
+import threading
+import time
+
+import pytest
+from src.db.connection_pool import ConnectionPool
+from unittest.mock import MagicMock
+
+
+def test_pool_reuses_connections():
+    """
+    Test that a released connection is handed out again instead of opening a new one.
+    """
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = ConnectionPool(factory, min_size=1, max_size=2)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert pool.stats().in_use == 1
+
+    assert first is second
+    assert factory.call_count == 1
+    assert pool.stats().checkouts == 2
+
+
+def test_pool_discards_dead_connections():
+    """
+    Test that connections failing validation are closed and replaced on checkout.
+    """
+    dead = MagicMock()
+    dead.cursor.side_effect = Exception("connection lost")
+    alive = MagicMock()
+    pool = ConnectionPool(MagicMock(side_effect=[dead, alive]), min_size=1, max_size=1)
+
+    with pool.connection() as conn:
+        assert conn is alive
+
+    dead.close.assert_called_once()
+    assert pool.stats().evicted == 1
+
+
+def test_pool_times_out_when_exhausted():
+    """
+    Test that checkout raises TimeoutError when all connections are in use.
+    """
+    pool = ConnectionPool(lambda: MagicMock(), min_size=0, max_size=1)
+    conn = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+    pool.release(conn)
+    assert pool.stats().timeouts == 1
+
+
+def test_pool_hands_connection_to_waiting_thread():
+    """
+    Test that a waiting checkout is woken up when another thread releases a connection.
+    """
+    pool = ConnectionPool(lambda: MagicMock(), min_size=0, max_size=1)
+    conn = pool.acquire()
+    acquired = []
+
+    worker = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=2)))
+    worker.start()
+    time.sleep(0.05)
+    pool.release(conn)
+    worker.join()
+
+    assert acquired == [conn]
+    assert pool.stats().max_wait_seconds > 0
+
+
+def test_pool_evicts_idle_connections_above_min_size():
+    """
+    Test that idle connections above min_size are closed after idle_timeout.
+    """
+    pool = ConnectionPool(lambda: MagicMock(), min_size=1, max_size=3, idle_timeout=0)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+
+    assert pool.evict_idle() == 1
+    assert pool.stats().size == 1
+
+
+def test_pool_rolls_back_on_error():
+    """
+    Test that pending work is rolled back when the checkout block raises.
+    """
+    pool = ConnectionPool(lambda: MagicMock(), min_size=1, max_size=1)
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            raise ValueError("boom")
+
+    conn.rollback.assert_called_once()
+    assert pool.stats().idle == 1
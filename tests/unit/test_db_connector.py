@@ -0,0 +1,216 @@
+"""
+Unit tests for the SQLDatabaseConnector.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.db.db_connector import SQLDatabaseConnector
+from src.db.query_registry import QueryRegistry
+from src.db.schema import infer_schema
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def connector():
+    """Return a SQLDatabaseConnector bound to a mocked connection."""
+    sql_connector = SQLDatabaseConnector(server="localhost", database="test_db", use_windows_auth=True)
+    sql_connector.connection = MagicMock()
+    return sql_connector
+
+
+def test_bulk_insert_uses_batched_executemany(connector):
+    """
+    Test that bulk_insert sends rows in batches with fast_executemany and commits once.
+    """
+    df = pd.DataFrame({"API": [f"api_{i}" for i in range(5)], "Score": [1.0, np.nan, 3.0, 4.0, 5.0]})
+
+    inserted = connector.bulk_insert("test_table", df, batch_size=2)
+
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    assert inserted == 5
+    assert cursor.fast_executemany is True
+    assert cursor.executemany.call_count == 3
+    sql, first_batch = cursor.executemany.call_args_list[0].args
+    assert sql == "INSERT INTO test_table ([API], [Score]) VALUES (?, ?)"
+    assert first_batch == [["api_0", 1.0], ["api_1", None]]
+    connector.connection.commit.assert_called_once()
+
+
+def test_bulk_insert_rejects_invalid_batch_size(connector):
+    """
+    Test that bulk_insert rejects a non-positive batch size.
+    """
+    with pytest.raises(ValueError):
+        connector.bulk_insert("test_table", pd.DataFrame({"a": [1]}), batch_size=0)
+
+
+def test_iter_query_yields_fetchmany_chunks(connector):
+    """
+    Test that iter_query yields one DataFrame per fetchmany batch.
+    """
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    cursor.description = [("id", int), ("name", str)]
+    cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [(3, "c")], []]
+
+    chunks = list(connector.iter_query("SELECT id, name FROM t", chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ["id", "name"]
+    cursor.fetchmany.assert_called_with(2)
+
+
+def test_execute_query_concatenates_chunks(connector):
+    """
+    Test that execute_query assembles all fetchmany batches into one DataFrame.
+    """
+    connector.arraysize = 2
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    cursor.description = [("id", int)]
+    cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    df = connector.execute_query("SELECT id FROM t")
+
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["id"].dtype == np.int64
+    assert cursor.arraysize == 2
+
+
+def test_execute_query_detects_result_set_from_description(connector):
+    """
+    Test that statements without a result set are committed even if their text mentions SELECT.
+    """
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    cursor.description = None
+
+    assert connector.execute_query("INSERT INTO t SELECT * FROM s") is None
+    cursor.fetchmany.assert_not_called()
+    connector.connection.commit.assert_called_once()
+
+
+def test_checkout_binds_pooled_connection(connector, monkeypatch):
+    """
+    Test that checkout yields a separate connector bound to a pooled connection.
+    """
+    pooled = MagicMock()
+    monkeypatch.setattr(connector, "open_connection", lambda: pooled)
+    connector.create_pool(min_size=1, max_size=1)
+
+    with connector.checkout() as session:
+        assert session is not connector
+        assert session.connection is pooled
+
+    assert connector.pool.stats().in_use == 0
+
+
+def test_session_disconnect_returns_its_connection_and_keeps_the_pool(connector, monkeypatch):
+    """
+    Test that disconnecting a checkout session releases its connection without closing the shared pool.
+    """
+    pooled = MagicMock()
+    monkeypatch.setattr(connector, "open_connection", lambda: pooled)
+    connector.create_pool(min_size=1, max_size=2)
+
+    with connector.checkout() as session:
+        session.disconnect()
+        assert connector.pool.stats().in_use == 0
+
+    pooled.close.assert_not_called()
+    with connector.checkout() as session:
+        assert session.connection is pooled
+
+
+def test_bulk_insert_binds_schema_input_sizes(connector):
+    """
+    Test that bulk_insert binds parameters with setinputsizes when a schema is given.
+    """
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    connector.bulk_insert("test_table", df, schema=infer_schema(df))
+
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    sizes = cursor.setinputsizes.call_args.args[0]
+    assert [size[1] for size in sizes] == [10, 16]
+
+
+def test_bulk_insert_binds_known_input_sizes_next_to_unbound_columns(connector):
+    """
+    Test that a column without an explicit binding does not disable setinputsizes for the others.
+    """
+    df = pd.DataFrame({"id": [1, 2], "mixed": [1, "N/A"]})
+    connector.bulk_insert("test_table", df, schema=infer_schema(df))
+
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    sizes = cursor.setinputsizes.call_args.args[0]
+    assert sizes[0][1] == 10
+    assert sizes[1] is None
+
+
+def test_create_table_append_widens_narrower_string_columns(connector):
+    """
+    Test that appending longer strings widens existing NVARCHAR columns instead of truncating.
+    """
+    df = pd.DataFrame({"id": [1], "name": ["x" * 40]})
+    connector.connection.cursor.return_value.__enter__.return_value.description = None
+
+    connector.create_table("test_table", df, if_exists="append")
+
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    sql = cursor.execute.call_args.args[0]
+    assert "IS NULL CREATE TABLE test_table" in sql
+    assert "AND name = 'name' AND system_type_id = 231 AND max_length BETWEEN 0 AND 127)" in sql
+    assert "ALTER TABLE test_table ALTER COLUMN [name] NVARCHAR(64);" in sql
+    assert "ALTER COLUMN [id]" not in sql
+
+
+def test_upsert_merges_staging_table_in_one_transaction(connector):
+    """
+    Test that upsert loads a temp staging table and merges it into the target by key.
+    """
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    cursor = connector.connection.cursor.return_value.__enter__.return_value
+    cursor.rowcount = 2
+    cursor.description = None
+
+    merged = connector.upsert("test_table", df, key_columns=["id"], delete_missing=True)
+
+    create_target, *statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert "IS NULL CREATE TABLE test_table" in create_target
+    assert statements[0].startswith("CREATE TABLE #stg_test_table ([id] INT, [name] NVARCHAR(16))")
+    assert cursor.executemany.call_args.args[0] == "INSERT INTO #stg_test_table ([id], [name]) VALUES (?, ?)"
+    merge_sql = statements[1]
+    assert merge_sql.startswith("MERGE test_table WITH (HOLDLOCK) AS target USING #stg_test_table AS source")
+    assert "ON target.[id] = source.[id]" in merge_sql
+    assert "UPDATE SET target.[name] = source.[name]" in merge_sql
+    assert "WHEN NOT MATCHED BY SOURCE THEN DELETE" in merge_sql
+    assert statements[2] == "DROP TABLE #stg_test_table;"
+    assert merged == 2
+    connector.connection.commit.assert_called()
+
+
+def test_upsert_rejects_duplicate_keys(connector):
+    """
+    Test that upsert refuses data whose key columns are not unique.
+    """
+    df = pd.DataFrame({"id": [1, 1], "name": ["a", "b"]})
+
+    with pytest.raises(ValueError):
+        connector.upsert("test_table", df, key_columns=["id"])
+
+
+def test_execute_query_from_file_reuses_prepared_cursor(connector, tmp_path):
+    """
+    Test that repeated executions of a SQL file reuse one cursor and read the file once.
+    """
+    sql_file = tmp_path / "insert.sql"
+    sql_file.write_text("INSERT INTO t (a) VALUES (?);", encoding="utf-8")
+    connector.query_registry = QueryRegistry()
+    connector.connection.cursor.return_value.description = None
+
+    for value in range(3):
+        assert connector.execute_query_from_file(str(sql_file), params=[value]) is None
+
+    connector.connection.cursor.assert_called_once()
+    cursor = connector.connection.cursor.return_value
+    assert cursor.execute.call_count == 3
+    assert connector.query_registry.stats()["hits"] == 2
+    assert connector.connection.commit.call_count == 3
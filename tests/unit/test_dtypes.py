@@ -0,0 +1,104 @@
+"""
+Unit tests for the dtype normalization stage.
+"""
+
+import numpy as np
+import pandas as pd
+from src.utils.dtypes import normalize_dtypes
+
+
+def test_numeric_strings_and_placeholders_become_nullable_numbers():
+    """
+    Test that numeric columns polluted with placeholders are downcast to nullable dtypes.
+    """
+    df = pd.DataFrame({"qty": ["1", "N/A", "300"], "price": [1.5, "N/A", 2.25], "flag": [True, "", False]})
+
+    normalized, _ = normalize_dtypes(df)
+
+    assert str(normalized["qty"].dtype) == "Int16"
+    assert normalized["qty"].isna().tolist() == [False, True, False]
+    assert normalized["price"].dtype == np.float32
+    assert str(normalized["flag"].dtype) == "boolean"
+
+
+def test_strings_dates_and_identifiers():
+    """
+    Test that repeated strings become categoricals, dates are parsed and zero-padded codes stay strings.
+    """
+    df = pd.DataFrame(
+        {
+            "status": ["done", "failed"] * 50,
+            "day": ["18/10/2026", "19/10/2026"] * 50,
+            "zip": ["00123", "04567"] * 50,
+            "name": [f"customer {i}" for i in range(100)],
+        }
+    )
+
+    normalized, _ = normalize_dtypes(df)
+
+    assert isinstance(normalized["status"].dtype, pd.CategoricalDtype)
+    assert normalized["day"].iloc[0] == pd.Timestamp("2026-10-18")
+    assert normalized["zip"].astype(str).tolist()[:2] == ["00123", "04567"]
+    assert normalized["name"].tolist() == df["name"].tolist()
+
+
+def test_memory_report_has_a_row_per_column():
+    """
+    Test that the memory report compares every column, including one named "total".
+    """
+    df = pd.DataFrame({"id": np.arange(1000, dtype=np.int64), "total": ["ok"] * 1000})
+
+    normalized, report = normalize_dtypes(df)
+
+    assert list(report.index) == ["id", "total"]
+    assert report.at["id", "dtype_after"] == "int16"
+    assert report.at["total", "dtype_before"] == "object"
+    assert report.at["total", "dtype_after"] == "category"
+    assert report["bytes_after"].sum() < report["bytes_before"].sum()
+    assert normalized["id"].tolist() == df["id"].tolist()
+
+
+def test_mixed_columns_become_strings_and_only_true_placeholders_are_nulls():
+    """
+    Test that mixed-type columns leave no object dtype and that "NA" or "None" are kept as values.
+    """
+    df = pd.DataFrame({"mixed": [1, "n/a", 3.5, None], "country": ["NA", "None", "BR", "null"]})
+
+    normalized, _ = normalize_dtypes(df, category_max_ratio=0)
+
+    assert not any(pd.api.types.is_object_dtype(dtype) for dtype in normalized.dtypes)
+    assert normalized["mixed"].tolist()[:3] == ["1", "n/a", "3.5"]
+    assert normalized["country"].isna().tolist() == [False, False, False, True]
+
+
+def test_date_formats_are_cached_per_pipeline_and_only_after_a_parse():
+    """
+    Test that a column without dates does not disable date parsing for later frames or other pipelines.
+    """
+    normalize_dtypes(pd.DataFrame({"when": ["pending", "soon"]}), pipeline="a")
+    normalize_dtypes(pd.DataFrame({"when": ["2026/10/18", "2026/10/19"]}), pipeline="b")
+
+    normalized, _ = normalize_dtypes(pd.DataFrame({"when": ["18.10.2026", "19.10.2026"]}), pipeline="a")
+
+    assert normalized["when"].iloc[0] == pd.Timestamp("2026-10-18")
+
+
+def test_long_identifiers_with_blanks_keep_every_digit():
+    """
+    Test that 17-digit IDs next to a blank cell are not rounded through float64.
+    """
+    df = pd.DataFrame(
+        {
+            "id": ["12345678901234567", "12345678901234568", ""],
+            "raw_id": pd.Series([12345678901234567, 12345678901234568, None], dtype=object),
+            "huge": ["123456789012345678901", "1", "N/A"],
+        }
+    )
+
+    normalized, _ = normalize_dtypes(df)
+
+    assert str(normalized["id"].dtype) == "Int64"
+    assert normalized["id"].tolist()[:2] == [12345678901234567, 12345678901234568]
+    assert normalized["id"].isna().tolist() == [False, False, True]
+    assert normalized["raw_id"].tolist()[:2] == [12345678901234567, 12345678901234568]
+    assert normalized["huge"].tolist()[:2] == ["123456789012345678901", "1"]
@@ -0,0 +1,90 @@
+"""
+Unit tests for the Excel parse cache.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+from src.bot.extract import excel_cache
+from src.bot.extract.excel_cache import ExcelCache
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """Write a small workbook and return its path."""
+    path = tmp_path / "bot_data.xlsx"
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_excel(path, index=False)
+    return path
+
+
+def test_read_excel_serves_unchanged_file_from_cache(workbook, tmp_path, monkeypatch):
+    """
+    Test that a second read of an unchanged workbook does not parse it again.
+    """
+    cache = ExcelCache(cache_dir=str(tmp_path / "cache"))
+    first = cache.read_excel(workbook)
+
+    monkeypatch.setattr(excel_cache.pd, "read_excel", lambda *args, **kwargs: pytest.fail("parsed again"))
+    second = cache.read_excel(workbook)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.seconds_saved >= 0
+
+
+def test_read_excel_reuses_touched_file_with_same_content(workbook, tmp_path):
+    """
+    Test that a changed mtime with identical content is still served from the cache.
+    """
+    cache = ExcelCache(cache_dir=str(tmp_path / "cache"))
+    cache.read_excel(workbook)
+    stat = workbook.stat()
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    cache.read_excel(workbook)
+
+    assert cache.hits == 1
+
+
+def test_read_excel_reparses_changed_content(workbook, tmp_path):
+    """
+    Test that a workbook with new content is parsed again.
+    """
+    cache = ExcelCache(cache_dir=str(tmp_path / "cache"))
+    cache.read_excel(workbook)
+    pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}).to_excel(workbook, index=False)
+
+    df = cache.read_excel(workbook)
+
+    assert len(df) == 3
+    assert cache.misses == 2
+
+
+def test_read_workbook_parses_each_sheet_once_and_serves_hits_unopened(tmp_path, monkeypatch):
+    """
+    Test that a multi-sheet workbook is opened once on a miss and not at all on a hit.
+    """
+    path = tmp_path / "sheets.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        for sheet in ("first", "second", "third"):
+            pd.DataFrame({"sheet": [sheet]}).to_excel(writer, sheet_name=sheet, index=False)
+    cache = ExcelCache(cache_dir=str(tmp_path / "cache"))
+    opened = []
+    excel_file = excel_cache.pd.ExcelFile
+
+    def open_workbook(*args, **kwargs):
+        opened.append(args)
+        return excel_file(*args, **kwargs)
+
+    monkeypatch.setattr(excel_cache.pd, "ExcelFile", open_workbook)
+    monkeypatch.setattr(excel_cache.pd, "read_excel", lambda *args, **kwargs: pytest.fail("parsed per sheet"))
+
+    first = cache.read_workbook(path)
+    second = cache.read_workbook(path)
+
+    assert [sheet for sheet, _ in first] == ["first", "second", "third"]
+    assert len(opened) == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+    for (_, expected), (_, cached) in zip(first, second):
+        pd.testing.assert_frame_equal(expected, cached)
@@ -0,0 +1,27 @@
+"""
+Unit tests for the DataFrame artefact helpers.
+"""
+
+import pandas as pd
+import pytest
+from src.utils.frame_io import read_frame, write_frame
+
+
+def test_pickle_artefacts_keep_mixed_type_columns(tmp_path):
+    """
+    Test that pickled artefacts round-trip object columns with mixed types.
+    """
+    df = pd.DataFrame({"mixed": [1, "N/A", 3.5]})
+
+    pd.testing.assert_frame_equal(read_frame(write_frame(df, tmp_path / "part.pkl")), df)
+
+
+def test_failed_write_leaves_no_partial_file(tmp_path):
+    """
+    Test that a write Parquet rejects leaves neither the target nor a temporary file.
+    """
+    pytest.importorskip("pyarrow")
+    with pytest.raises(Exception):
+        write_frame(pd.DataFrame({"mixed": [1, "N/A", 3.5]}), tmp_path / "part.parquet")
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,99 @@
+"""
+Unit tests for the conditional-request HTTP response cache.
+"""
+
+import pandas as pd
+import pytest
+import yaml
+from src.api.extract.api_extract import extract_api
+from src.api.extract.http_cache import ResponseCache
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Write a config file with the response cache stored under tmp_path."""
+    path = tmp_path / "config.yaml"
+    config = {
+        "api": {
+            "endpoint": "https://api.test/entries",
+            "cache": {"enabled": True, "dir": str(tmp_path / "cache"), "ttl_seconds": 60},
+        }
+    }
+    path.write_text(yaml.safe_dump(config))
+    return str(path)
+
+
+def test_extract_api_serves_cached_payload_on_304(monkeypatch, config_path):
+    """
+    Test that a second run sends validators and reuses the cached payload on 304.
+    """
+    first = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    first.json.return_value = {"entries": [{"API": "api_1", "Description": "d"}]}
+    not_modified = MagicMock(status_code=304, headers={})
+    get = MagicMock(side_effect=[first, not_modified])
+    monkeypatch.setattr("src.api.extract.api_extract.requests.get", get)
+
+    df_first = extract_api(config_path)
+    df_cached = extract_api(config_path)
+
+    assert get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+    not_modified.json.assert_not_called()
+    pd.testing.assert_frame_equal(df_first, df_cached)
+
+
+def test_extract_api_refresh_skips_validators(monkeypatch, config_path):
+    """
+    Test that refresh=True downloads the full payload without conditional headers.
+    """
+    response = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    response.json.return_value = {"entries": [{"API": "api_1"}]}
+    get = MagicMock(return_value=response)
+    monkeypatch.setattr("src.api.extract.api_extract.requests.get", get)
+
+    extract_api(config_path)
+    extract_api(config_path, refresh=True)
+
+    assert get.call_args_list[1].kwargs["headers"] == {}
+
+
+def test_extract_api_returns_payload_the_cache_cannot_store(monkeypatch, config_path):
+    """
+    Test that a payload the cache fails to persist is still returned, uncached.
+    """
+    response = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    response.json.return_value = {"entries": [{"value": 1}, {"value": "N/A"}, {"value": 3.5}]}
+    get = MagicMock(return_value=response)
+    monkeypatch.setattr("src.api.extract.api_extract.requests.get", get)
+
+    df = extract_api(config_path)
+    extract_api(config_path)
+
+    assert df["value"].tolist() == [1, "N/A", 3.5]
+    assert get.call_args_list[1].kwargs["headers"] == {}
+
+
+def test_cache_evicts_least_recently_validated_above_size(tmp_path):
+    """
+    Test that size-based eviction drops the oldest entries first.
+    """
+    cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10**9)
+    df = pd.DataFrame({"a": range(100)})
+    cache.store("https://api.test/a", None, {"ETag": "a"}, df)
+    cache.store("https://api.test/b", None, {"ETag": "b"}, df)
+
+    cache.max_bytes = cache.lookup("https://api.test/b").meta["size"]
+    cache.evict()
+
+    assert cache.lookup("https://api.test/a") is None
+    assert cache.lookup("https://api.test/b") is not None
+
+
+def test_cache_expires_entries_after_ttl(tmp_path):
+    """
+    Test that entries older than the TTL are treated as misses.
+    """
+    cache = ResponseCache(cache_dir=str(tmp_path), ttl_seconds=-1)
+    cache.store("https://api.test/a", None, {"ETag": "a"}, pd.DataFrame({"a": [1]}))
+
+    assert cache.lookup("https://api.test/a") is None
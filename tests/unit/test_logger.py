@@ -0,0 +1,63 @@
+"""
+Unit tests for the rate-limited logging helpers.
+"""
+
+from src.utils.logger import ProgressLog, SampledLog, logger, shutdown_logging
+
+
+def _capture(level="DEBUG"):
+    """Return a list receiving the messages logged from now on, and the id of its sink."""
+    messages = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]), level=level)
+    return messages, sink_id
+
+
+def test_sampled_log_aggregates_events_between_lines(monkeypatch):
+    """
+    Test that SampledLog emits the first event, then one line per interval with the events counted in between.
+    """
+    clock = iter([0.0, 1.0, 2.0, 6.0])
+    monkeypatch.setattr("src.utils.logger.time.monotonic", lambda: next(clock))
+    messages, sink_id = _capture()
+    sampled = SampledLog("{count} queries ({total} total), last {rows} rows", interval=5.0)
+
+    for rows in (1, 2, 3, 4):
+        sampled.hit(rows=rows)
+    logger.remove(sink_id)
+
+    assert messages == ["1 queries (1 total), last 1 rows", "3 queries (4 total), last 4 rows"]
+
+
+def test_shutdown_logging_flushes_events_counted_after_the_last_line(monkeypatch):
+    """
+    Test that events hit within the interval after the last line are reported at shutdown.
+    """
+    monkeypatch.setattr("src.utils.logger.time.monotonic", lambda: 0.0)
+    sampled = SampledLog("{count} queries ({total} total), last {rows} rows", interval=5.0)
+    for rows in (1, 2, 3):
+        sampled.hit(rows=rows)
+
+    messages, sink_id = _capture()
+    shutdown_logging()
+    sampled.flush()
+    logger.remove(sink_id)
+
+    assert "2 queries (3 total), last 3 rows" in messages
+    assert messages.count("2 queries (3 total), last 3 rows") == 1
+
+
+def test_progress_log_reports_rows_per_interval(monkeypatch):
+    """
+    Test that ProgressLog reports the processed rows at most once per interval.
+    """
+    clock = iter([0.0, 1.0, 10.0])
+    monkeypatch.setattr("src.utils.logger.time.monotonic", lambda: next(clock))
+    messages, sink_id = _capture()
+    progress = ProgressLog("Loading t", total=3000, interval=5.0)
+
+    progress.advance(1000)
+    progress.advance(2000)
+    logger.remove(sink_id)
+
+    assert messages == ["Loading t: 3,000/3,000 rows (300 rows/sec)."]
+
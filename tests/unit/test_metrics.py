@@ -0,0 +1,64 @@
+"""
+Unit tests for the stage instrumentation and the JSON-lines span and metric exporters.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from src.utils import metrics
+from src.utils.metrics import JSONLinesSpanExporter, instrument_stage, trace_span
+
+
+@pytest.fixture
+def telemetry_file(tmp_path, monkeypatch):
+    """Route the module tracer to a provider exporting spans to a JSON-lines file."""
+    path = tmp_path / "telemetry.jsonl"
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(JSONLinesSpanExporter(str(path))))
+    monkeypatch.setattr(metrics, "_tracer", provider.get_tracer("test"))
+    return path
+
+
+def test_instrument_stage_records_measurements(telemetry_file):
+    """
+    Test that a stage records rows, bytes, timings and peak RSS on its span.
+    """
+    with instrument_stage("api", "transform", rows_in=3) as stage:
+        with trace_span("db.query", **{"db.rows": 2}):
+            pass
+        stage.set_output(pd.DataFrame({"a": [1, 2]}))
+
+    assert (stage.rows_in, stage.rows_out) == (3, 2)
+    assert stage.bytes_out == 16
+    assert stage.wall_seconds > 0 and stage.peak_rss_bytes > 0
+
+    child, parent = [json.loads(line) for line in telemetry_file.read_text().splitlines()]
+    assert parent["name"] == "api.transform"
+    assert parent["attributes"]["etl.rows_out"] == 2
+    assert child["name"] == "db.query"
+    assert child["parent_id"] == parent["span_id"]
+
+
+def test_metric_exporter_writes_histogram_points(tmp_path):
+    """
+    Test that stage histograms are exported as JSON lines without an OTLP endpoint.
+    """
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
+    path = tmp_path / "telemetry.metrics.jsonl"
+    reader = PeriodicExportingMetricReader(metrics.JSONLinesMetricExporter(str(path)))
+    provider = MeterProvider(metric_readers=[reader])
+    histogram = provider.get_meter("test").create_histogram("etl.stage.duration", unit="s")
+    histogram.record(0.5, {"pipeline": "api", "stage": "load"})
+    histogram.record(1.5, {"pipeline": "api", "stage": "load"})
+    provider.shutdown()
+
+    (point,) = [json.loads(line) for line in path.read_text().splitlines()]
+    assert point["name"] == "etl.stage.duration"
+    assert point["attributes"] == {"pipeline": "api", "stage": "load"}
+    assert (point["count"], point["sum"], point["max"]) == (2, 2.0, 1.5)
+    assert sum(point["buckets"].values()) == 2
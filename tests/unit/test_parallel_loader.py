@@ -0,0 +1,57 @@
+"""
+Unit tests for the parallel partitioned loader.
+"""
+
+import pandas as pd
+import pytest
+from src.db.db_connector import SQLDatabaseConnector
+from src.db.parallel_loader import parallel_bulk_insert
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    """Return a connector whose new connections are mocks."""
+    sql_connector = SQLDatabaseConnector(server="localhost", database="test_db", use_windows_auth=True)
+    monkeypatch.setattr(sql_connector, "open_connection", lambda: MagicMock())
+    return sql_connector
+
+
+def test_parallel_bulk_insert_loads_every_partition(connector, monkeypatch):
+    """
+    Test that every row is loaded exactly once across partitions.
+    """
+    loaded = []
+    monkeypatch.setattr(
+        SQLDatabaseConnector,
+        "bulk_insert",
+        lambda self, table, df, batch_size, schema=None: loaded.extend(df["id"].tolist()) or len(df),
+    )
+    df = pd.DataFrame({"id": range(10)})
+
+    result = parallel_bulk_insert(connector, "test_table", df, partitions=3)
+
+    assert result.success
+    assert sorted(loaded) == list(range(10))
+    assert [part.rows for part in result.partitions] == [3, 3, 4]
+    assert result.rows_loaded == 10
+
+
+def test_parallel_bulk_insert_reports_failed_partitions(connector, monkeypatch):
+    """
+    Test that a failing partition is reported without aborting the others.
+    """
+    def bulk_insert(self, table, df, batch_size, schema=None):
+        if 0 in df["id"].values:
+            raise RuntimeError("insert failed")
+        return len(df)
+
+    monkeypatch.setattr(SQLDatabaseConnector, "bulk_insert", bulk_insert)
+    df = pd.DataFrame({"id": range(4)})
+
+    result = parallel_bulk_insert(connector, "test_table", df, partitions=2)
+
+    assert not result.success
+    assert result.failed_partitions == [0]
+    assert result.rows_loaded == 2
+    assert "insert failed" in result.partitions[0].error
@@ -0,0 +1,51 @@
+"""
+Unit tests for the SQL file query registry.
+"""
+
+import os
+
+import pytest
+from src.db.query_registry import QueryRegistry
+
+
+def test_registry_reads_file_once_and_counts_hits(tmp_path):
+    """
+    Test that a SQL file is read once and served from memory afterwards.
+    """
+    sql_file = tmp_path / "select.sql"
+    sql_file.write_text("-- header\nSELECT * FROM t;", encoding="utf-8")
+    registry = QueryRegistry()
+
+    first = registry.get(str(sql_file))
+    second = registry.get(str(sql_file))
+
+    assert first is second
+    assert first.text == "-- header\nSELECT * FROM t;"
+    assert registry.stats() == {"entries": 1, "hits": 1, "misses": 1, "reloads": 0}
+
+
+def test_registry_reloads_changed_file(tmp_path):
+    """
+    Test that an entry is reloaded when the file's mtime changes.
+    """
+    sql_file = tmp_path / "query.sql"
+    sql_file.write_text("SELECT 1;", encoding="utf-8")
+    registry = QueryRegistry()
+    registry.get(str(sql_file))
+
+    sql_file.write_text("DELETE FROM t;", encoding="utf-8")
+    stat = sql_file.stat()
+    os.utime(sql_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    compiled = registry.get(str(sql_file))
+
+    assert compiled.text == "DELETE FROM t;"
+    assert registry.reloads == 1
+
+
+def test_registry_raises_for_missing_file(tmp_path):
+    """
+    Test that a missing SQL file raises FileNotFoundError.
+    """
+    with pytest.raises(FileNotFoundError):
+        QueryRegistry().get(str(tmp_path / "missing.sql"))
+
@@ -0,0 +1,183 @@
+"""
+Unit tests for the retry, circuit breaker and hedging wrapper of the API requests.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+from src.api.extract.api_paginator import fetch_all_records
+from src.api.extract.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgePolicy,
+    ResilientHTTP,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class FakeResponse:
+    """Minimal response with a status code and headers."""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def make_http(attempts=4, breaker=None, hedge=None):
+    """Return a ResilientHTTP without backoff, recording its sleeps instead of sleeping."""
+    sleeps = []
+    http = ResilientHTTP(
+        RetryPolicy(attempts=attempts, backoff_initial=0, backoff_max=0, jitter=0), breaker, hedge, sleeps.append
+    )
+    return http, sleeps
+
+
+def test_retries_errors_and_retryable_statuses():
+    """
+    Test that connection errors and 503 responses are retried until a successful response.
+    """
+    outcomes = iter([requests.ConnectionError("reset"), FakeResponse(503), FakeResponse(200)])
+
+    def send():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    http, _ = make_http()
+
+    assert http.get(send).status_code == 200
+    assert http.stats["retries"] == 2 and http.stats["attempts"] == 3
+
+
+def test_returns_last_response_when_attempts_are_exhausted():
+    """
+    Test that the last retryable response is returned, not a tenacity error, so raise_for_status reports it.
+    """
+    http, _ = make_http(attempts=3)
+
+    assert http.get(lambda: FakeResponse(500)).status_code == 500
+    assert http.stats["attempts"] == 3
+
+
+def test_non_retryable_errors_are_raised_immediately():
+    """
+    Test that client errors are returned and unexpected exceptions raised without retrying.
+    """
+    http, _ = make_http()
+
+    assert http.get(lambda: FakeResponse(404)).status_code == 404
+    with pytest.raises(ValueError):
+        http.get(lambda: (_ for _ in ()).throw(ValueError("bad")))
+    assert http.stats["retries"] == 0
+
+
+def test_retry_after_header_sets_the_wait():
+    """
+    Test that Retry-After (in seconds) replaces the backoff, capped by max_retry_after.
+    """
+    responses = iter([FakeResponse(429, {"Retry-After": "7"}), FakeResponse(429, {"Retry-After": "600"}), FakeResponse(200)])
+    http, sleeps = make_http()
+
+    http.get(lambda: next(responses))
+
+    assert sleeps == [7.0, 120.0]
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    """
+    Test that Retry-After values are parsed as seconds or HTTP dates, and invalid values are ignored.
+    """
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None and parse_retry_after(None) is None
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    """
+    Test that the circuit opens after the failure threshold, refuses requests, and closes after a successful trial.
+    """
+    clock = [0.0]
+    monkeypatch.setattr("src.api.extract.resilience.time.monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    http, _ = make_http(attempts=5, breaker=breaker)
+
+    with pytest.raises(CircuitOpenError):
+        http.get(lambda: FakeResponse(503))
+    assert breaker.state == "open" and http.stats["attempts"] == 2
+
+    clock[0] = 11.0
+    assert breaker.state == "half-open"
+    assert http.get(lambda: FakeResponse(200)).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_cancelled_trial_request_releases_the_half_open_circuit():
+    """
+    Test that a half-open trial cancelled before its outcome lets the next request through.
+    """
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    http, _ = make_http(attempts=1, breaker=breaker)
+    http.get(lambda: FakeResponse(503))
+    assert breaker.state == "half-open"
+
+    async def cancelled_trial():
+        async def hang():
+            await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(http.aget(hang))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled_trial())
+
+    assert http.get(lambda: FakeResponse(200)).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_slow_requests_are_hedged():
+    """
+    Test that an async request slower than the latency quantile is hedged and the faster copy wins.
+    """
+    http, _ = make_http(hedge=HedgePolicy(enabled=True, quantile=0.5, min_samples=3))
+    for _ in range(3):
+        http.latencies.record(0.01)
+    delays = iter([1.0, 0.0])
+
+    async def send():
+        delay = next(delays)
+        await asyncio.sleep(delay)
+        return FakeResponse(200, {"delay": delay})
+
+    response = asyncio.run(http.aget(send))
+
+    assert response.headers["delay"] == 0.0
+    assert http.stats["hedges"] == 1
+
+
+def test_paginator_retries_failed_pages():
+    """
+    Test that the paginated extraction retries a page answered with 503 and returns every record.
+    """
+    failures = {"page": 2, "remaining": 2}
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        if page == failures["page"] and failures["remaining"]:
+            failures["remaining"] -= 1
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        records = [{"id": i} for i in range((page - 1) * 10, min(page * 10, 25))]
+        return httpx.Response(200, json={"entries": records})
+
+    api_config = {"endpoints": [{"url": "https://api.test/items", "pagination": {"page_size": 10}}]}
+    http, _ = make_http()
+
+    records = asyncio.run(fetch_all_records(api_config, transport=httpx.MockTransport(handler), http=http))
+
+    assert [record["id"] for record in records] == list(range(25))
+    assert http.stats["retries"] == 2
@@ -0,0 +1,81 @@
+"""
+Unit tests for the columnar result builder.
+"""
+
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.db.result_builder import build_frame
+
+DESCRIPTION = [
+    ("id", int, None, 10, 10, 0, False),
+    ("score", float, None, 53, 53, 0, True),
+    ("active", bool, None, 1, 1, 0, True),
+    ("created", datetime.datetime, None, 27, 27, 7, True),
+    ("name", str, None, 50, 50, 0, True),
+    ("amount", Decimal, None, 18, 18, 2, True),
+]
+ROWS = [
+    (1, 1.5, True, datetime.datetime(2024, 1, 1), "a", Decimal("1.10")),
+    (2, None, False, None, None, Decimal("2.20")),
+]
+
+
+def test_build_frame_uses_description_types():
+    """
+    Test that columns are built as typed arrays from the cursor description.
+    """
+    df = build_frame(ROWS, DESCRIPTION)
+
+    assert list(df.columns) == ["id", "score", "active", "created", "name", "amount"]
+    assert df["id"].dtype == np.int64
+    assert df["score"].dtype == np.float64 and np.isnan(df["score"].iloc[1])
+    assert df["active"].dtype == bool
+    assert pd.api.types.is_datetime64_any_dtype(df["created"]) and pd.isna(df["created"].iloc[1])
+    assert df["name"].dtype == object
+    assert df["amount"].iloc[0] == Decimal("1.10")
+
+
+def test_build_frame_uses_nullable_dtypes_for_nulls():
+    """
+    Test that integer and boolean columns with NULLs become nullable extension arrays.
+    """
+    description = [("id", int), ("flag", bool)]
+    df = build_frame([(1, None), (None, True)], description)
+
+    assert str(df["id"].dtype) == "Int64"
+    assert str(df["flag"].dtype) == "boolean"
+    assert df["id"].isna().tolist() == [False, True]
+
+
+def test_build_frame_keeps_unexpected_values_as_objects():
+    """
+    Test that values not matching the reported type fall back to an object column.
+    """
+    df = build_frame([("x",), (1,)], [("mixed", int)])
+
+    assert df["mixed"].dtype == object
+    assert df["mixed"].tolist() == ["x", 1]
+
+
+def test_build_frame_pyarrow_backend():
+    """
+    Test that the pyarrow backend builds Arrow-backed columns.
+    """
+    pytest.importorskip("pyarrow")
+
+    df = build_frame(ROWS, DESCRIPTION, dtype_backend="pyarrow")
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df["score"].isna().tolist() == [False, True]
+
+
+def test_build_frame_rejects_unknown_backend():
+    """
+    Test that an unknown dtype backend raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        build_frame(ROWS, DESCRIPTION, dtype_backend="polars")
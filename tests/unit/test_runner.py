@@ -0,0 +1,93 @@
+"""
+Unit tests for the concurrent pipeline runner.
+"""
+
+import time
+
+import pandas as pd
+import pytest
+from src.core.base_etl import BaseETL
+from src.core.runner import PipelineRunner
+
+
+class SleepETL(BaseETL):
+    """ETL that sleeps during extract, records its start order and can fail."""
+
+    def __init__(self, name, seconds=0.0, fail=False, log=None):
+        super().__init__(name)
+        self.seconds = seconds
+        self.fail = fail
+        self.log = log if log is not None else []
+
+    def extract(self):
+        self.log.append(self.name)
+        time.sleep(self.seconds)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return pd.DataFrame({"a": [1]})
+
+    def transform(self, df):
+        return df
+
+    def load(self, df):
+        pass
+
+
+def test_runner_runs_independent_pipelines_concurrently():
+    """
+    Test that independent pipelines overlap and the critical path follows dependencies.
+    """
+    log = []
+    runner = PipelineRunner(max_workers=3)
+    runner.add(SleepETL("a", 0.2, log=log))
+    runner.add(SleepETL("b", 0.2, log=log))
+    runner.add(SleepETL("c", 0.05, log=log), depends_on=["a"])
+
+    summary = runner.run()
+
+    assert summary.success
+    assert summary.seconds < 0.4
+    assert log.index("c") > log.index("a")
+    assert summary.critical_path[-1] == "c"
+    assert summary.critical_path[0] == "a"
+
+
+def test_runner_continue_on_error_skips_only_dependents():
+    """
+    Test that with fail_fast=False dependents of a failure are skipped and others still run.
+    """
+    runner = PipelineRunner(max_workers=2, fail_fast=False)
+    runner.add(SleepETL("bad", fail=True))
+    runner.add(SleepETL("child"), depends_on=["bad"])
+    runner.add(SleepETL("other"))
+
+    summary = runner.run()
+
+    statuses = {name: result.status for name, result in summary.results.items()}
+    assert statuses == {"bad": "failed", "child": "skipped", "other": "success"}
+    assert summary.failed == ["bad"]
+
+
+def test_runner_fail_fast_stops_new_pipelines():
+    """
+    Test that with fail_fast=True no pipeline starts after the first failure.
+    """
+    runner = PipelineRunner(max_workers=1, fail_fast=True)
+    runner.add(SleepETL("bad", fail=True))
+    runner.add(SleepETL("later"))
+
+    summary = runner.run()
+
+    assert summary.results["later"].status == "skipped"
+
+
+def test_runner_rejects_cycles():
+    """
+    Test that a dependency cycle raises ValueError.
+    """
+    runner = PipelineRunner()
+    runner.add(SleepETL("a"), depends_on=["b"])
+    runner.add(SleepETL("b"), depends_on=["a"])
+
+    with pytest.raises(ValueError):
+        runner.run()
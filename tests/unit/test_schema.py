@@ -0,0 +1,83 @@
+"""
+Unit tests for SQL column type inference.
+"""
+
+import pandas as pd
+import pytest
+from src.db.schema import (
+    BIGINT,
+    BIT,
+    DATE,
+    DATETIME2,
+    FLOAT,
+    INT,
+    NVARCHAR_MAX,
+    infer_schema,
+    nvarchar,
+    odbc,
+    parse_sql_type,
+    widen_column_type,
+)
+
+
+def test_infer_schema_maps_dtypes_to_sql_types():
+    """
+    Test that dtypes and observed values map to sized SQL Server types.
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "big_id": [1, 2, 2**40],
+            "score": [0.5, None, 1.5],
+            "active": [True, False, True],
+            "created": pd.to_datetime(["2025-01-01", "2025-01-02", None]),
+            "name": ["a", "bb" * 20, None],
+            "mixed": ["a", 1, None],
+        }
+    )
+
+    schema = infer_schema(df)
+
+    assert {col: schema[col].sql for col in df.columns} == {
+        "id": "INT",
+        "big_id": "BIGINT",
+        "score": "FLOAT",
+        "active": "BIT",
+        "created": "DATETIME2",
+        "name": "NVARCHAR(64)",
+        "mixed": "NVARCHAR(MAX)",
+    }
+    assert schema["name"].input_size == (odbc.SQL_WVARCHAR, 64, 0)
+    assert schema["mixed"].input_size is None
+
+
+def test_infer_schema_applies_overrides():
+    """
+    Test that per-column overrides replace the inferred types.
+    """
+    df = pd.DataFrame({"price": [1.25], "code": ["x"]})
+
+    schema = infer_schema(df, {"price": "DECIMAL(18, 2)", "code": "VARCHAR(10)"})
+
+    assert schema["price"].sql == "DECIMAL(18, 2)"
+    assert schema["price"].input_size == (odbc.SQL_DECIMAL, 18, 2)
+    assert schema["code"].input_size == (odbc.SQL_VARCHAR, 10, 0)
+
+
+@pytest.mark.parametrize("sql", ["GEOGRAPHY", "NVARCHAR(MAX)"])
+def test_parse_sql_type_keeps_unsized_types(sql):
+    """
+    Test that unknown or MAX types keep their SQL text.
+    """
+    assert parse_sql_type(sql).sql == sql
+
+
+def test_widen_column_type_merges_partition_types():
+    """
+    Test that partition types are widened to a type holding both.
+    """
+    assert widen_column_type(INT, BIGINT) == BIGINT
+    assert widen_column_type(BIT, FLOAT) == FLOAT
+    assert widen_column_type(DATE, DATETIME2) == DATETIME2
+    assert widen_column_type(nvarchar(10), nvarchar(100)).sql == "NVARCHAR(128)"
+    assert widen_column_type(INT, nvarchar(10)) == NVARCHAR_MAX
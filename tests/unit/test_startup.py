@@ -0,0 +1,79 @@
+"""
+Unit tests for the startup cost of the CLI entry point and the Airflow DAG module.
+"""
+
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cold import budget of main.py, in seconds; pandas alone takes most of it
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "1.5"))
+
+# Dependencies that only the pipelines (or one of the backends) need
+LAZY_MODULES = ("httpx", "requests", "yaml", "tenacity", "openpyxl", "python_calamine", "duckdb", "pyodbc")
+
+
+def _run_python(*args):
+    """Run a Python subprocess from the repository root and return it once finished."""
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, timeout=120, check=True
+    )
+
+
+def _import_times(stderr):
+    """Parse `-X importtime` output into (name, self seconds, cumulative seconds, depth) tuples."""
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        times.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6, depth))
+    return times
+
+
+def test_main_imports_within_budget():
+    """
+    Test that importing main stays within the startup budget, reporting the slowest imports otherwise.
+    """
+    times = _import_times(_run_python("-X", "importtime", "-c", "import main").stderr)
+
+    total = next(cumulative for name, _, cumulative, _ in times if name == "main")
+    slowest = sorted(times, key=lambda entry: entry[1], reverse=True)[:10]
+    report = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds, _, _ in slowest)
+    assert total <= IMPORT_BUDGET_SECONDS, f"import main took {total:.2f}s; slowest: {report}"
+
+
+def test_main_defers_pipeline_dependencies():
+    """
+    Test that importing main loads none of the source stacks or database drivers.
+    """
+    code = f"import json, sys, main; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+
+    loaded = json.loads(_run_python("-c", code).stdout.strip().splitlines()[-1])
+
+    assert loaded == []
+
+
+def test_dag_module_imports_only_airflow_and_stdlib():
+    """
+    Test that the DAG file does not import pandas, dotenv or the src stacks at parse time.
+    """
+    tree = ast.parse((ROOT / "dags" / "example_dag.py").read_text(encoding="utf-8"))
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules.append(node.module)
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            assert getattr(node.value.func, "id", None) != "load_dotenv"
+
+    top_level = {module.split(".")[0] for module in modules}
+    assert not top_level & {"pandas", "numpy", "dotenv", "src", "pyodbc", "duckdb"}
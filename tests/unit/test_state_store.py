@@ -0,0 +1,85 @@
+"""
+Unit tests for the watermark state stores.
+"""
+
+import pandas as pd
+import pytest
+from src.core.state_store import JSONFileStateStore, SQLiteStateStore, get_state_store
+from unittest.mock import MagicMock
+
+
+@pytest.mark.parametrize("store_cls, file_name", [(JSONFileStateStore, "state.json"), (SQLiteStateStore, "state.db")])
+@pytest.mark.parametrize("value", [pd.Timestamp("2025-01-02 03:04:05"), 42, "v1"])
+def test_store_round_trips_watermarks(tmp_path, store_cls, file_name, value):
+    """
+    Test that watermarks are persisted per pipeline with their type preserved.
+    """
+    store = store_cls(str(tmp_path / file_name))
+    assert store.get_watermark("api") is None
+
+    store.set_watermark("api", value)
+
+    reopened = store_cls(str(tmp_path / file_name))
+    assert reopened.get_watermark("api") == value
+    assert type(reopened.get_watermark("api")) is type(value)
+    assert reopened.get_watermark("bot") is None
+
+
+def test_get_state_store_rejects_unknown_backend():
+    """
+    Test that an unknown backend is reported as a configuration error.
+    """
+    with pytest.raises(ValueError):
+        get_state_store({"backend": "redis"})
+
+
+def test_main_api_pipeline_extracts_since_watermark_and_appends(tmp_path, monkeypatch):
+    """
+    Test that the entry point's API pipeline passes the stored watermark to extract and appends.
+    """
+    import main
+
+    store = JSONFileStateStore(str(tmp_path / "state.json"))
+    store.set_watermark("api", 3)
+    calls = {}
+    df = pd.DataFrame({"id": [4, 5], "API": ["a", "b"], "Description": ["x", "y"]})
+
+    def extract_api(since=None):
+        calls["since"] = since
+        return df
+
+    def save_api(df, session, mode):
+        calls["mode"] = mode
+
+    monkeypatch.setattr("src.api.extract.api_extract.extract_api", extract_api)
+    monkeypatch.setattr("src.api.saver.api_saver.save_api", save_api)
+    connector = MagicMock()
+    column = main.watermark_column({"api": {"incremental": {"column": "id"}}}, "api")
+
+    main.ApiETL(connector, state_store=store, watermark_column=column).run()
+
+    assert calls == {"since": 3, "mode": "append"}
+    assert store.get_watermark("api") == 5
+
+
+def test_main_bot_pipeline_runs_incrementally_twice_on_a_csv_source(tmp_path, monkeypatch):
+    """
+    Test that text dates read from a CSV are compared with the stored Timestamp watermark.
+    """
+    import main
+
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    source = data_dir / "orders.csv"
+    source.write_text("order,updated_at\na,2026-10-01\nb,2026-10-02\n")
+    store = JSONFileStateStore(str(tmp_path / "state.json"))
+    loaded = []
+    monkeypatch.setattr("src.bot.saver.bot_saver.save_bot", lambda df, session, mode: loaded.append(df))
+    connector = MagicMock()
+
+    main.BotETL(connector, file_path=str(data_dir), state_store=store, watermark_column="updated_at").run()
+    source.write_text("order,updated_at\na,2026-10-01\nb,2026-10-02\nc,2026-10-03\n")
+    main.BotETL(connector, file_path=str(data_dir), state_store=store, watermark_column="updated_at").run()
+
+    assert [df["order"].astype(str).tolist() for df in loaded] == [["a", "b"], ["c"]]
+    assert store.get_watermark("bot") == pd.Timestamp("2026-10-03")